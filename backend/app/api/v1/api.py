@@ -1,11 +1,35 @@
 from fastapi import APIRouter
 
-from app.api.v1.routes import actors, directors, genres, health, movies
+from app.api.v1.async_routes import actors as async_actors
+from app.api.v1.async_routes import directors as async_directors
+from app.api.v1.async_routes import genres as async_genres
+from app.api.v1.async_routes import movies as async_movies
+from app.api.v1.routes import actors, directors, export, genres, health, movies, suggest
+from app.core.config import settings
 
-api_router = APIRouter()
 
-api_router.include_router(health.router, tags=["health"])
-api_router.include_router(movies.router, prefix="/movies", tags=["movies"])
-api_router.include_router(actors.router, prefix="/actors", tags=["actors"])
-api_router.include_router(directors.router, prefix="/directors", tags=["directors"])
-api_router.include_router(genres.router, prefix="/genres", tags=["genres"])
+def build_api_router(async_mode: bool = settings.DB_ASYNC) -> APIRouter:
+    """
+    Assemble the v1 router.
+
+    With ``async_mode`` the catalogue routes are served by async handlers on
+    the AsyncEngine instead of sync handlers running in the threadpool.
+    """
+    if async_mode:
+        catalogue = (async_movies, async_actors, async_directors, async_genres)
+    else:
+        catalogue = (movies, actors, directors, genres)
+    movie_routes, actor_routes, director_routes, genre_routes = catalogue
+
+    router = APIRouter()
+    router.include_router(health.router, tags=["health"])
+    router.include_router(movie_routes.router, prefix="/movies", tags=["movies"])
+    router.include_router(actor_routes.router, prefix="/actors", tags=["actors"])
+    router.include_router(director_routes.router, prefix="/directors", tags=["directors"])
+    router.include_router(genre_routes.router, prefix="/genres", tags=["genres"])
+    router.include_router(export.router, prefix="/export", tags=["export"])
+    router.include_router(suggest.router, prefix="/suggest", tags=["suggest"])
+    return router
+
+
+api_router = build_api_router()
@@ -0,0 +1,172 @@
+"""Async API routes for actor-related endpoints (enabled with DB_ASYNC)."""
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.v1.conditional import CatalogueRoute, check_not_modified_async
+from app.api.v1.params import (
+    require_positive,
+    require_summary_for_sort,
+    validate_batch,
+    validate_movies_limit,
+    validate_paging,
+)
+from app.api.v1.serialization import list_response, page_response
+from app.core.config import settings
+from app.db.async_session import get_async_read_db
+from app.schemas.actor import ActorDetail, ActorListItem, ActorSummary, Costar
+from app.schemas.common import BatchRequest, BatchResponse, PaginatedResponse
+from app.schemas.movie import MovieListItem
+from app.services.actor_service import (
+    actor_exists_async,
+    get_actor_by_id_async,
+    get_actor_summaries_async,
+    get_actor_summary_async,
+    get_actors_async,
+    get_actors_by_ids_async,
+    get_costars_async,
+)
+from app.services.filmography import SummarySort
+from app.services.movie_service import MovieSort, get_movies_async
+from app.services.pagination import CountMode, InvalidCursorError, SortOrder
+
+router = APIRouter(route_class=CatalogueRoute, dependencies=[Depends(check_not_modified_async)])
+
+
+@router.get(
+    "",
+    response_model=PaginatedResponse[ActorListItem] | PaginatedResponse[ActorSummary],
+)
+async def get_actors_list(
+    movieId: int | None = Query(None, alias="movieId"),
+    genreId: int | None = Query(None, alias="genreId"),
+    summary: bool = Query(False),
+    sort: SummarySort = Query("id"),
+    order: SortOrder = Query("asc"),
+    db: AsyncSession = Depends(get_async_read_db),
+):
+    """
+    Get a paginated list of actors with optional filtering.
+
+    Same contract as the sync ``GET /actors`` handler.
+
+    Raises:
+        HTTPException 400: If any filter ID is invalid (<= 0), or sorting by
+            an aggregate without summary
+    """
+    require_positive(movieId, "movieId")
+    require_positive(genreId, "genreId")
+    require_summary_for_sort(sort, summary)
+
+    if summary:
+        actors = await get_actor_summaries_async(
+            db, movie_id=movieId, genre_id=genreId, sort=sort, order=order
+        )
+        return list_response(actors, ActorSummary, len(actors))
+    actors = await get_actors_async(db, movie_id=movieId, genre_id=genreId, sort=sort, order=order)
+    return list_response(actors, ActorListItem, len(actors))
+
+
+@router.post("/batch", response_model=BatchResponse[ActorDetail])
+async def get_actors_batch(batch: BatchRequest, db: AsyncSession = Depends(get_async_read_db)):
+    """
+    Get several actors with their filmographies in one request.
+
+    Same contract as the sync ``POST /actors/batch`` handler.
+
+    Raises:
+        HTTPException 400: If ids is empty, too long or holds an invalid ID
+    """
+    items, missing = await get_actors_by_ids_async(db, validate_batch(batch.ids))
+    return {"items": items, "missing": missing}
+
+
+@router.get("/{actor_id}", response_model=ActorDetail | ActorSummary)
+async def get_actor(
+    actor_id: int,
+    summary: bool = Query(False),
+    moviesLimit: int = Query(settings.EMBEDDED_MOVIES_LIMIT, alias="moviesLimit"),
+    db: AsyncSession = Depends(get_async_read_db),
+):
+    """
+    Get detailed information about a specific actor.
+
+    Same contract as the sync ``GET /actors/{actor_id}`` handler.
+
+    Raises:
+        HTTPException 400: If actor_id or moviesLimit is invalid
+        HTTPException 404: If actor is not found
+    """
+    if actor_id <= 0:
+        raise HTTPException(status_code=400, detail="Invalid actor ID")
+    validate_movies_limit(moviesLimit)
+
+    if summary:
+        actor = await get_actor_summary_async(db, actor_id)
+    else:
+        actor = await get_actor_by_id_async(db, actor_id, movies_limit=moviesLimit)
+    if not actor:
+        raise HTTPException(status_code=404, detail="Actor not found")
+    return actor
+
+
+@router.get("/{actor_id}/movies", response_model=PaginatedResponse[MovieListItem])
+async def get_actor_movies(
+    actor_id: int,
+    limit: int = Query(settings.DEFAULT_PAGE_SIZE),
+    offset: int = Query(0),
+    cursor: str | None = Query(None),
+    count: CountMode = Query("exact"),
+    sort: MovieSort = Query("release_year"),
+    order: SortOrder = Query("asc"),
+    db: AsyncSession = Depends(get_async_read_db),
+):
+    """
+    Get one page of an actor's filmography.
+
+    Same contract as the sync ``GET /actors/{actor_id}/movies`` handler.
+
+    Raises:
+        HTTPException 400: If actor_id, the paging parameters or the cursor are invalid
+        HTTPException 404: If actor is not found
+    """
+    if actor_id <= 0:
+        raise HTTPException(status_code=400, detail="Invalid actor ID")
+    validate_paging(limit, offset, cursor)
+
+    try:
+        page = await get_movies_async(
+            db,
+            actor_id=actor_id,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            count=count,
+            sort=sort,
+            order=order,
+        )
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from exc
+    if not page.items and not await actor_exists_async(db, actor_id):
+        raise HTTPException(status_code=404, detail="Actor not found")
+    return page_response(page, MovieListItem)
+
+
+@router.get("/{actor_id}/costars", response_model=PaginatedResponse[Costar])
+async def get_actor_costars(actor_id: int, db: AsyncSession = Depends(get_async_read_db)):
+    """
+    Get the actors who appeared in the most movies with an actor.
+
+    Same contract as the sync ``GET /actors/{actor_id}/costars`` handler.
+
+    Raises:
+        HTTPException 400: If actor_id is invalid (<= 0)
+        HTTPException 404: If actor is not found
+    """
+    if actor_id <= 0:
+        raise HTTPException(status_code=400, detail="Invalid actor ID")
+
+    costars = await get_costars_async(db, actor_id)
+    if costars is None:
+        raise HTTPException(status_code=404, detail="Actor not found")
+    return list_response(costars, Costar, len(costars))
@@ -0,0 +1,159 @@
+"""Async API routes for director-related endpoints (enabled with DB_ASYNC)."""
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.v1.caching import cache_response, cached_response
+from app.api.v1.conditional import CatalogueRoute, check_not_modified_async
+from app.api.v1.params import (
+    require_summary_for_sort,
+    validate_batch,
+    validate_movies_limit,
+    validate_paging,
+)
+from app.api.v1.serialization import page_response
+from app.core.cache import make_cache_key
+from app.core.config import settings
+from app.db.async_session import get_async_read_db
+from app.schemas.common import BatchRequest, BatchResponse, PaginatedResponse
+from app.schemas.director import DirectorDetail, DirectorSummary
+from app.schemas.movie import MovieListItem
+from app.services.director_service import (
+    director_exists_async,
+    get_director_by_id_async,
+    get_director_summaries_async,
+    get_director_summary_async,
+    get_directors_async,
+    get_directors_by_ids_async,
+)
+from app.services.filmography import SummarySort
+from app.services.movie_service import MovieSort, get_movies_async
+from app.services.pagination import CountMode, InvalidCursorError, SortOrder
+
+router = APIRouter(route_class=CatalogueRoute, dependencies=[Depends(check_not_modified_async)])
+
+
+@router.get(
+    "",
+    response_model=PaginatedResponse[DirectorDetail] | PaginatedResponse[DirectorSummary],
+)
+async def get_directors_list(
+    summary: bool = Query(False),
+    sort: SummarySort = Query("id"),
+    moviesLimit: int = Query(settings.EMBEDDED_MOVIES_LIMIT, alias="moviesLimit"),
+    order: SortOrder = Query("asc"),
+    db: AsyncSession = Depends(get_async_read_db),
+    revision: int | None = Depends(check_not_modified_async),
+):
+    """
+    Get a paginated list of all directors.
+
+    Same contract as the sync ``GET /directors`` handler.
+
+    Raises:
+        HTTPException 400: If sorting by an aggregate without summary, or
+            moviesLimit is invalid
+    """
+    require_summary_for_sort(sort, summary)
+    validate_movies_limit(moviesLimit)
+
+    key = make_cache_key(
+        "directors",
+        {"summary": summary, "sort": sort, "order": order, "moviesLimit": moviesLimit},
+    )
+    response = cached_response(key, revision)
+    if response is None:
+        if summary:
+            schema = PaginatedResponse[DirectorSummary]
+            directors = await get_director_summaries_async(db, sort=sort, order=order)
+        else:
+            schema = PaginatedResponse[DirectorDetail]
+            directors = await get_directors_async(
+                db, sort=sort, order=order, movies_limit=moviesLimit
+            )
+        response = cache_response(
+            key, schema, {"items": directors, "total": len(directors)}, revision=revision
+        )
+    return response
+
+
+@router.post("/batch", response_model=BatchResponse[DirectorDetail])
+async def get_directors_batch(batch: BatchRequest, db: AsyncSession = Depends(get_async_read_db)):
+    """
+    Get several directors with their filmographies in one request.
+
+    Same contract as the sync ``POST /directors/batch`` handler.
+
+    Raises:
+        HTTPException 400: If ids is empty, too long or holds an invalid ID
+    """
+    items, missing = await get_directors_by_ids_async(db, validate_batch(batch.ids))
+    return {"items": items, "missing": missing}
+
+
+@router.get("/{director_id}", response_model=DirectorDetail | DirectorSummary)
+async def get_director(
+    director_id: int,
+    summary: bool = Query(False),
+    moviesLimit: int = Query(settings.EMBEDDED_MOVIES_LIMIT, alias="moviesLimit"),
+    db: AsyncSession = Depends(get_async_read_db),
+):
+    """
+    Get detailed information about a specific director.
+
+    Same contract as the sync ``GET /directors/{director_id}`` handler.
+
+    Raises:
+        HTTPException 400: If moviesLimit is invalid
+        HTTPException 404: If director is not found
+    """
+    validate_movies_limit(moviesLimit)
+    if summary:
+        director = await get_director_summary_async(db, director_id)
+    else:
+        director = await get_director_by_id_async(db, director_id, movies_limit=moviesLimit)
+    if not director:
+        raise HTTPException(status_code=404, detail="Director not found")
+    return director
+
+
+@router.get("/{director_id}/movies", response_model=PaginatedResponse[MovieListItem])
+async def get_director_movies(
+    director_id: int,
+    limit: int = Query(settings.DEFAULT_PAGE_SIZE),
+    offset: int = Query(0),
+    cursor: str | None = Query(None),
+    count: CountMode = Query("exact"),
+    sort: MovieSort = Query("release_year"),
+    order: SortOrder = Query("asc"),
+    db: AsyncSession = Depends(get_async_read_db),
+):
+    """
+    Get one page of a director's filmography.
+
+    Same contract as the sync ``GET /directors/{director_id}/movies`` handler.
+
+    Raises:
+        HTTPException 400: If director_id, the paging parameters or the cursor are invalid
+        HTTPException 404: If director is not found
+    """
+    if director_id <= 0:
+        raise HTTPException(status_code=400, detail="Invalid director ID")
+    validate_paging(limit, offset, cursor)
+
+    try:
+        page = await get_movies_async(
+            db,
+            director_id=director_id,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            count=count,
+            sort=sort,
+            order=order,
+        )
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from exc
+    if not page.items and not await director_exists_async(db, director_id):
+        raise HTTPException(status_code=404, detail="Director not found")
+    return page_response(page, MovieListItem)
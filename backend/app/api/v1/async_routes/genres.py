@@ -0,0 +1,39 @@
+"""Async API routes for genre-related endpoints (enabled with DB_ASYNC)."""
+
+from fastapi import APIRouter, Depends
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.v1.caching import cache_response, cached_response
+from app.api.v1.conditional import CatalogueRoute, check_not_modified_async
+from app.core.cache import make_cache_key
+from app.db.async_session import get_async_read_db
+from app.models.genre import Genre
+from app.schemas.common import PaginatedResponse
+from app.schemas.genre import GenreListItem
+
+router = APIRouter(route_class=CatalogueRoute, dependencies=[Depends(check_not_modified_async)])
+
+
+@router.get("", response_model=PaginatedResponse[GenreListItem])
+async def get_genres(
+    db: AsyncSession = Depends(get_async_read_db),
+    revision: int | None = Depends(check_not_modified_async),
+):
+    """
+    Get a paginated list of all genres.
+
+    Returns:
+        PaginatedResponse with list of all genres and total count
+    """
+    key = make_cache_key("genres")
+    response = cached_response(key, revision)
+    if response is None:
+        genres = list((await db.execute(select(Genre))).scalars().all())
+        response = cache_response(
+            key,
+            PaginatedResponse[GenreListItem],
+            {"items": genres, "total": len(genres)},
+            revision=revision,
+        )
+    return response
@@ -0,0 +1,190 @@
+"""Async API routes for movie-related endpoints (enabled with DB_ASYNC)."""
+
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.v1.caching import cache_response, cached_response
+from app.api.v1.conditional import CatalogueRoute, check_not_modified_async
+from app.api.v1.params import require_positive, validate_batch, validate_paging
+from app.api.v1.serialization import list_response, page_response
+from app.core.cache import make_cache_key
+from app.core.config import settings
+from app.db.async_session import get_async_read_db
+from app.schemas.common import BatchRequest, BatchResponse, PaginatedResponse
+from app.schemas.movie import MovieDetail, MovieFacets, MovieListItem
+from app.services.facet_service import get_movie_facets_async
+from app.services.filters import MatchMode
+from app.services.movie_service import (
+    MovieSort,
+    get_movie_by_id_async,
+    get_movies_async,
+    get_movies_by_ids_async,
+    get_related_movies_async,
+)
+from app.services.pagination import InvalidCursorError, SortOrder
+
+router = APIRouter(route_class=CatalogueRoute, dependencies=[Depends(check_not_modified_async)])
+
+
+@router.get("", response_model=PaginatedResponse[MovieListItem])
+async def get_movies_list(
+    genreId: list[int] | None = Query(None, alias="genreId"),
+    directorId: int | None = Query(None, alias="directorId"),
+    actorId: list[int] | None = Query(None, alias="actorId"),
+    releaseYear: int | None = Query(None, alias="releaseYear"),
+    q: str | None = Query(None),
+    limit: int = Query(settings.DEFAULT_PAGE_SIZE),
+    offset: int = Query(0),
+    cursor: str | None = Query(None),
+    count: Literal["exact", "estimate", "none"] = Query("exact"),
+    genreMatch: MatchMode = Query("any", alias="genreMatch"),
+    actorMatch: MatchMode = Query("any", alias="actorMatch"),
+    sort: MovieSort | None = Query(None),
+    order: SortOrder = Query("asc"),
+    db: AsyncSession = Depends(get_async_read_db),
+):
+    """
+    Get a paginated list of movies with optional filtering.
+
+    Same contract as the sync ``GET /movies`` handler.
+
+    Raises:
+        HTTPException 400: If any filter ID, the paging parameters or the cursor are invalid
+    """
+    require_positive(genreId, "genreId")
+    require_positive(directorId, "directorId")
+    require_positive(actorId, "actorId")
+    require_positive(releaseYear, "releaseYear")
+    validate_paging(limit, offset, cursor)
+
+    try:
+        page = await get_movies_async(
+            db=db,
+            genre_id=genreId,
+            director_id=directorId,
+            actor_id=actorId,
+            release_year=releaseYear,
+            q=q,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            count=count,
+            genre_match=genreMatch,
+            actor_match=actorMatch,
+            sort=sort,
+            order=order,
+        )
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from exc
+
+    return page_response(page, MovieListItem)
+
+
+@router.get("/facets", response_model=MovieFacets)
+async def get_movies_facets(
+    genreId: list[int] | None = Query(None, alias="genreId"),
+    directorId: int | None = Query(None, alias="directorId"),
+    actorId: list[int] | None = Query(None, alias="actorId"),
+    releaseYear: int | None = Query(None, alias="releaseYear"),
+    q: str | None = Query(None),
+    genreMatch: MatchMode = Query("any", alias="genreMatch"),
+    actorMatch: MatchMode = Query("any", alias="actorMatch"),
+    db: AsyncSession = Depends(get_async_read_db),
+    revision: int | None = Depends(check_not_modified_async),
+):
+    """
+    Count the movies matching the list filters per genre, director and release year.
+
+    Same contract as the sync ``GET /movies/facets`` handler.
+
+    Raises:
+        HTTPException 400: If any filter ID is invalid
+    """
+    require_positive(genreId, "genreId")
+    require_positive(directorId, "directorId")
+    require_positive(actorId, "actorId")
+    require_positive(releaseYear, "releaseYear")
+
+    filters = {
+        "genre_id": genreId,
+        "director_id": directorId,
+        "actor_id": actorId,
+        "release_year": releaseYear,
+        "q": q,
+        "genre_match": genreMatch,
+        "actor_match": actorMatch,
+    }
+    if not settings.FACETS_CACHE_ENABLED:
+        return await get_movie_facets_async(db, **filters)
+
+    key = make_cache_key("facets", filters)
+    response = cached_response(key, revision)
+    if response is None:
+        response = cache_response(
+            key, MovieFacets, await get_movie_facets_async(db, **filters), revision=revision
+        )
+    return response
+
+
+@router.post("/batch", response_model=BatchResponse[MovieDetail])
+async def get_movies_batch(batch: BatchRequest, db: AsyncSession = Depends(get_async_read_db)):
+    """
+    Get several movies with their director, genres and actors in one request.
+
+    Same contract as the sync ``POST /movies/batch`` handler.
+
+    Raises:
+        HTTPException 400: If ids is empty, too long or holds an invalid ID
+    """
+    items, missing = await get_movies_by_ids_async(db, validate_batch(batch.ids))
+    return {"items": items, "missing": missing}
+
+
+@router.get("/{movie_id}", response_model=MovieDetail)
+async def get_movie(
+    movie_id: int,
+    db: AsyncSession = Depends(get_async_read_db),
+    revision: int | None = Depends(check_not_modified_async),
+):
+    """
+    Get detailed information about a specific movie.
+
+    Served from the response cache until the catalogue changes.
+
+    Raises:
+        HTTPException 400: If movie_id is invalid (<= 0)
+        HTTPException 404: If movie is not found
+    """
+    if movie_id <= 0:
+        raise HTTPException(status_code=400, detail="Invalid movie ID")
+
+    key = make_cache_key("movie", {"id": movie_id})
+    response = cached_response(key, revision)
+    if response is None:
+        movie = await get_movie_by_id_async(db, movie_id)
+        if not movie:
+            raise HTTPException(status_code=404, detail="Movie not found")
+        response = cache_response(key, MovieDetail, movie, revision=revision)
+    return response
+
+
+@router.get("/{movie_id}/related", response_model=PaginatedResponse[MovieListItem])
+async def get_movie_related(movie_id: int, db: AsyncSession = Depends(get_async_read_db)):
+    """
+    Get the movies most similar to a movie.
+
+    Same contract as the sync ``GET /movies/{movie_id}/related`` handler.
+
+    Raises:
+        HTTPException 400: If movie_id is invalid (<= 0)
+        HTTPException 404: If movie is not found
+    """
+    if movie_id <= 0:
+        raise HTTPException(status_code=400, detail="Invalid movie ID")
+
+    movies = await get_related_movies_async(db, movie_id)
+    if movies is None:
+        raise HTTPException(status_code=404, detail="Movie not found")
+    return list_response(movies, MovieListItem, len(movies))
@@ -0,0 +1,74 @@
+"""Serve catalogue responses from the response cache in ``app.core.cache``."""
+
+from typing import Any
+
+from fastapi import Response
+from pydantic import BaseModel
+from starlette.datastructures import Headers
+from starlette.types import Receive, Scope, Send
+
+from app.core.cache import CachedPayload, get_cache
+from app.core.compression import available_encodings, compress, negotiate, set_encoding_headers
+from app.core.config import settings
+from app.core.metrics import precompressed_responses
+
+
+class PayloadResponse(Response):
+    """Response for a cached payload, sent in a stored compressed variant when accepted."""
+
+    def __init__(self, payload: CachedPayload):
+        super().__init__(content=payload.body, media_type=payload.media_type)
+        self.payload = payload
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # Negotiated here rather than in the route, which has no request
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding"))
+        body = self.payload.encodings.get(encoding) if settings.COMPRESSION_ENABLED else None
+        if body is not None:
+            self.body = body
+            set_encoding_headers(self.headers, encoding, len(body))
+            precompressed_responses.inc((encoding,))
+        await super().__call__(scope, receive, send)
+
+
+def cached_response(key: str, revision: int | None = None) -> Response | None:
+    """
+    Look up a cached response body.
+
+    A body stored at another catalogue revision than ``revision`` is a miss:
+    a request that read the catalogue before a write may store its bytes
+    after the write cleared the cache. Without a revision (see
+    :func:`app.api.v1.conditional.check_not_modified`) the cache is bypassed.
+
+    Returns:
+        Response with the cached bytes, or None on a miss
+    """
+    if revision is None:
+        return None
+    payload = get_cache().get(key)
+    if payload is None or payload.revision != revision:
+        return None
+    return PayloadResponse(payload)
+
+
+def cache_response(
+    key: str, schema: type[BaseModel], data: Any, revision: int | None = None
+) -> Response:
+    """
+    Serialize ``data`` through ``schema`` once, cache the bytes and return them.
+
+    Returning a Response skips FastAPI's response_model validation; the schema
+    is applied here instead so the body matches the documented contract.
+    Bodies large enough to be compressed are stored with their compressed
+    variants as well, tagged with the catalogue ``revision`` they were read at;
+    bodies without a revision are returned but not cached.
+    """
+    body = schema.model_validate(data).model_dump_json().encode()
+    payload = CachedPayload(body=body, revision=revision)
+    if settings.COMPRESSION_ENABLED and len(body) >= settings.COMPRESSION_MIN_SIZE:
+        payload.encodings = {
+            encoding: compress(body, encoding) for encoding in available_encodings()
+        }
+    if revision is not None:
+        get_cache().set(key, payload)
+    return PayloadResponse(payload)
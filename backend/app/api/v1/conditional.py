@@ -0,0 +1,135 @@
+"""Conditional GET support (ETag / If-None-Match / 304) for catalogue routes.
+
+The ETag combines the catalogue revision with the normalized request URL, so
+it changes whenever any catalogue row changes. Checking it costs one
+primary-key read and happens in a dependency, before the route runs its
+queries or serializes anything. The revision is read from the primary even
+when the route reads a replica: replicas lagging by different amounts would
+otherwise make it flip back and forth, clearing the response cache and
+sending ETags backwards. A body read from a replica behind the primary gets
+no ETag and is not cached, so it is never labelled with a newer revision.
+"""
+
+import hashlib
+
+from fastapi import Depends, HTTPException, Request, Response
+from fastapi.routing import APIRoute
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.cache import observe_catalogue_revision
+from app.core.compression import identity_etag
+from app.core.config import settings
+from app.db.async_session import get_async_db, get_async_read_db
+from app.db.catalogue_events import get_catalogue_revision, get_catalogue_revision_async
+from app.db.session import get_db, get_read_db
+
+# Methods whose responses carry validators and may be answered with 304
+CONDITIONAL_METHODS = ("GET", "HEAD")
+
+
+def make_etag(revision: int, request: Request) -> str:
+    """Build a strong ETag for a request at a catalogue revision (identity coding)."""
+    query = "&".join(
+        f"{name}={value}" for name, value in sorted(request.query_params.multi_items())
+    )
+    digest = hashlib.blake2b(f"{request.url.path}?{query}".encode(), digest_size=8).hexdigest()
+    return f'"{revision}-{digest}"'
+
+
+def matching_etag(if_none_match: str | None, etag: str) -> str | None:
+    """
+    Weak comparison of an If-None-Match header against an ETag.
+
+    Entries for a compressed variant of the representation (see
+    :func:`app.core.compression.encoded_etag`) match as well.
+
+    Returns:
+        The matching entry without its weak prefix, or None
+    """
+    if not if_none_match:
+        return None
+    for candidate in (candidate.strip() for candidate in if_none_match.split(",")):
+        candidate = candidate.removeprefix("W/")
+        if candidate == "*":
+            return etag
+        if identity_etag(candidate) == etag:
+            return candidate
+    return None
+
+
+def _check(request: Request, revision: int, served_revision: int) -> int | None:
+    observe_catalogue_revision(revision)
+    etag = make_etag(revision, request)
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={settings.HTTP_CACHE_MAX_AGE}, must-revalidate",
+    }
+    matched = matching_etag(request.headers.get("if-none-match"), etag)
+    if matched is not None:
+        # Validate the variant the client holds
+        raise HTTPException(status_code=304, headers={**headers, "ETag": matched})
+    if served_revision < revision:
+        # The body comes from a replica that is behind: it must not carry the
+        # primary's ETag or be cached under the primary's revision
+        return None
+    request.state.validators = headers
+    return revision
+
+
+def check_not_modified(
+    request: Request,
+    db: Session = Depends(get_db),
+    read_db: Session = Depends(get_read_db),
+) -> int | None:
+    """
+    Answer 304 when the client already has the current representation.
+
+    Only GET and HEAD requests are checked; the ETag does not cover request
+    bodies, so other methods (e.g. POST batch lookups) get no validators.
+    When a replica serves the request, its revision is read as well, and a
+    replica behind the primary gets no validators. FastAPI caches the result
+    per request, so routes that cache their body can depend on this again to
+    get the revision without another query.
+
+    Returns:
+        The catalogue revision of the body, or None for methods that are not
+        checked and bodies read from a lagging replica (which must not be cached)
+
+    Raises:
+        HTTPException 304: If If-None-Match matches the current ETag
+    """
+    if request.method not in CONDITIONAL_METHODS:
+        return None
+    revision = get_catalogue_revision(db)
+    served = revision if read_db is db else get_catalogue_revision(read_db)
+    return _check(request, revision, served)
+
+
+async def check_not_modified_async(
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+    read_db: AsyncSession = Depends(get_async_read_db),
+) -> int | None:
+    """Async counterpart of :func:`check_not_modified`."""
+    if request.method not in CONDITIONAL_METHODS:
+        return None
+    revision = await get_catalogue_revision_async(db)
+    served = revision if read_db is db else await get_catalogue_revision_async(read_db)
+    return _check(request, revision, served)
+
+
+class CatalogueRoute(APIRoute):
+    """Route class that adds the validators computed by the dependency to 200 responses."""
+
+    def get_route_handler(self):
+        handler = super().get_route_handler()
+
+        async def route_handler(request: Request) -> Response:
+            response = await handler(request)
+            validators = getattr(request.state, "validators", None)
+            if validators and response.status_code == 200:
+                response.headers.update(validators)
+            return response
+
+        return route_handler
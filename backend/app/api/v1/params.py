@@ -0,0 +1,77 @@
+"""Query parameter validation shared by the sync and async route handlers."""
+
+from fastapi import HTTPException
+
+from app.core.config import settings
+from app.services.filmography import AGGREGATE_SORTS
+
+
+def require_positive(value: int | list[int] | None, name: str) -> None:
+    """
+    Reject a non-positive ID or year filter.
+
+    Multi-value filters (``genreId=1&genreId=3``) are checked value by value
+    and may hold at most ``MAX_FILTER_VALUES`` values.
+
+    Raises:
+        HTTPException 400: If a given value is <= 0 or there are too many values
+    """
+    if value is None:
+        return
+    values = value if isinstance(value, list) else [value]
+    if len(values) > settings.MAX_FILTER_VALUES or any(item <= 0 for item in values):
+        raise HTTPException(status_code=400, detail=f"Invalid {name}")
+
+
+def validate_paging(limit: int, offset: int, cursor: str | None) -> None:
+    """
+    Check page size and offset/cursor parameters.
+
+    Raises:
+        HTTPException 400: If limit is out of range, offset is negative, or
+            both a cursor and an offset are given
+    """
+    if limit <= 0 or limit > settings.MAX_PAGE_SIZE:
+        raise HTTPException(status_code=400, detail="Invalid limit")
+    if offset < 0:
+        raise HTTPException(status_code=400, detail="Invalid offset")
+    if cursor and offset:
+        raise HTTPException(status_code=400, detail="Cannot combine cursor and offset")
+
+
+def validate_movies_limit(movies_limit: int) -> None:
+    """
+    Check the number of movies to embed per person.
+
+    Raises:
+        HTTPException 400: If moviesLimit is not between 1 and ``MAX_PAGE_SIZE``
+    """
+    if movies_limit <= 0 or movies_limit > settings.MAX_PAGE_SIZE:
+        raise HTTPException(status_code=400, detail="Invalid moviesLimit")
+
+
+def require_summary_for_sort(sort: str, summary: bool) -> None:
+    """
+    Reject sorting people by a movie aggregate outside summary mode.
+
+    Raises:
+        HTTPException 400: If ``sort`` is an aggregate and ``summary`` is off
+    """
+    if sort in AGGREGATE_SORTS and not summary:
+        raise HTTPException(status_code=400, detail="Invalid sort without summary=true")
+
+
+def validate_batch(ids: list[int]) -> list[int]:
+    """
+    Check the IDs of a batch lookup.
+
+    Returns:
+        The IDs without duplicates, in the order first given
+
+    Raises:
+        HTTPException 400: If the list is empty, longer than ``MAX_BATCH_SIZE``
+            or holds an ID <= 0
+    """
+    if not ids or len(ids) > settings.MAX_BATCH_SIZE or any(item <= 0 for item in ids):
+        raise HTTPException(status_code=400, detail="Invalid ids")
+    return list(dict.fromkeys(ids))
@@ -3,20 +3,47 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
-from app.db.session import get_db
-from app.models.actor import Actor
-from app.schemas.actor import ActorDetail, ActorListItem
-from app.schemas.common import PaginatedResponse
-from app.services.actor_service import get_actors
-
-router = APIRouter()
-
-
-@router.get("", response_model=PaginatedResponse[ActorListItem])
+from app.api.v1.conditional import CatalogueRoute, check_not_modified
+from app.api.v1.params import (
+    require_positive,
+    require_summary_for_sort,
+    validate_batch,
+    validate_movies_limit,
+    validate_paging,
+)
+from app.api.v1.serialization import list_response, page_response
+from app.core.config import settings
+from app.db.session import get_read_db
+from app.schemas.actor import ActorDetail, ActorListItem, ActorSummary, Costar
+from app.schemas.common import BatchRequest, BatchResponse, PaginatedResponse
+from app.schemas.movie import MovieListItem
+from app.services.actor_service import (
+    actor_exists,
+    get_actor_by_id,
+    get_actor_summaries,
+    get_actor_summary,
+    get_actors,
+    get_actors_by_ids,
+    get_costars,
+)
+from app.services.filmography import SummarySort
+from app.services.movie_service import MovieSort, get_movies
+from app.services.pagination import CountMode, InvalidCursorError, SortOrder
+
+router = APIRouter(route_class=CatalogueRoute, dependencies=[Depends(check_not_modified)])
+
+
+@router.get(
+    "",
+    response_model=PaginatedResponse[ActorListItem] | PaginatedResponse[ActorSummary],
+)
 def get_actors_list(
     movieId: int | None = Query(None, alias="movieId"),
     genreId: int | None = Query(None, alias="genreId"),
-    db: Session = Depends(get_db),
+    summary: bool = Query(False),
+    sort: SummarySort = Query("id"),
+    order: SortOrder = Query("asc"),
+    db: Session = Depends(get_read_db),
 ):
     """
     Get a paginated list of actors with optional filtering.
@@ -27,41 +54,177 @@ def get_actors_list(
     Query Parameters:
         movieId: Filter by movie ID - returns actors in this movie (must be positive integer)
         genreId: Filter by genre ID - returns actors in movies of this genre (must be positive integer)
+        summary: Add each actor's movie count, average rating and first and
+            last release year, computed by one grouped query
+        sort: "id" (default) or "name"; with summary also "movie_count",
+            "average_rating", "first_year" or "last_year". Ties are broken by id
+        order: "asc" (default) or "desc"
 
     Returns:
-        PaginatedResponse with list of actors and total count
+        PaginatedResponse with list of actors (ActorSummary items with
+        summary) and total count
 
     Raises:
-        HTTPException 400: If any filter ID is invalid (<= 0)
+        HTTPException 400: If any filter ID is invalid (<= 0), or sorting by
+            an aggregate without summary
+    """
+    require_positive(movieId, "movieId")
+    require_positive(genreId, "genreId")
+    require_summary_for_sort(sort, summary)
+
+    if summary:
+        actors = get_actor_summaries(db, movie_id=movieId, genre_id=genreId, sort=sort, order=order)
+        return list_response(actors, ActorSummary, len(actors))
+    actors = get_actors(db, movie_id=movieId, genre_id=genreId, sort=sort, order=order)
+    return list_response(actors, ActorListItem, len(actors))
+
+
+@router.post("/batch", response_model=BatchResponse[ActorDetail])
+def get_actors_batch(batch: BatchRequest, db: Session = Depends(get_read_db)):
     """
-    if movieId is not None and movieId <= 0:
-        raise HTTPException(status_code=400, detail="Invalid movieId")
-    if genreId is not None and genreId <= 0:
-        raise HTTPException(status_code=400, detail="Invalid genreId")
+    Get several actors with their filmographies in one request.
 
-    actors = get_actors(db, movie_id=movieId, genre_id=genreId)
-    return {"items": actors, "total": len(actors)}
+    Loads all requested actors in a fixed number of queries, instead of one
+    ``GET /actors/{actor_id}`` round trip per actor.
 
+    Body:
+        ids: Actor IDs (1 to MAX_BATCH_SIZE positive integers); duplicates are ignored
 
-@router.get("/{actor_id}", response_model=ActorDetail)
-def get_actor(actor_id: int, db: Session = Depends(get_db)):
+    Returns:
+        BatchResponse with the actors found, in the requested order, and the
+        requested IDs that do not exist
+
+    Raises:
+        HTTPException 400: If ids is empty, too long or holds an invalid ID
+    """
+    items, missing = get_actors_by_ids(db, validate_batch(batch.ids))
+    return {"items": items, "missing": missing}
+
+
+@router.get("/{actor_id}", response_model=ActorDetail | ActorSummary)
+def get_actor(
+    actor_id: int,
+    summary: bool = Query(False),
+    moviesLimit: int = Query(settings.EMBEDDED_MOVIES_LIMIT, alias="moviesLimit"),
+    db: Session = Depends(get_read_db),
+):
     """
     Get detailed information about a specific actor.
 
+    At most ``moviesLimit`` movies are embedded, by release year; when there
+    are more, ``movies_next_cursor`` continues the filmography on
+    ``GET /actors/{actor_id}/movies?cursor=...``. Pass ``summary=true`` to get
+    aggregates instead of the movies.
+
     Path Parameters:
         actor_id: The ID of the actor to retrieve (must be positive integer)
 
+    Query Parameters:
+        summary: Return the actor's movie count, average rating and first and
+            last release year instead of the movies
+        moviesLimit: Most movies embedded (1 to MAX_PAGE_SIZE, default
+            EMBEDDED_MOVIES_LIMIT)
+
     Returns:
-        ActorDetail with full actor information including filmography
+        ActorDetail with actor information and the start of the filmography,
+        or ActorSummary with summary
 
     Raises:
-        HTTPException 400: If actor_id is invalid (<= 0)
+        HTTPException 400: If actor_id or moviesLimit is invalid
         HTTPException 404: If actor is not found
     """
     if actor_id <= 0:
         raise HTTPException(status_code=400, detail="Invalid actor ID")
+    validate_movies_limit(moviesLimit)
 
-    actor = db.query(Actor).filter(Actor.id == actor_id).first()
+    if summary:
+        actor = get_actor_summary(db, actor_id)
+    else:
+        actor = get_actor_by_id(db, actor_id, movies_limit=moviesLimit)
     if not actor:
         raise HTTPException(status_code=404, detail="Actor not found")
     return actor
+
+
+@router.get("/{actor_id}/movies", response_model=PaginatedResponse[MovieListItem])
+def get_actor_movies(
+    actor_id: int,
+    limit: int = Query(settings.DEFAULT_PAGE_SIZE),
+    offset: int = Query(0),
+    cursor: str | None = Query(None),
+    count: CountMode = Query("exact"),
+    sort: MovieSort = Query("release_year"),
+    order: SortOrder = Query("asc"),
+    db: Session = Depends(get_read_db),
+):
+    """
+    Get one page of an actor's filmography.
+
+    Same items, paging and sorting as ``GET /movies?actorId={actor_id}``.
+
+    Path Parameters:
+        actor_id: The ID of the actor (must be positive integer)
+
+    Query Parameters:
+        limit: Page size (1 to MAX_PAGE_SIZE)
+        offset: Number of movies to skip (cannot be combined with cursor)
+        cursor: Opaque cursor from a previous response's next_cursor
+        count: "exact" total, "estimate" (capped lower bound) or "none" to skip counting
+        sort: "release_year" (default), "id", "title" or "rating"; ties are broken by id
+        order: "asc" (default) or "desc"
+
+    Returns:
+        PaginatedResponse with the actor's movies, total count and next cursor
+
+    Raises:
+        HTTPException 400: If actor_id, the paging parameters or the cursor are invalid
+        HTTPException 404: If actor is not found
+    """
+    if actor_id <= 0:
+        raise HTTPException(status_code=400, detail="Invalid actor ID")
+    validate_paging(limit, offset, cursor)
+
+    try:
+        page = get_movies(
+            db,
+            actor_id=actor_id,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            count=count,
+            sort=sort,
+            order=order,
+        )
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from exc
+    if not page.items and not actor_exists(db, actor_id):
+        raise HTTPException(status_code=404, detail="Actor not found")
+    return page_response(page, MovieListItem)
+
+
+@router.get("/{actor_id}/costars", response_model=PaginatedResponse[Costar])
+def get_actor_costars(actor_id: int, db: Session = Depends(get_read_db)):
+    """
+    Get the actors who appeared in the most movies with an actor.
+
+    The best ``NEIGHBOURS_TOP_K`` co-stars of every actor are precomputed and
+    kept up to date as casts change, so this is one indexed lookup.
+
+    Path Parameters:
+        actor_id: The ID of the actor (must be positive integer)
+
+    Returns:
+        PaginatedResponse with the co-stars and the number of movies shared,
+        most shared first (ties by id)
+
+    Raises:
+        HTTPException 400: If actor_id is invalid (<= 0)
+        HTTPException 404: If actor is not found
+    """
+    if actor_id <= 0:
+        raise HTTPException(status_code=400, detail="Invalid actor ID")
+
+    costars = get_costars(db, actor_id)
+    if costars is None:
+        raise HTTPException(status_code=404, detail="Actor not found")
+    return list_response(costars, Costar, len(costars))
@@ -1,43 +1,211 @@
 """API routes for director-related endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
-from app.db.session import get_db
-from app.models.director import Director
-from app.schemas.common import PaginatedResponse
-from app.schemas.director import DirectorDetail
+from app.api.v1.caching import cache_response, cached_response
+from app.api.v1.conditional import CatalogueRoute, check_not_modified
+from app.api.v1.params import (
+    require_summary_for_sort,
+    validate_batch,
+    validate_movies_limit,
+    validate_paging,
+)
+from app.api.v1.serialization import page_response
+from app.core.cache import make_cache_key
+from app.core.config import settings
+from app.db.session import get_read_db
+from app.schemas.common import BatchRequest, BatchResponse, PaginatedResponse
+from app.schemas.director import DirectorDetail, DirectorSummary
+from app.schemas.movie import MovieListItem
+from app.services.director_service import (
+    director_exists,
+    get_director_by_id,
+    get_director_summaries,
+    get_director_summary,
+    get_directors,
+    get_directors_by_ids,
+)
+from app.services.filmography import SummarySort
+from app.services.movie_service import MovieSort, get_movies
+from app.services.pagination import CountMode, InvalidCursorError, SortOrder
 
-router = APIRouter()
+router = APIRouter(route_class=CatalogueRoute, dependencies=[Depends(check_not_modified)])
 
 
-@router.get("", response_model=PaginatedResponse[DirectorDetail])
-def get_directors(db: Session = Depends(get_db)):
+@router.get(
+    "",
+    response_model=PaginatedResponse[DirectorDetail] | PaginatedResponse[DirectorSummary],
+)
+def get_directors_list(
+    summary: bool = Query(False),
+    sort: SummarySort = Query("id"),
+    moviesLimit: int = Query(settings.EMBEDDED_MOVIES_LIMIT, alias="moviesLimit"),
+    order: SortOrder = Query("asc"),
+    db: Session = Depends(get_read_db),
+    revision: int | None = Depends(check_not_modified),
+):
     """
     Get a paginated list of all directors.
 
+    Served from the response cache until the catalogue changes. Each director
+    embeds at most ``moviesLimit`` movies, by release year; when there are
+    more, ``movies_next_cursor`` continues on ``GET /directors/{id}/movies``.
+
+    Query Parameters:
+        summary: Return each director's movie count, average rating and first
+            and last release year, computed by one grouped query, instead of
+            their movies
+        sort: "id" (default) or "name"; with summary also "movie_count",
+            "average_rating", "first_year" or "last_year". Ties are broken by id
+        order: "asc" (default) or "desc"
+        moviesLimit: Most movies embedded per director (1 to MAX_PAGE_SIZE,
+            default EMBEDDED_MOVIES_LIMIT)
+
+    Returns:
+        PaginatedResponse with list of all directors (DirectorSummary items
+        with summary) and total count
+
+    Raises:
+        HTTPException 400: If sorting by an aggregate without summary, or
+            moviesLimit is invalid
+    """
+    require_summary_for_sort(sort, summary)
+    validate_movies_limit(moviesLimit)
+
+    key = make_cache_key(
+        "directors",
+        {"summary": summary, "sort": sort, "order": order, "moviesLimit": moviesLimit},
+    )
+    response = cached_response(key, revision)
+    if response is None:
+        if summary:
+            schema = PaginatedResponse[DirectorSummary]
+            directors = get_director_summaries(db, sort=sort, order=order)
+        else:
+            schema = PaginatedResponse[DirectorDetail]
+            directors = get_directors(db, sort=sort, order=order, movies_limit=moviesLimit)
+        response = cache_response(
+            key, schema, {"items": directors, "total": len(directors)}, revision=revision
+        )
+    return response
+
+
+@router.post("/batch", response_model=BatchResponse[DirectorDetail])
+def get_directors_batch(batch: BatchRequest, db: Session = Depends(get_read_db)):
+    """
+    Get several directors with their filmographies in one request.
+
+    Loads all requested directors in a fixed number of queries, instead of one
+    ``GET /directors/{director_id}`` round trip per director.
+
+    Body:
+        ids: Director IDs (1 to MAX_BATCH_SIZE positive integers); duplicates are ignored
+
     Returns:
-        PaginatedResponse with list of all directors and total count
+        BatchResponse with the directors found, in the requested order, and the
+        requested IDs that do not exist
+
+    Raises:
+        HTTPException 400: If ids is empty, too long or holds an invalid ID
     """
-    directors = db.query(Director).all()
-    return {"items": directors, "total": len(directors)}
+    items, missing = get_directors_by_ids(db, validate_batch(batch.ids))
+    return {"items": items, "missing": missing}
 
 
-@router.get("/{director_id}", response_model=DirectorDetail)
-def get_director(director_id: int, db: Session = Depends(get_db)):
+@router.get("/{director_id}", response_model=DirectorDetail | DirectorSummary)
+def get_director(
+    director_id: int,
+    summary: bool = Query(False),
+    moviesLimit: int = Query(settings.EMBEDDED_MOVIES_LIMIT, alias="moviesLimit"),
+    db: Session = Depends(get_read_db),
+):
     """
     Get detailed information about a specific director.
 
+    At most ``moviesLimit`` movies are embedded, by release year; when there
+    are more, ``movies_next_cursor`` continues the filmography on
+    ``GET /directors/{director_id}/movies?cursor=...``. Pass ``summary=true``
+    to get aggregates instead of the movies.
+
     Path Parameters:
         director_id: The ID of the director to retrieve
 
+    Query Parameters:
+        summary: Return the director's movie count, average rating and first
+            and last release year instead of the movies
+        moviesLimit: Most movies embedded (1 to MAX_PAGE_SIZE, default
+            EMBEDDED_MOVIES_LIMIT)
+
     Returns:
-        DirectorDetail with full director information including filmography
+        DirectorDetail with director information and the start of the
+        filmography, or DirectorSummary with summary
 
     Raises:
+        HTTPException 400: If moviesLimit is invalid
         HTTPException 404: If director is not found
     """
-    director = db.query(Director).filter(Director.id == director_id).first()
+    validate_movies_limit(moviesLimit)
+    if summary:
+        director = get_director_summary(db, director_id)
+    else:
+        director = get_director_by_id(db, director_id, movies_limit=moviesLimit)
     if not director:
         raise HTTPException(status_code=404, detail="Director not found")
     return director
+
+
+@router.get("/{director_id}/movies", response_model=PaginatedResponse[MovieListItem])
+def get_director_movies(
+    director_id: int,
+    limit: int = Query(settings.DEFAULT_PAGE_SIZE),
+    offset: int = Query(0),
+    cursor: str | None = Query(None),
+    count: CountMode = Query("exact"),
+    sort: MovieSort = Query("release_year"),
+    order: SortOrder = Query("asc"),
+    db: Session = Depends(get_read_db),
+):
+    """
+    Get one page of a director's filmography.
+
+    Same items, paging and sorting as ``GET /movies?directorId={director_id}``.
+
+    Path Parameters:
+        director_id: The ID of the director (must be positive integer)
+
+    Query Parameters:
+        limit: Page size (1 to MAX_PAGE_SIZE)
+        offset: Number of movies to skip (cannot be combined with cursor)
+        cursor: Opaque cursor from a previous response's next_cursor
+        count: "exact" total, "estimate" (capped lower bound) or "none" to skip counting
+        sort: "release_year" (default), "id", "title" or "rating"; ties are broken by id
+        order: "asc" (default) or "desc"
+
+    Returns:
+        PaginatedResponse with the director's movies, total count and next cursor
+
+    Raises:
+        HTTPException 400: If director_id, the paging parameters or the cursor are invalid
+        HTTPException 404: If director is not found
+    """
+    if director_id <= 0:
+        raise HTTPException(status_code=400, detail="Invalid director ID")
+    validate_paging(limit, offset, cursor)
+
+    try:
+        page = get_movies(
+            db,
+            director_id=director_id,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            count=count,
+            sort=sort,
+            order=order,
+        )
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from exc
+    if not page.items and not director_exists(db, director_id):
+        raise HTTPException(status_code=404, detail="Director not found")
+    return page_response(page, MovieListItem)
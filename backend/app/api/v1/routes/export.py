@@ -0,0 +1,113 @@
+"""API routes for streaming bulk exports of the catalogue."""
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from app.api.v1.params import require_positive
+from app.db.session import get_read_db
+from app.services.export_service import (
+    MOVIE_CSV_FIELDS,
+    PERSON_CSV_FIELDS,
+    ExportFormat,
+    encode_csv,
+    encode_ndjson,
+    flatten_movie_record,
+    iter_actor_records,
+    iter_director_records,
+    iter_movie_records,
+)
+from app.services.filters import MatchMode
+
+router = APIRouter()
+
+MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+
+def _stream(body, format: str, name: str) -> StreamingResponse:
+    return StreamingResponse(
+        body,
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{name}.{format}"'},
+    )
+
+
+@router.get("/movies")
+def export_movies(
+    genreId: list[int] | None = Query(None, alias="genreId"),
+    directorId: int | None = Query(None, alias="directorId"),
+    actorId: list[int] | None = Query(None, alias="actorId"),
+    releaseYear: int | None = Query(None, alias="releaseYear"),
+    q: str | None = Query(None),
+    genreMatch: MatchMode = Query("any", alias="genreMatch"),
+    actorMatch: MatchMode = Query("any", alias="actorMatch"),
+    format: ExportFormat = Query("ndjson"),
+    db: Session = Depends(get_read_db),
+):
+    """
+    Stream every movie matching the filters as NDJSON or CSV.
+
+    Accepts the same filters as ``GET /movies``. NDJSON lines have the
+    ``MovieListItem`` shape; CSV rows join genre IDs and names with ``|``.
+
+    Raises:
+        HTTPException 400: If any filter ID is invalid (<= 0)
+    """
+    require_positive(genreId, "genreId")
+    require_positive(directorId, "directorId")
+    require_positive(actorId, "actorId")
+    require_positive(releaseYear, "releaseYear")
+
+    partitions = iter_movie_records(
+        db,
+        genre_id=genreId,
+        director_id=directorId,
+        actor_id=actorId,
+        release_year=releaseYear,
+        q=q,
+        genre_match=genreMatch,
+        actor_match=actorMatch,
+    )
+    if format == "csv":
+        body = encode_csv(partitions, MOVIE_CSV_FIELDS, flatten_movie_record)
+    else:
+        body = encode_ndjson(partitions)
+    return _stream(body, format, "movies")
+
+
+@router.get("/actors")
+def export_actors(
+    movieId: int | None = Query(None, alias="movieId"),
+    genreId: int | None = Query(None, alias="genreId"),
+    format: ExportFormat = Query("ndjson"),
+    db: Session = Depends(get_read_db),
+):
+    """
+    Stream every actor matching the filters as NDJSON or CSV.
+
+    Accepts the same filters as ``GET /actors``.
+
+    Raises:
+        HTTPException 400: If any filter ID is invalid (<= 0)
+    """
+    require_positive(movieId, "movieId")
+    require_positive(genreId, "genreId")
+
+    partitions = iter_actor_records(db, movie_id=movieId, genre_id=genreId)
+    body = (
+        encode_csv(partitions, PERSON_CSV_FIELDS) if format == "csv" else encode_ndjson(partitions)
+    )
+    return _stream(body, format, "actors")
+
+
+@router.get("/directors")
+def export_directors(
+    format: ExportFormat = Query("ndjson"),
+    db: Session = Depends(get_read_db),
+):
+    """Stream every director as NDJSON or CSV."""
+    partitions = iter_director_records(db)
+    body = (
+        encode_csv(partitions, PERSON_CSV_FIELDS) if format == "csv" else encode_ndjson(partitions)
+    )
+    return _stream(body, format, "directors")
@@ -3,21 +3,37 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 
-from app.db.session import get_db
+from app.api.v1.caching import cache_response, cached_response
+from app.api.v1.conditional import CatalogueRoute, check_not_modified
+from app.core.cache import make_cache_key
+from app.db.session import get_read_db
 from app.models.genre import Genre
 from app.schemas.common import PaginatedResponse
 from app.schemas.genre import GenreListItem
 
-router = APIRouter()
+router = APIRouter(route_class=CatalogueRoute, dependencies=[Depends(check_not_modified)])
 
 
 @router.get("", response_model=PaginatedResponse[GenreListItem])
-def get_genres(db: Session = Depends(get_db)):
+def get_genres(
+    db: Session = Depends(get_read_db), revision: int | None = Depends(check_not_modified)
+):
     """
     Get a paginated list of all genres.
 
+    Served from the response cache until the catalogue changes.
+
     Returns:
         PaginatedResponse with list of all genres and total count
     """
-    genres = db.query(Genre).all()
-    return {"items": genres, "total": len(genres)}
+    key = make_cache_key("genres")
+    response = cached_response(key, revision)
+    if response is None:
+        genres = db.query(Genre).all()
+        response = cache_response(
+            key,
+            PaginatedResponse[GenreListItem],
+            {"items": genres, "total": len(genres)},
+            revision=revision,
+        )
+    return response
@@ -1,6 +1,18 @@
 """Health check endpoint for monitoring API status."""
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
+from fastapi.responses import JSONResponse
+from sqlalchemy import inspect
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.core.cache import get_cache
+from app.core.config import settings
+from app.db.base import Base
+from app.db.catalogue_events import get_catalogue_revision
+from app.db.neighbours import neighbours_missing
+from app.db.read_model import movie_cards_missing
+from app.db.session import engine, get_db, pool_status, read_replicas
 
 router = APIRouter()
 
@@ -14,3 +26,107 @@ def health():
         Dictionary with status "ok" to indicate the API is running
     """
     return {"status": "ok"}
+
+
+@router.get("/health/ready")
+def health_ready(db: Session = Depends(get_db)):
+    """
+    Readiness check: the database is reachable, and the schema, the movie list
+    read model and the related movie and co-star tables are in place.
+
+    ``/health`` only reports that the process is up; load balancers should
+    route traffic to a worker once this endpoint returns 200.
+
+    Returns:
+        Dictionary with status "ready" and the catalogue revision, or a 503
+        response with status "not_ready" and the reason
+    """
+    try:
+        missing = sorted(
+            set(Base.metadata.tables) - set(inspect(db.connection()).get_table_names())
+        )
+        if missing:
+            return JSONResponse(
+                status_code=503,
+                content={
+                    "status": "not_ready",
+                    "reason": "schema missing; run python -m app.db.bootstrap",
+                    "missing_tables": missing,
+                },
+            )
+        if movie_cards_missing(db.connection()):
+            return JSONResponse(
+                status_code=503,
+                content={
+                    "status": "not_ready",
+                    "reason": "read model not built; run python -m app.db.bootstrap",
+                },
+            )
+        if neighbours_missing(db.connection()):
+            return JSONResponse(
+                status_code=503,
+                content={
+                    "status": "not_ready",
+                    "reason": "neighbour tables not built; run python -m app.db.bootstrap",
+                },
+            )
+        revision = get_catalogue_revision(db)
+    except SQLAlchemyError as exc:
+        return JSONResponse(
+            status_code=503,
+            content={
+                "status": "not_ready",
+                "reason": f"database unavailable: {exc.__class__.__name__}",
+            },
+        )
+    return {"status": "ready", "revision": revision}
+
+
+@router.get("/health/pool")
+def health_pool():
+    """
+    Connection pool status for this worker process.
+
+    Use it to size DB_POOL_SIZE/DB_MAX_OVERFLOW against the number of uvicorn
+    workers: each worker owns its own pool.
+
+    Returns:
+        Dictionary with the sync pool status and, in async mode, the async pool status
+    """
+    status = {"sync": pool_status(engine)}
+    if settings.DB_ASYNC:
+        from app.db.async_session import get_async_engine
+
+        status["async"] = pool_status(get_async_engine().sync_engine)
+    return status
+
+
+@router.get("/health/replicas")
+def health_replicas():
+    """
+    Read replica health as seen by this worker process.
+
+    A replica is unhealthy for ``DB_REPLICA_RETRY_SECONDS`` after its last
+    failed connection health check; meanwhile reads go to the other replicas
+    or the primary.
+
+    Returns:
+        Dictionary with the sync replicas and, in async mode, the async replicas
+    """
+    status = {"sync": read_replicas.status()}
+    if settings.DB_ASYNC:
+        from app.db.async_session import get_async_replicas
+
+        status["async"] = get_async_replicas().status()
+    return status
+
+
+@router.get("/health/cache")
+def health_cache():
+    """
+    Response cache statistics for this worker process.
+
+    Returns:
+        Dictionary with entry count, bytes used and hit/miss/eviction counters
+    """
+    return get_cache().stats()
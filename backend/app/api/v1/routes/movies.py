@@ -1,70 +1,200 @@
 """API routes for movie-related endpoints."""
 
+from typing import Literal
+
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
-from app.db.session import get_db
-from app.schemas.common import PaginatedResponse
-from app.schemas.movie import MovieDetail, MovieListItem
-from app.services.movie_service import get_movie_by_id, get_movies
-
-router = APIRouter()
+from app.api.v1.caching import cache_response, cached_response
+from app.api.v1.conditional import CatalogueRoute, check_not_modified
+from app.api.v1.params import require_positive, validate_batch, validate_paging
+from app.api.v1.serialization import list_response, page_response
+from app.core.cache import make_cache_key
+from app.core.config import settings
+from app.db.session import get_read_db
+from app.schemas.common import BatchRequest, BatchResponse, PaginatedResponse
+from app.schemas.movie import MovieDetail, MovieFacets, MovieListItem
+from app.services.facet_service import get_movie_facets
+from app.services.filters import MatchMode
+from app.services.movie_service import (
+    MovieSort,
+    get_movie_by_id,
+    get_movies,
+    get_movies_by_ids,
+    get_related_movies,
+)
+from app.services.pagination import InvalidCursorError, SortOrder
+
+router = APIRouter(route_class=CatalogueRoute, dependencies=[Depends(check_not_modified)])
 
 
 @router.get("", response_model=PaginatedResponse[MovieListItem])
 def get_movies_list(
-    genreId: int | None = Query(None, alias="genreId"),
+    genreId: list[int] | None = Query(None, alias="genreId"),
     directorId: int | None = Query(None, alias="directorId"),
-    actorId: int | None = Query(None, alias="actorId"),
+    actorId: list[int] | None = Query(None, alias="actorId"),
     releaseYear: int | None = Query(None, alias="releaseYear"),
     q: str | None = Query(None),
-    db: Session = Depends(get_db),
+    limit: int = Query(settings.DEFAULT_PAGE_SIZE),
+    offset: int = Query(0),
+    cursor: str | None = Query(None),
+    count: Literal["exact", "estimate", "none"] = Query("exact"),
+    genreMatch: MatchMode = Query("any", alias="genreMatch"),
+    actorMatch: MatchMode = Query("any", alias="actorMatch"),
+    sort: MovieSort | None = Query(None),
+    order: SortOrder = Query("asc"),
+    db: Session = Depends(get_read_db),
 ):
     """
     Get a paginated list of movies with optional filtering.
 
     Supports filtering by genre, director, actor, release year, and text search.
     All filters can be combined. Returns empty list if no movies match.
+    Pages are bounded by ``limit``; follow ``next_cursor`` for keyset paging,
+    which stays fast on deep pages unlike large offsets. Sorted pages are read
+    in index order, so a top-N query such as
+    ``?genreId=1&sort=rating&order=desc&limit=20&count=none`` reads about
+    ``limit`` rows rather than the whole genre.
 
     Query Parameters:
-        genreId: Filter by genre ID (must be positive integer)
+        genreId: Filter by genre ID (must be positive integer); repeat for several
         directorId: Filter by director ID (must be positive integer)
-        actorId: Filter by actor ID (must be positive integer)
+        actorId: Filter by actor ID (must be positive integer); repeat for several
         releaseYear: Filter by exact release year (must be positive integer)
         q: Search query for movie title (case-insensitive partial match)
+        limit: Page size (1 to MAX_PAGE_SIZE)
+        offset: Number of movies to skip (cannot be combined with cursor)
+        cursor: Opaque cursor from a previous response's next_cursor
+        count: "exact" total, "estimate" (capped lower bound) or "none" to skip counting
+        genreMatch: With several genreId values, "any" (default) or "all" must match
+        actorMatch: With several actorId values, "any" (default) or "all" must match
+        sort: "id", "title", "release_year" or "rating"; ties are broken by id.
+            Defaults to relevance when searching and id otherwise
+        order: "asc" (default) or "desc"
 
     Returns:
-        PaginatedResponse with list of movies and total count
+        PaginatedResponse with list of movies, total count and next cursor
 
     Raises:
-        HTTPException 400: If any filter ID is invalid (<= 0)
+        HTTPException 400: If any filter ID, the paging parameters or the cursor are invalid
     """
     # Validate IDs
-    if genreId is not None and genreId <= 0:
-        raise HTTPException(status_code=400, detail="Invalid genreId")
-    if directorId is not None and directorId <= 0:
-        raise HTTPException(status_code=400, detail="Invalid directorId")
-    if actorId is not None and actorId <= 0:
-        raise HTTPException(status_code=400, detail="Invalid actorId")
-    if releaseYear is not None and releaseYear <= 0:
-        raise HTTPException(status_code=400, detail="Invalid releaseYear")
-
-    items, total = get_movies(
-        db=db,
-        genre_id=genreId,
-        director_id=directorId,
-        actor_id=actorId,
-        release_year=releaseYear,
-        q=q,
-    )
-    return {"items": items, "total": total}
+    require_positive(genreId, "genreId")
+    require_positive(directorId, "directorId")
+    require_positive(actorId, "actorId")
+    require_positive(releaseYear, "releaseYear")
+    validate_paging(limit, offset, cursor)
+
+    try:
+        page = get_movies(
+            db=db,
+            genre_id=genreId,
+            director_id=directorId,
+            actor_id=actorId,
+            release_year=releaseYear,
+            q=q,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            count=count,
+            genre_match=genreMatch,
+            actor_match=actorMatch,
+            sort=sort,
+            order=order,
+        )
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from exc
+
+    return page_response(page, MovieListItem)
+
+
+@router.get("/facets", response_model=MovieFacets)
+def get_movies_facets(
+    genreId: list[int] | None = Query(None, alias="genreId"),
+    directorId: int | None = Query(None, alias="directorId"),
+    actorId: list[int] | None = Query(None, alias="actorId"),
+    releaseYear: int | None = Query(None, alias="releaseYear"),
+    q: str | None = Query(None),
+    genreMatch: MatchMode = Query("any", alias="genreMatch"),
+    actorMatch: MatchMode = Query("any", alias="actorMatch"),
+    db: Session = Depends(get_read_db),
+    revision: int | None = Depends(check_not_modified),
+):
+    """
+    Count the movies matching the list filters per genre, director and release year.
+
+    Takes the filters of ``GET /movies`` and answers with one aggregate
+    statement. With ``FACETS_CACHE_ENABLED`` results are kept in the response
+    cache per filter set until the catalogue changes.
+
+    Returns:
+        MovieFacets with the total, genres and directors by descending count
+        (directors limited to MAX_FACET_VALUES, with directors_truncated and
+        the number of movies by the others in directors_other_count) and
+        release years ascending
+
+    Raises:
+        HTTPException 400: If any filter ID is invalid
+    """
+    require_positive(genreId, "genreId")
+    require_positive(directorId, "directorId")
+    require_positive(actorId, "actorId")
+    require_positive(releaseYear, "releaseYear")
+
+    filters = {
+        "genre_id": genreId,
+        "director_id": directorId,
+        "actor_id": actorId,
+        "release_year": releaseYear,
+        "q": q,
+        "genre_match": genreMatch,
+        "actor_match": actorMatch,
+    }
+    if not settings.FACETS_CACHE_ENABLED:
+        return get_movie_facets(db, **filters)
+
+    key = make_cache_key("facets", filters)
+    response = cached_response(key, revision)
+    if response is None:
+        response = cache_response(
+            key, MovieFacets, get_movie_facets(db, **filters), revision=revision
+        )
+    return response
+
+
+@router.post("/batch", response_model=BatchResponse[MovieDetail])
+def get_movies_batch(batch: BatchRequest, db: Session = Depends(get_read_db)):
+    """
+    Get several movies with their director, genres and actors in one request.
+
+    Loads all requested movies in a fixed number of queries, instead of one
+    ``GET /movies/{movie_id}`` round trip per movie.
+
+    Body:
+        ids: Movie IDs (1 to MAX_BATCH_SIZE positive integers); duplicates are ignored
+
+    Returns:
+        BatchResponse with the movies found, in the requested order, and the
+        requested IDs that do not exist
+
+    Raises:
+        HTTPException 400: If ids is empty, too long or holds an invalid ID
+    """
+    items, missing = get_movies_by_ids(db, validate_batch(batch.ids))
+    return {"items": items, "missing": missing}
 
 
 @router.get("/{movie_id}", response_model=MovieDetail)
-def get_movie(movie_id: int, db: Session = Depends(get_db)):
+def get_movie(
+    movie_id: int,
+    db: Session = Depends(get_read_db),
+    revision: int | None = Depends(check_not_modified),
+):
     """
     Get detailed information about a specific movie.
 
+    Served from the response cache until the catalogue changes.
+
     Path Parameters:
         movie_id: The ID of the movie to retrieve (must be positive integer)
 
@@ -78,7 +208,39 @@ def get_movie(movie_id: int, db: Session = Depends(get_db)):
     if movie_id <= 0:
         raise HTTPException(status_code=400, detail="Invalid movie ID")
 
-    movie = get_movie_by_id(db, movie_id)
-    if not movie:
+    key = make_cache_key("movie", {"id": movie_id})
+    response = cached_response(key, revision)
+    if response is None:
+        movie = get_movie_by_id(db, movie_id)
+        if not movie:
+            raise HTTPException(status_code=404, detail="Movie not found")
+        response = cache_response(key, MovieDetail, movie, revision=revision)
+    return response
+
+
+@router.get("/{movie_id}/related", response_model=PaginatedResponse[MovieListItem])
+def get_movie_related(movie_id: int, db: Session = Depends(get_read_db)):
+    """
+    Get the movies most similar to a movie.
+
+    Similarity weighs shared actors, shared genres and a shared director. The
+    best ``NEIGHBOURS_TOP_K`` neighbours of every movie are precomputed and
+    kept up to date as the catalogue changes, so this is one indexed lookup.
+
+    Path Parameters:
+        movie_id: The ID of the movie (must be positive integer)
+
+    Returns:
+        PaginatedResponse with the related movies, most similar first
+
+    Raises:
+        HTTPException 400: If movie_id is invalid (<= 0)
+        HTTPException 404: If movie is not found
+    """
+    if movie_id <= 0:
+        raise HTTPException(status_code=400, detail="Invalid movie ID")
+
+    movies = get_related_movies(db, movie_id)
+    if movies is None:
         raise HTTPException(status_code=404, detail="Movie not found")
-    return movie
+    return list_response(movies, MovieListItem, len(movies))
@@ -0,0 +1,49 @@
+"""API route for search-box suggestions."""
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy.orm import Session
+
+from app.api.v1.conditional import CatalogueRoute, check_not_modified
+from app.core.config import settings
+from app.db.session import get_read_db
+from app.schemas.suggest import Suggestions
+from app.services.suggest_service import get_suggestions
+
+router = APIRouter(route_class=CatalogueRoute, dependencies=[Depends(check_not_modified)])
+
+
+@router.get("", response_model=Suggestions)
+def suggest(
+    request: Request,
+    q: str = Query(..., max_length=100),
+    limit: int = Query(settings.SUGGEST_LIMIT),
+    db: Session = Depends(get_read_db),
+    revision: int | None = Depends(check_not_modified),
+):
+    """
+    Suggest movies, actors and directors as the user types.
+
+    Matches ``q`` against the start of any word of a movie title or person
+    name, ignoring case and diacritics, and returns the best rated matches of
+    each kind. Served from an in-memory prefix index, which answers without
+    validators while it is rebuilt after a catalogue change; lighter than
+    ``GET /movies?q=`` for a search box that only needs a few names.
+
+    Args:
+        q: Text typed so far
+        limit: Suggestions per kind (1 to SUGGEST_MAX_LIMIT)
+
+    Returns:
+        Suggestions with movies, actors and directors, best rated first
+
+    Raises:
+        HTTPException 400: If limit is out of range
+    """
+    if limit <= 0 or limit > settings.SUGGEST_MAX_LIMIT:
+        raise HTTPException(status_code=400, detail="Invalid limit")
+    served_revision, suggestions = get_suggestions(db, q, limit)
+    if revision is not None and served_revision < revision:
+        # Answered by the previous index while the new one is built: the body
+        # must not carry the current revision's ETag
+        request.state.validators = None
+    return suggestions
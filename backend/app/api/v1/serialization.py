@@ -0,0 +1,83 @@
+"""Fast list serialization.
+
+List endpoints encode their pages straight to JSON bytes instead of validating
+every item through the response schema: pre-serialized read model payloads
+are spliced in as-is and row tuples are encoded as plain dicts. The schemas
+in ``app.schemas`` stay on the routes as the documented response contract,
+and with ``FAST_SERIALIZATION`` off the pages go through them as before.
+"""
+
+import json
+from typing import Any
+
+from fastapi import Response
+from pydantic import BaseModel
+from sqlalchemy import Row
+
+from app.core.config import settings
+from app.core.json import RawJSON, dumps
+from app.services.pagination import Page
+
+
+def encode_item(item: Any, schema: type[BaseModel]) -> bytes:
+    """Encode one list item; only ORM objects are run through ``schema``."""
+    if isinstance(item, RawJSON):
+        return item.encode()
+    if isinstance(item, Row):
+        return dumps(item._asdict())
+    if isinstance(item, dict):
+        return dumps(item)
+    return dumps(schema.model_validate(item).model_dump(mode="json"))
+
+
+def encode_page(
+    items: list,
+    schema: type[BaseModel],
+    total: int | None,
+    total_is_estimate: bool = False,
+    next_cursor: str | None = None,
+) -> bytes:
+    """Encode a ``PaginatedResponse`` body."""
+    return b"".join(
+        (
+            b'{"items":[',
+            b",".join(encode_item(item, schema) for item in items),
+            b'],"total":',
+            dumps(total),
+            b',"total_is_estimate":',
+            dumps(total_is_estimate),
+            b',"next_cursor":',
+            dumps(next_cursor),
+            b"}",
+        )
+    )
+
+
+def list_response(
+    items: list,
+    schema: type[BaseModel],
+    total: int | None,
+    total_is_estimate: bool = False,
+    next_cursor: str | None = None,
+) -> Response | dict:
+    """
+    Build a list endpoint's response.
+
+    Returns:
+        A Response with the encoded page, or with ``FAST_SERIALIZATION`` off a
+        dict for FastAPI to validate against the route's response_model
+    """
+    if settings.FAST_SERIALIZATION:
+        body = encode_page(items, schema, total, total_is_estimate, next_cursor)
+        return Response(content=body, media_type="application/json")
+    return {
+        "items": [json.loads(item) if isinstance(item, RawJSON) else item for item in items],
+        "total": total,
+        "total_is_estimate": total_is_estimate,
+        "next_cursor": next_cursor,
+    }
+
+
+def page_response(page: Page, schema: type[BaseModel]) -> Response | dict:
+    """:func:`list_response` for a service :class:`Page`."""
+    return list_response(page.items, schema, page.total, page.total_is_estimate, page.next_cursor)
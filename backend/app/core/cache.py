@@ -0,0 +1,220 @@
+"""Response cache with pluggable backends.
+
+The default backend is an in-process LRU with per-entry TTL, bounded both by
+entry count and by total payload bytes. A shared backend (e.g. Redis) can be
+swapped in with :func:`set_cache_backend` as long as it implements
+:class:`CacheBackend`.
+"""
+
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import urlencode
+
+from app.core.config import settings
+
+
+@dataclass
+class CachedPayload:
+    """
+    A serialized response body ready to be sent as-is.
+
+    ``encodings`` holds compressed variants of ``body`` keyed by content
+    coding ("gzip", "br"), so cache hits are not compressed again.
+    ``revision`` is the catalogue revision the body was read at, if known.
+    """
+
+    body: bytes
+    media_type: str = "application/json"
+    encodings: dict[str, bytes] = field(default_factory=dict)
+    revision: int | None = None
+
+    @property
+    def size(self) -> int:
+        return len(self.body) + sum(map(len, self.encodings.values()))
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+
+
+class CacheBackend(ABC):
+    """Interface every cache backend implements."""
+
+    @abstractmethod
+    def get(self, key: str) -> CachedPayload | None:
+        """Return the payload for ``key`` or None on a miss."""
+
+    @abstractmethod
+    def set(self, key: str, value: CachedPayload, ttl: float | None = None) -> None:
+        """Store ``value`` under ``key`` for ``ttl`` seconds (backend default if None)."""
+
+    @abstractmethod
+    def invalidate(self, namespace: str | None = None) -> None:
+        """Drop every entry, or only entries whose key starts with ``namespace:``."""
+
+    @abstractmethod
+    def stats(self) -> dict:
+        """Return hit/miss/eviction counters and size information."""
+
+    def clear(self) -> None:
+        self.invalidate()
+
+
+class InMemoryLRUCache(CacheBackend):
+    """Thread-safe LRU cache with TTL, bounded by entry count and total bytes."""
+
+    def __init__(self, max_entries: int, max_bytes: int, default_ttl: float):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self._entries: OrderedDict[str, tuple[float, CachedPayload]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+
+    def get(self, key: str) -> CachedPayload | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                self._stats.expirations += 1
+                self._stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            return value
+
+    def set(self, key: str, value: CachedPayload, ttl: float | None = None) -> None:
+        if value.size > self.max_bytes:
+            return
+        expires_at = time.monotonic() + (self.default_ttl if ttl is None else ttl)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (expires_at, value)
+            self._bytes += value.size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self._stats.evictions += 1
+
+    def invalidate(self, namespace: str | None = None) -> None:
+        with self._lock:
+            if namespace is None:
+                keys = list(self._entries)
+            else:
+                prefix = f"{namespace}:"
+                keys = [key for key in self._entries if key.startswith(prefix)]
+            for key in keys:
+                self._remove(key)
+            self._stats.invalidations += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "backend": type(self).__name__,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self._stats.hits,
+                "misses": self._stats.misses,
+                "evictions": self._stats.evictions,
+                "expirations": self._stats.expirations,
+                "invalidations": self._stats.invalidations,
+            }
+
+    def _remove(self, key: str) -> None:
+        _, value = self._entries.pop(key)
+        self._bytes -= value.size
+
+
+class NullCache(CacheBackend):
+    """Backend used when caching is disabled; every lookup misses."""
+
+    def get(self, key: str) -> CachedPayload | None:
+        return None
+
+    def set(self, key: str, value: CachedPayload, ttl: float | None = None) -> None:
+        return None
+
+    def invalidate(self, namespace: str | None = None) -> None:
+        return None
+
+    def stats(self) -> dict:
+        return {"backend": type(self).__name__}
+
+
+def make_cache_key(namespace: str, params: Mapping[str, Any] | None = None) -> str:
+    """
+    Build a cache key from an endpoint namespace and its query parameters.
+
+    Parameters are normalized so equivalent requests share an entry: None
+    values and empty lists are dropped, list values are treated as sets
+    (deduplicated and sorted), and the remaining pairs are sorted by name.
+    """
+    normalized = []
+    for name, value in (params or {}).items():
+        if isinstance(value, list | tuple | set):
+            value = ",".join(map(str, sorted(set(value)))) or None
+        if value is not None:
+            normalized.append((name, value))
+    return f"{namespace}:{urlencode(sorted(normalized))}"
+
+
+def _default_backend() -> CacheBackend:
+    if not settings.CACHE_ENABLED:
+        return NullCache()
+    return InMemoryLRUCache(
+        max_entries=settings.CACHE_MAX_ENTRIES,
+        max_bytes=settings.CACHE_MAX_BYTES,
+        default_ttl=settings.CACHE_TTL_SECONDS,
+    )
+
+
+_backend: CacheBackend = _default_backend()
+
+
+def get_cache() -> CacheBackend:
+    return _backend
+
+
+def set_cache_backend(backend: CacheBackend) -> None:
+    """Replace the process-wide cache backend (e.g. with a shared cache)."""
+    global _backend
+    _backend = backend
+
+
+_seen_revision: int | None = None
+
+
+def invalidate_catalogue_cache() -> None:
+    """Hook for catalogue writes and reseeds: drop every cached response."""
+    _backend.invalidate()
+
+
+def observe_catalogue_revision(revision: int) -> None:
+    """
+    Drop cached responses when the catalogue revision moved.
+
+    Writes committed by other processes do not fire this process's session
+    hooks; seeing a new revision is how those writes reach the local cache.
+    """
+    global _seen_revision
+    if _seen_revision is not None and revision != _seen_revision:
+        _backend.invalidate()
+    _seen_revision = revision
@@ -0,0 +1,197 @@
+"""Negotiated response compression (gzip, and brotli when installed).
+
+:class:`CompressionMiddleware` compresses response bodies of at least
+``COMPRESSION_MIN_SIZE`` bytes in the best encoding the client accepts.
+Responses that already carry a ``Content-Encoding`` (such as cached payloads
+sent with their stored compressed variant) pass through untouched. Streamed
+bodies are compressed chunk by chunk and flushed after every chunk, so
+clients still receive rows as they are produced.
+
+Compressed variants get their own ETag, with the content coding appended
+inside the quotes (``"12-ab34-gzip"``), so a strong ETag never names two
+different byte sequences; ``Vary: Accept-Encoding`` keeps shared caches from
+mixing encodings.
+"""
+
+import time
+import zlib
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.metrics import (
+    compression_cpu_seconds,
+    compression_input_bytes,
+    compression_output_bytes,
+)
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+# Content types worth compressing; matched against the start of Content-Type
+COMPRESSIBLE_TYPES = ("application/json", "application/x-ndjson", "text/")
+
+# Content codings that can be appended to an ETag by encoded_etag
+ETAG_CODINGS = ("br", "gzip")
+
+
+def available_encodings() -> tuple[str, ...]:
+    """Encodings this process can produce, most preferred first."""
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def negotiate(accept_encoding: str | None) -> str | None:
+    """
+    Pick the encoding to answer an ``Accept-Encoding`` header with.
+
+    Returns:
+        "br" or "gzip", preferring the higher q-value and then brotli, or None
+        when the client accepts neither
+    """
+    if not accept_encoding:
+        return None
+    weights: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        weights[name.strip().lower()] = quality
+    best, best_quality = None, 0.0
+    for encoding in available_encodings():
+        quality = weights.get(encoding, weights.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def is_compressible(content_type: str | None) -> bool:
+    return bool(content_type) and content_type.startswith(COMPRESSIBLE_TYPES)
+
+
+class _Compressor:
+    """Incremental compressor for one response body."""
+
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        if encoding == "br":
+            self._brotli = brotli.Compressor(quality=settings.COMPRESSION_BROTLI_QUALITY)
+        else:
+            # wbits=31: gzip container
+            self._zlib = zlib.compressobj(settings.COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        started = time.thread_time()
+        if self.encoding == "br":
+            output = self._brotli.process(data)
+            output += self._brotli.finish() if final else self._brotli.flush()
+        else:
+            output = self._zlib.compress(data)
+            output += self._zlib.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+        compression_cpu_seconds.inc((self.encoding,), time.thread_time() - started)
+        compression_input_bytes.inc((self.encoding,), len(data))
+        compression_output_bytes.inc((self.encoding,), len(output))
+        return output
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """Compress a complete body with ``encoding`` ("br" or "gzip")."""
+    return _Compressor(encoding).compress(body, final=True)
+
+
+def encoded_etag(etag: str, encoding: str) -> str:
+    """ETag of the ``encoding`` variant of the representation tagged ``etag``."""
+    return f'{etag[:-1]}-{encoding}"' if etag.endswith('"') else etag
+
+
+def identity_etag(etag: str) -> str:
+    """Inverse of :func:`encoded_etag`; other ETags are returned unchanged."""
+    for encoding in ETAG_CODINGS:
+        suffix = f'-{encoding}"'
+        if etag.endswith(suffix):
+            return f'{etag.removesuffix(suffix)}"'
+    return etag
+
+
+def set_encoding_headers(headers: MutableHeaders, encoding: str, length: int | None) -> None:
+    """Describe a body compressed with ``encoding`` (``length`` None when streamed)."""
+    headers["Content-Encoding"] = encoding
+    if "etag" in headers:
+        headers["ETag"] = encoded_etag(headers["ETag"], encoding)
+    headers.add_vary_header("Accept-Encoding")
+    if length is None:
+        del headers["Content-Length"]
+    else:
+        headers["Content-Length"] = str(length)
+
+
+class CompressionMiddleware:
+    """Compress HTTP responses in the encoding negotiated from ``Accept-Encoding``."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Message | None = None
+        compressor: _Compressor | None = None
+        passthrough = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start, compressor, passthrough
+            if passthrough:
+                await send(message)
+                return
+
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                if "content-encoding" in headers or not is_compressible(
+                    headers.get("content-type")
+                ):
+                    passthrough = True
+                    await send(message)
+                else:
+                    # Held back until the first body chunk shows how large the body is
+                    start = message
+                return
+
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if compressor is None:
+                if not more_body and len(body) < settings.COMPRESSION_MIN_SIZE:
+                    passthrough = True
+                    MutableHeaders(raw=start["headers"]).add_vary_header("Accept-Encoding")
+                    await send(start)
+                    await send(message)
+                    return
+                compressor = _Compressor(encoding)
+                output = compressor.compress(body, final=not more_body)
+                set_encoding_headers(
+                    MutableHeaders(raw=start["headers"]),
+                    encoding,
+                    None if more_body else len(output),
+                )
+                await send(start)
+            else:
+                output = compressor.compress(body, final=not more_body)
+            await send({"type": "http.response.body", "body": output, "more_body": more_body})
+
+        await self.app(scope, receive, send_wrapper)
@@ -4,6 +4,114 @@ from pydantic_settings import BaseSettings
 class Settings(BaseSettings):
     DATABASE_URL: str = "sqlite:///./movie.db"
 
+    # Create the schema and seed data when a worker starts. Turn off when the
+    # database is bootstrapped separately (python -m app.db.bootstrap).
+    DB_BOOTSTRAP_ON_STARTUP: bool = True
+
+    # Read replicas for read-only routes, chosen round-robin; a replica failing
+    # its connection health check is skipped for DB_REPLICA_RETRY_SECONDS.
+    # Writes, and requests sent with X-Read-Your-Writes: 1, use DATABASE_URL.
+    # Open SQLite replicas read-only (sqlite:///file:replica.db?mode=ro&uri=true).
+    DATABASE_REPLICA_URLS: list[str] = []
+    DB_REPLICA_RETRY_SECONDS: float = 10.0
+
+    # Async mode: serve v1 routes with async handlers on an AsyncEngine.
+    # ASYNC_DATABASE_URL defaults to DATABASE_URL with an async driver.
+    DB_ASYNC: bool = False
+    ASYNC_DATABASE_URL: str | None = None
+
+    # Connection pool (per worker process: max connections = size + overflow)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_TIMEOUT_MS: int | None = None
+
+    # Log statements slower than this many milliseconds with their bind
+    # parameters to the "app.db.slow_query" logger (None = off)
+    SLOW_QUERY_LOG_MS: float | None = None
+
+    # Per-route request and SQL metrics served at /metrics
+    METRICS_ENABLED: bool = True
+
+    # SQLite pragmas applied to every new connection
+    SQLITE_JOURNAL_MODE: str = "WAL"
+    SQLITE_SYNCHRONOUS: str = "NORMAL"
+    SQLITE_CACHE_SIZE_KB: int = 65536
+    SQLITE_MMAP_SIZE: int = 268435456
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+
+    # Pagination
+    DEFAULT_PAGE_SIZE: int = 100
+    MAX_PAGE_SIZE: int = 500
+    COUNT_ESTIMATE_CAP: int = 10000
+
+    # Most values accepted by a multi-value filter such as genreId=1&genreId=3
+    MAX_FILTER_VALUES: int = 20
+
+    # Movies embedded per person by GET /directors, /directors/{id} and
+    # /actors/{id} unless moviesLimit is given; the rest is paged through
+    # /{people}/{id}/movies starting at movies_next_cursor
+    EMBEDDED_MOVIES_LIMIT: int = 20
+
+    # Most IDs accepted by one POST /movies/batch (/actors/batch, /directors/batch)
+    MAX_BATCH_SIZE: int = 100
+
+    # /movies/facets: directors listed (those with the most matching movies)
+    # and whether results are cached per filter set in the response cache
+    MAX_FACET_VALUES: int = 100
+    FACETS_CACHE_ENABLED: bool = True
+
+    # /suggest: suggestions per kind (movies, actors, directors) by default and at most
+    SUGGEST_LIMIT: int = 5
+    SUGGEST_MAX_LIMIT: int = 20
+
+    # /movies/{id}/related and /actors/{id}/costars: neighbours precomputed per
+    # movie and per actor (see app/db/neighbours.py)
+    NEIGHBOURS_TOP_K: int = 10
+    # Actors and directors with more movies than this only propose this many
+    # of them as candidates, per genre of the movie being scored
+    NEIGHBOURS_MAX_POSTING: int = 100
+
+    # Serve /movies from the movie_list_cards read model instead of joining
+    # movies, directors and genres (see app/db/read_model.py)
+    MOVIE_LIST_READ_MODEL: bool = True
+
+    # Answer /movies filters without a search term from an in-memory bitmap
+    # index and only hydrate the page from the database (see
+    # app/services/bitmap_index.py); rebuilt when the catalogue revision moves
+    MOVIE_BITMAP_INDEX: bool = False
+
+    # Encode list pages straight to JSON bytes instead of validating every
+    # item against its response schema (see app/api/v1/serialization.py)
+    FAST_SERIALIZATION: bool = True
+
+    # Negotiated gzip/brotli compression of response bodies of at least
+    # COMPRESSION_MIN_SIZE bytes (brotli needs the optional brotli package)
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MIN_SIZE: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+
+    # Response cache (in-process LRU with TTL)
+    CACHE_ENABLED: bool = True
+    CACHE_MAX_ENTRIES: int = 1024
+    CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    CACHE_TTL_SECONDS: float = 300.0
+
+    # Records per executemany batch in app.db.ingest
+    INGEST_BATCH_SIZE: int = 5000
+
+    # Rows fetched per partition when streaming exports
+    EXPORT_BATCH_SIZE: int = 1000
+
+    # HTTP caching: max-age sent with catalogue ETags (0 = always revalidate)
+    HTTP_CACHE_MAX_AGE: int = 0
+
+    # Title search (SQLite FTS5 tokenizer: "trigram" or "unicode61")
+    SEARCH_SQLITE_TOKENIZER: str = "trigram"
+
     class Config:
         env_file = ".env"
 
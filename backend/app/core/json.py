@@ -0,0 +1,35 @@
+"""JSON encoding for response bodies.
+
+Uses orjson when it is installed and the standard library otherwise; both
+produce compact UTF-8 output.
+"""
+
+import json
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+class RawJSON(str):
+    """Text that is already a JSON document; encoders splice it in unchanged."""
+
+    __slots__ = ()
+
+
+def dumps(value: Any) -> bytes:
+    """Encode ``value`` (dicts, lists, str, numbers, bool, None) to JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with :func:`dumps`."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -0,0 +1,205 @@
+"""In-process request and SQL metrics rendered in the Prometheus text format.
+
+Each worker process keeps its own registry; a Prometheus server scraping
+several workers sums them. The HTTP middleware lives in
+:mod:`app.core.middleware` and the SQL hooks in :mod:`app.db.session`; both
+write through :data:`registry` and the per-request :class:`RequestStats`.
+"""
+
+import math
+import threading
+from collections.abc import Iterable
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+# Upper bounds (seconds) of the latency histogram buckets
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+LabelValues = tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Iterable[str], values: Iterable[str]) -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values, strict=True)]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Counter:
+    """Monotonic counter with labels."""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, help_text: str, labels: tuple[str, ...] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.labels = labels
+        self._values: dict[LabelValues, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, labels: LabelValues = (), amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def value(self, labels: LabelValues = ()) -> float:
+        return self._values.get(labels, 0.0)
+
+    def samples(self) -> list[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.labels, labels)} {_format_value(value)}"
+            for labels, value in items
+        ]
+
+
+class Histogram:
+    """Cumulative-bucket histogram with labels."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labels: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ):
+        self.name = name
+        self.help_text = help_text
+        self.labels = labels
+        self.buckets = (*buckets, math.inf)
+        # labels -> (per-bucket counts, sum)
+        self._values: dict[LabelValues, tuple[list[int], float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, labels: LabelValues = ()) -> None:
+        with self._lock:
+            counts, total = self._values.get(labels, ([0] * len(self.buckets), 0.0))
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[index] += 1
+                    break
+            self._values[labels] = (counts, total + value)
+
+    def count(self, labels: LabelValues = ()) -> int:
+        counts, _ = self._values.get(labels, ([0], 0.0))
+        return sum(counts)
+
+    def samples(self) -> list[str]:
+        with self._lock:
+            items = sorted((labels, (list(c), s)) for labels, (c, s) in self._values.items())
+        lines = []
+        for labels, (counts, total) in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts, strict=True):
+                cumulative += count
+                bucket_labels = _format_labels(
+                    (*self.labels, "le"), (*labels, _format_value(bound))
+                )
+                lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+            label_text = _format_labels(self.labels, labels)
+            lines.append(f"{self.name}_sum{label_text} {_format_value(total)}")
+            lines.append(f"{self.name}_count{label_text} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Collection of metrics rendered together."""
+
+    def __init__(self):
+        self._metrics: list[Counter | Histogram] = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text exposition format."""
+        lines = []
+        for metric in self._metrics:
+            lines.append(f"# HELP {metric.name} {metric.help_text}")
+            lines.append(f"# TYPE {metric.name} {metric.type_name}")
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+http_requests = registry.register(
+    Counter("http_requests_total", "HTTP requests served.", ("method", "route", "status"))
+)
+http_request_duration = registry.register(
+    Histogram(
+        "http_request_duration_seconds",
+        "Time from receiving a request to sending the last body byte.",
+        ("method", "route"),
+    )
+)
+http_response_bytes = registry.register(
+    Counter("http_response_bytes_total", "Response body bytes sent.", ("method", "route"))
+)
+db_queries = registry.register(
+    Counter("db_queries_total", "SQL statements executed while serving requests.", ("route",))
+)
+db_query_duration = registry.register(
+    Counter(
+        "db_query_duration_seconds_total",
+        "Time spent executing SQL statements while serving requests.",
+        ("route",),
+    )
+)
+db_rows = registry.register(
+    Counter(
+        "db_rows_total",
+        "Rows fetched plus rows changed by writes while serving requests.",
+        ("route",),
+    )
+)
+compression_input_bytes = registry.register(
+    Counter(
+        "http_compression_input_bytes_total",
+        "Response bytes compressed; divide output by input bytes for the ratio.",
+        ("encoding",),
+    )
+)
+compression_output_bytes = registry.register(
+    Counter("http_compression_output_bytes_total", "Compressed bytes produced.", ("encoding",))
+)
+compression_cpu_seconds = registry.register(
+    Counter(
+        "http_compression_cpu_seconds_total",
+        "CPU time spent compressing response bodies.",
+        ("encoding",),
+    )
+)
+precompressed_responses = registry.register(
+    Counter(
+        "http_precompressed_responses_total",
+        "Cached responses sent with their stored compressed variant.",
+        ("encoding",),
+    )
+)
+
+
+@dataclass
+class RequestStats:
+    """Database work attributed to the request being served."""
+
+    queries: int = 0
+    db_seconds: float = 0.0
+    rows: int = 0
+
+
+# Set by the metrics middleware for the duration of a request
+current_request_stats: ContextVar[RequestStats | None] = ContextVar(
+    "current_request_stats", default=None
+)
@@ -0,0 +1,65 @@
+"""ASGI middleware recording per-route request metrics."""
+
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.metrics import (
+    RequestStats,
+    current_request_stats,
+    db_queries,
+    db_query_duration,
+    db_rows,
+    http_request_duration,
+    http_requests,
+    http_response_bytes,
+)
+
+# Label for requests that matched no route, so unknown paths cannot grow the label set
+UNMATCHED_ROUTE = "unmatched"
+
+
+class MetricsMiddleware:
+    """
+    Record latency, status, response bytes and SQL work for every HTTP request.
+
+    Metrics are labelled with the route template (``/api/v1/movies/{movie_id}``)
+    rather than the raw path. Written as plain ASGI so streamed bodies are
+    timed and counted up to their last chunk.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = current_request_stats.set(stats)
+        started = time.perf_counter()
+        status = 500
+        body_bytes = 0
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status, body_bytes
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                body_bytes += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            current_request_stats.reset(token)
+            route = scope.get("route")
+            route_label = getattr(route, "path", None) or UNMATCHED_ROUTE
+            method = scope["method"]
+            http_requests.inc((method, route_label, str(status)))
+            http_request_duration.observe(time.perf_counter() - started, (method, route_label))
+            http_response_bytes.inc((method, route_label), body_bytes)
+            db_queries.inc((route_label,), stats.queries)
+            db_query_duration.inc((route_label,), stats.db_seconds)
+            db_rows.inc((route_label,), stats.rows)
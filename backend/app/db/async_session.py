@@ -0,0 +1,99 @@
+from functools import lru_cache
+
+from fastapi import Depends, Request
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from app.core.config import settings
+from app.db.replicas import ReplicaSet, wants_primary
+from app.db.session import configure_engine, pool_options
+
+# Async driver used for each backend when DATABASE_URL names a sync driver
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+
+def to_async_url(url: str) -> URL:
+    """Swap the driver of a database URL for its async counterpart."""
+    parsed = make_url(url)
+    driver = ASYNC_DRIVERS.get(parsed.get_backend_name())
+    if driver is None or parsed.drivername == driver:
+        return parsed
+    return parsed.set(drivername=driver)
+
+
+def to_sync_url(url: str | URL) -> URL:
+    """Inverse of :func:`to_async_url`."""
+    parsed = make_url(url)
+    for backend, driver in ASYNC_DRIVERS.items():
+        if parsed.drivername == driver:
+            return parsed.set(drivername=backend)
+    return parsed
+
+
+def create_async_db_engine(url: str | URL, sync_url: str) -> AsyncEngine:
+    """Create an async engine with the pool settings of its sync counterpart ``sync_url``."""
+    connect_args = {}
+    if make_url(url).drivername == "postgresql+asyncpg" and settings.DB_STATEMENT_TIMEOUT_MS:
+        connect_args["server_settings"] = {
+            "statement_timeout": str(settings.DB_STATEMENT_TIMEOUT_MS)
+        }
+    async_engine = create_async_engine(url, connect_args=connect_args, **pool_options(sync_url))
+    configure_engine(async_engine.sync_engine)
+    return async_engine
+
+
+@lru_cache
+def get_async_engine() -> AsyncEngine:
+    """Create the async engine on first use so sync-only deployments need no async driver."""
+    url = settings.ASYNC_DATABASE_URL or to_async_url(settings.DATABASE_URL)
+    return create_async_db_engine(url, settings.DATABASE_URL)
+
+
+@lru_cache
+def get_async_replicas() -> ReplicaSet:
+    """Async engines for ``DATABASE_REPLICA_URLS``, created on first use."""
+    return ReplicaSet(
+        [create_async_db_engine(to_async_url(url), url) for url in settings.DATABASE_REPLICA_URLS],
+        retry_after=settings.DB_REPLICA_RETRY_SECONDS,
+    )
+
+
+@lru_cache
+def get_async_sessionmaker() -> async_sessionmaker:
+    # Objects are serialized after the session closes, so keep them loaded
+    return async_sessionmaker(get_async_engine(), expire_on_commit=False)
+
+
+async def get_async_db():
+    async with get_async_sessionmaker()() as db:
+        yield db
+
+
+async def get_async_read_db(request: Request, db: AsyncSession = Depends(get_async_db)):
+    """Async counterpart of :func:`app.db.session.get_read_db`."""
+    replicas = get_async_replicas()
+    if replicas and not wants_primary(request):
+        for replica in replicas.candidates():
+            replica_db = AsyncSession(replica, expire_on_commit=False)
+            try:
+                await replica_db.connection()
+            except SQLAlchemyError as exc:
+                await replica_db.close()
+                replicas.mark_down(replica, exc)
+                continue
+            replicas.mark_up(replica)
+            try:
+                yield replica_db
+            finally:
+                await replica_db.close()
+            return
+    yield db
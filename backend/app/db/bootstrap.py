@@ -0,0 +1,96 @@
+"""Database bootstrap: schema, search index and seed data.
+
+Run it once per deployment, before starting the API workers:
+
+    python -m app.db.bootstrap            # create schema and seed an empty catalogue
+    python -m app.db.bootstrap --no-seed  # schema only
+
+Workers then start with ``DB_BOOTSTRAP_ON_STARTUP=false`` and do no database
+work at boot, so startup time does not depend on the database size or on how
+many workers start at once. ``/api/v1/health/ready`` reports whether the
+schema, the movie list read model and the neighbour tables are in place.
+
+Workers that do bootstrap on startup never backfill the read model or the
+neighbour tables of an existing catalogue: those are full scans (tens of
+seconds on large catalogues) that every worker would run at once. Only this
+command does; seeding an empty catalogue fills them as it goes.
+"""
+
+import argparse
+import sys
+import time
+
+from sqlalchemy import Engine
+from sqlalchemy.orm import Session
+
+from app.db.base import Base
+from app.db.init_db import seed_data
+from app.db.neighbours import ensure_neighbours
+from app.db.read_model import ensure_movie_cards
+from app.db.search_index import ensure_search_index
+
+# Import all models so SQLAlchemy can discover them
+from app.models.actor import Actor  # noqa: F401
+from app.models.actor_costar import ActorCostar  # noqa: F401
+from app.models.catalogue_revision import CatalogueRevision  # noqa: F401
+from app.models.director import Director  # noqa: F401
+from app.models.genre import Genre  # noqa: F401
+from app.models.movie import Movie  # noqa: F401
+from app.models.movie_list_card import MovieListCard  # noqa: F401
+from app.models.movie_neighbour import MovieNeighbour  # noqa: F401
+
+
+def ensure_indexes(engine: Engine) -> None:
+    """
+    Create indexes added to the models after their tables were created.
+
+    ``create_all`` skips tables that already exist, indexes included.
+    """
+    with engine.begin() as connection:
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(connection, checkfirst=True)
+
+
+def bootstrap_database(engine: Engine, seed: bool = True, backfill: bool = True) -> None:
+    """
+    Create missing tables, indexes and derived structures, then seed an empty catalogue.
+
+    The derived structures are the title search index, the movie list read
+    model and the related movie and co-star tables. Idempotent: existing
+    tables and data are left alone.
+
+    Args:
+        engine: Engine to bootstrap
+        seed: Insert the sample catalogue when no movies exist
+        backfill: Build the read model and neighbour tables of a catalogue
+            that has movies but none of them yet; too slow for worker startup
+    """
+    Base.metadata.create_all(bind=engine)
+    ensure_indexes(engine)
+    ensure_search_index(engine)
+    if backfill:
+        with engine.begin() as connection:
+            ensure_movie_cards(connection)
+            ensure_neighbours(connection)
+
+    if seed:
+        with Session(engine) as db:
+            seed_data(db)
+
+
+def main(argv: list[str] | None = None) -> int:
+    from app.db.session import engine
+
+    parser = argparse.ArgumentParser(description="Create the schema and seed the catalogue.")
+    parser.add_argument("--no-seed", action="store_true", help="Only create the schema")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    bootstrap_database(engine, seed=not args.no_seed)
+    print(f"Database bootstrapped in {time.perf_counter() - started:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,63 @@
+"""Catalogue revision tracking and write-aware cache invalidation.
+
+Every transaction that changes catalogue rows bumps ``catalogue_revision``
+once, in the same transaction, so all workers can detect writes with one
+primary-key read. After commit the local response cache is dropped.
+"""
+
+from sqlalchemy import event, insert, select, update
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.cache import invalidate_catalogue_cache
+from app.db.base import Base
+from app.models.catalogue_revision import CatalogueRevision
+
+_DIRTY_KEY = "catalogue_dirty"
+
+revision_table = CatalogueRevision.__table__
+
+
+def bump_catalogue_revision(connection: Connection) -> None:
+    """Increment the catalogue revision; call from bulk writes that bypass the ORM."""
+    result = connection.execute(
+        update(revision_table)
+        .where(revision_table.c.id == 1)
+        .values(revision=revision_table.c.revision + 1)
+    )
+    if result.rowcount == 0:
+        connection.execute(insert(revision_table).values(id=1, revision=1))
+
+
+def get_catalogue_revision(db: Session) -> int:
+    """Return the current catalogue revision (0 before the first write)."""
+    stmt = select(revision_table.c.revision).where(revision_table.c.id == 1)
+    return db.execute(stmt).scalar() or 0
+
+
+async def get_catalogue_revision_async(db: AsyncSession) -> int:
+    """Async counterpart of :func:`get_catalogue_revision`."""
+    stmt = select(revision_table.c.revision).where(revision_table.c.id == 1)
+    return (await db.execute(stmt)).scalar() or 0
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_catalogue_dirty(session: Session, flush_context) -> None:
+    if session.info.get(_DIRTY_KEY):
+        return
+    changed = session.new | session.dirty | session.deleted
+    if any(isinstance(instance, Base) for instance in changed):
+        session.info[_DIRTY_KEY] = True
+        bump_catalogue_revision(session.connection())
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session: Session) -> None:
+    if session.info.pop(_DIRTY_KEY, False):
+        invalidate_catalogue_cache()
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_rolled_back_changes(session: Session) -> None:
+    session.info.pop(_DIRTY_KEY, None)
@@ -0,0 +1,326 @@
+"""Bulk catalogue ingestion.
+
+Streams movie records from CSV or JSONL and loads them in batches with Core
+``insert()`` executemany calls instead of per-object ORM flushes. Actors,
+directors and genres are deduplicated through in-memory name -> id maps, and
+IDs are assigned client-side so link rows can be written without reading
+anything back. Sequences backing the id columns (PostgreSQL) are moved past
+the assigned IDs after each insert, so later ORM inserts do not collide.
+
+Usage:
+    python -m app.db.ingest movies.csv
+    python -m app.db.ingest movies.jsonl --batch-size 20000
+
+Each record has ``title``, ``release_year``, ``rating``, ``director``, and
+lists of ``genres`` and ``actors`` (``|``-separated in CSV).
+"""
+
+import argparse
+import csv
+import json
+import sys
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from itertools import islice
+from pathlib import Path
+
+from sqlalchemy import Table, func, insert, select, text
+from sqlalchemy.engine import Connection
+
+from app.core.cache import invalidate_catalogue_cache
+from app.core.config import settings
+from app.db.catalogue_events import bump_catalogue_revision
+from app.db.neighbours import rebuild_neighbours, refresh_costars, refresh_related_movies
+from app.db.read_model import refresh_movie_cards
+from app.models.actor import Actor
+from app.models.associations import movie_actors, movie_genres
+from app.models.director import Director
+from app.models.genre import Genre
+from app.models.movie import Movie
+
+# Column aliases, so files produced by /export/movies load as-is
+FIELD_ALIASES = {
+    "director_name": "director",
+    "genre_names": "genres",
+    "actor_names": "actors",
+}
+
+
+@dataclass
+class IngestStats:
+    movies: int = 0
+    movie_actor_links: int = 0
+    movie_genre_links: int = 0
+    new_names: int = 0
+    seconds: float = 0.0
+
+    @property
+    def rows(self) -> int:
+        return self.movies + self.movie_actor_links + self.movie_genre_links + self.new_names
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+def sync_id_sequence(connection: Connection, table: Table, last_id: int) -> None:
+    """
+    Move the sequence behind ``table.id`` to ``last_id`` after client-assigned inserts.
+
+    Explicit IDs do not advance a SERIAL/IDENTITY sequence, so without this
+    the next insert that relies on the column default reuses an ingested id.
+    No-op on SQLite, whose rowid default already follows ``max(id)``.
+    """
+    if connection.dialect.name != "postgresql":
+        return
+    connection.execute(
+        text("SELECT setval(pg_get_serial_sequence(:table, 'id'), :last_id)"),
+        {"table": table.name, "last_id": last_id},
+    )
+
+
+class NameIdMap:
+    """In-memory name -> id map for a lookup table, inserting unseen names in bulk."""
+
+    def __init__(self, connection: Connection, table: Table):
+        self.connection = connection
+        self.table = table
+        self.ids: dict[str, int] = {}
+        for row_id, name in connection.execute(
+            select(table.c.id, table.c.name).order_by(table.c.id)
+        ):
+            self.ids.setdefault(name, row_id)
+        self.next_id = (connection.execute(select(func.max(table.c.id))).scalar() or 0) + 1
+
+    def resolve(self, names: Iterable[str]) -> int:
+        """
+        Make sure every name has an id, inserting missing ones in one statement.
+
+        Returns:
+            Number of names inserted
+        """
+        new_rows = []
+        for name in names:
+            if name not in self.ids:
+                self.ids[name] = self.next_id
+                new_rows.append({"id": self.next_id, "name": name})
+                self.next_id += 1
+        if new_rows:
+            self.connection.execute(insert(self.table), new_rows)
+            sync_id_sequence(self.connection, self.table, self.next_id - 1)
+        return len(new_rows)
+
+
+class CatalogueIngestor:
+    """Loads movie records into the catalogue tables in batches."""
+
+    def __init__(
+        self,
+        connection: Connection,
+        batch_size: int | None = None,
+        defer_neighbours: bool = True,
+    ):
+        """
+        Args:
+            connection: Connection to load into; the caller commits
+            batch_size: Records per batch (default ``INGEST_BATCH_SIZE``)
+            defer_neighbours: Refresh the related movie and co-star tables once
+                at the end of :meth:`ingest` rather than after every batch;
+                much cheaper for large loads, which touch most neighbour
+                lists. Callers of :meth:`ingest_batch` then call
+                :meth:`refresh_neighbours` themselves
+        """
+        self.connection = connection
+        self.batch_size = batch_size or settings.INGEST_BATCH_SIZE
+        self.defer_neighbours = defer_neighbours
+        self._pending_movies: list[int] = []
+        self._pending_actors: list[int] = []
+        self.genres = NameIdMap(connection, Genre.__table__)
+        self.directors = NameIdMap(connection, Director.__table__)
+        self.actors = NameIdMap(connection, Actor.__table__)
+        self.next_movie_id = (connection.execute(select(func.max(Movie.id))).scalar() or 0) + 1
+        # Loads into an empty catalogue rebuild the neighbour tables in one pass
+        self._rebuild_neighbours = self.next_movie_id == 1
+
+    def ingest_batch(self, records: list[dict], stats: IngestStats) -> list[int]:
+        """
+        Insert one batch of records and their links.
+
+        Returns:
+            IDs assigned to the inserted movies
+        """
+        stats.new_names += self.genres.resolve(g for r in records for g in r["genres"])
+        stats.new_names += self.directors.resolve(r["director"] for r in records)
+        stats.new_names += self.actors.resolve(a for r in records for a in r["actors"])
+
+        movie_rows, actor_links, genre_links = [], [], []
+        for record in records:
+            movie_id = self.next_movie_id
+            self.next_movie_id += 1
+            movie_rows.append(
+                {
+                    "id": movie_id,
+                    "title": record["title"],
+                    "release_year": record["release_year"],
+                    "rating": record["rating"],
+                    "director_id": self.directors.ids[record["director"]],
+                }
+            )
+            # dict.fromkeys drops duplicate names while keeping order
+            for name in dict.fromkeys(record["actors"]):
+                actor_links.append({"movie_id": movie_id, "actor_id": self.actors.ids[name]})
+            for name in dict.fromkeys(record["genres"]):
+                genre_links.append({"movie_id": movie_id, "genre_id": self.genres.ids[name]})
+
+        self.connection.execute(insert(Movie.__table__), movie_rows)
+        sync_id_sequence(self.connection, Movie.__table__, self.next_movie_id - 1)
+        if actor_links:
+            self.connection.execute(insert(movie_actors), actor_links)
+        if genre_links:
+            self.connection.execute(insert(movie_genres), genre_links)
+        refresh_movie_cards(self.connection, [row["id"] for row in movie_rows])
+        self._pending_movies.extend(row["id"] for row in movie_rows)
+        self._pending_actors.extend(link["actor_id"] for link in actor_links)
+        if not self.defer_neighbours:
+            self.refresh_neighbours()
+        bump_catalogue_revision(self.connection)
+
+        stats.movies += len(movie_rows)
+        stats.movie_actor_links += len(actor_links)
+        stats.movie_genre_links += len(genre_links)
+        return [row["id"] for row in movie_rows]
+
+    def refresh_neighbours(self) -> None:
+        """Refresh the neighbour tables for the movies ingested since the last refresh."""
+        if self._rebuild_neighbours:
+            rebuild_neighbours(self.connection)
+            self._rebuild_neighbours = False
+        else:
+            refresh_related_movies(self.connection, self._pending_movies)
+            refresh_costars(self.connection, self._pending_actors)
+        self._pending_movies, self._pending_actors = [], []
+
+    def ingest(self, records: Iterable[dict], commit_batches: bool = False) -> IngestStats:
+        """
+        Ingest a stream of records.
+
+        Args:
+            records: Normalized movie records (see :func:`normalize_record`)
+            commit_batches: Commit the connection after every batch, keeping
+                transactions small on large loads
+
+        Returns:
+            IngestStats with row counts and throughput
+        """
+        stats = IngestStats()
+        started = time.perf_counter()
+        iterator = iter(records)
+        while batch := list(islice(iterator, self.batch_size)):
+            self.ingest_batch(batch, stats)
+            if commit_batches:
+                self.connection.commit()
+        if self._pending_movies:
+            self.refresh_neighbours()
+            # Responses cached since the last batch hold the stale neighbours
+            bump_catalogue_revision(self.connection)
+        stats.seconds = time.perf_counter() - started
+        return stats
+
+
+def _name(value) -> str:
+    # NDJSON exports nest names as {"id": ..., "name": ...}
+    return str(value["name"]) if isinstance(value, dict) else str(value)
+
+
+def _split(value) -> list[str]:
+    if value is None or value == "":
+        return []
+    if isinstance(value, str):
+        return [part.strip() for part in value.split("|") if part.strip()]
+    return [_name(part) for part in value]
+
+
+def normalize_record(raw: dict) -> dict:
+    """
+    Convert a raw CSV/JSONL row into an ingestion record.
+
+    Raises:
+        ValueError: If a required field is missing or malformed
+    """
+    row = {FIELD_ALIASES.get(key, key): value for key, value in raw.items()}
+    try:
+        return {
+            "title": str(row["title"]),
+            "release_year": int(row["release_year"]),
+            "rating": float(row["rating"]),
+            "director": _name(row["director"]),
+            "genres": _split(row.get("genres")),
+            "actors": _split(row.get("actors")),
+        }
+    except (KeyError, TypeError, ValueError) as exc:
+        raise ValueError(f"Invalid record {raw!r}: {exc}") from exc
+
+
+def read_records(path: Path, fmt: str | None = None) -> Iterator[dict]:
+    """Stream normalized records from a CSV or JSONL file."""
+    fmt = fmt or ("csv" if path.suffix.lower() == ".csv" else "jsonl")
+    with path.open(newline="", encoding="utf-8") as handle:
+        if fmt == "csv":
+            for raw in csv.DictReader(handle):
+                yield normalize_record(raw)
+        else:
+            for line in handle:
+                if line.strip():
+                    yield normalize_record(json.loads(line))
+
+
+@contextmanager
+def relaxed_durability(connection: Connection):
+    """
+    Turn off SQLite fsyncs for the duration of a bulk load.
+
+    A crash mid-load can corrupt the file, so only use this for loads that
+    can be rerun. Must be entered outside a transaction. No-op elsewhere.
+    """
+    if connection.dialect.name != "sqlite":
+        yield
+        return
+    connection.exec_driver_sql("PRAGMA synchronous=OFF")
+    try:
+        yield
+    finally:
+        # The pragma cannot change inside a transaction
+        if connection.in_transaction():
+            connection.rollback()
+        connection.exec_driver_sql(f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    from app.db.base import Base
+    from app.db.session import engine
+
+    parser = argparse.ArgumentParser(description="Bulk load movies into the catalogue.")
+    parser.add_argument("path", type=Path, help="CSV or JSONL file")
+    parser.add_argument("--format", choices=["csv", "jsonl"], help="Override format detection")
+    parser.add_argument("--batch-size", type=int, default=settings.INGEST_BATCH_SIZE)
+    args = parser.parse_args(argv)
+
+    Base.metadata.create_all(bind=engine)
+    with engine.connect() as connection, relaxed_durability(connection):
+        ingestor = CatalogueIngestor(connection, batch_size=args.batch_size)
+        stats = ingestor.ingest(read_records(args.path, args.format), commit_batches=True)
+        connection.commit()
+    invalidate_catalogue_cache()
+
+    print(
+        f"Ingested {stats.movies} movies, {stats.movie_actor_links} cast links, "
+        f"{stats.movie_genre_links} genre links and {stats.new_names} new names "
+        f"in {stats.seconds:.2f}s ({stats.rows_per_second:,.0f} rows/s)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,7 @@
 import random
 
-from app.models.actor import Actor
-from app.models.director import Director
-from app.models.genre import Genre
+from app.core.cache import invalidate_catalogue_cache
+from app.db.ingest import CatalogueIngestor
 from app.models.movie import Movie
 
 
@@ -11,6 +10,8 @@ def seed_data(db):
     if db.query(Movie).first():
         return
 
+    ingestor = CatalogueIngestor(db.connection())
+
     # Create genres
     genres_data = [
         "Action",
@@ -19,12 +20,7 @@ def seed_data(db):
         "Sci-Fi",
         "Thriller",
     ]
-    genres = []
-    for name in genres_data:
-        genre = Genre(name=name)
-        db.add(genre)
-        genres.append(genre)
-    db.flush()
+    ingestor.genres.resolve(genres_data)
 
     # Create directors
     directors_data = [
@@ -34,12 +30,7 @@ def seed_data(db):
         "Martin Scorsese",
         "Ridley Scott",
     ]
-    directors = []
-    for name in directors_data:
-        director = Director(name=name)
-        db.add(director)
-        directors.append(director)
-    db.flush()
+    ingestor.directors.resolve(directors_data)
 
     # Create actors
     actors_data = [
@@ -59,12 +50,7 @@ def seed_data(db):
         "Natalie Portman",
         "Joaquin Phoenix",
     ]
-    actors = []
-    for name in actors_data:
-        actor = Actor(name=name)
-        db.add(actor)
-        actors.append(actor)
-    db.flush()
+    ingestor.actors.resolve(actors_data)
 
     # Create movies
     movies_data = [
@@ -90,17 +76,20 @@ def seed_data(db):
         ("The Revenant", 2015, 8.0),
     ]
 
-    for title, year, rating in movies_data:
-        movie = Movie(
-            title=title,
-            release_year=year,
-            rating=rating,
-            director=random.choice(directors),
-        )
-        # Add 2-4 random actors
-        movie.actors = random.sample(actors, random.randint(2, min(4, len(actors))))
-        # Add 1-3 random genres
-        movie.genres = random.sample(genres, random.randint(1, min(3, len(genres))))
-        db.add(movie)
+    records = [
+        {
+            "title": title,
+            "release_year": year,
+            "rating": rating,
+            "director": random.choice(directors_data),
+            # Add 2-4 random actors
+            "actors": random.sample(actors_data, random.randint(2, min(4, len(actors_data)))),
+            # Add 1-3 random genres
+            "genres": random.sample(genres_data, random.randint(1, min(3, len(genres_data)))),
+        }
+        for title, year, rating in movies_data
+    ]
+    ingestor.ingest(records)
 
     db.commit()
+    invalidate_catalogue_cache()
@@ -0,0 +1,518 @@
+"""Maintenance of the ``movie_neighbours`` and ``actor_costars`` tables.
+
+Related movies and co-stars come from the movie x actor, movie x genre and
+movie x director incidence, which is sparse: a movie has a handful of actors
+and genres. Rather than comparing every pair of movies, candidates are found
+through the inverted lists (movies sharing an actor or the director with a
+movie) and only those are scored, a chunk of movies at a time:
+
+    score = ACTOR_WEIGHT * cosine(actors) + GENRE_WEIGHT * cosine(genres)
+            + DIRECTOR_WEIGHT * (same director)
+
+where the cosine of two sets is ``|A & B| / sqrt(|A| * |B|)``. Actors and
+directors with more than ``NEIGHBOURS_MAX_POSTING`` movies would make every
+movie a candidate of a large share of the catalogue, and the rebuild
+quadratic; those only propose, per genre of the scored movie, their movies of
+that genre with the smallest casts (the largest actor cosines). The best
+``NEIGHBOURS_TOP_K`` neighbours of each movie are stored in rank order, so
+the API reads them with one primary-key range scan. Co-stars are the actors
+sharing the most movies with an actor.
+
+A score only depends on the links of the two movies it compares, and the
+candidates of a movie on the movies of its actors and director, so when the
+links of movie M change, the only neighbour lists that can move are M's,
+those of movies sharing an actor or the director with M before or after the
+change, and those that currently list M. Co-star counts only move for the
+actors in M's cast before and after the change. Those rows are refreshed in
+the transaction that changes the links: ORM flushes through the session hooks
+below, bulk loads through :func:`refresh_related_movies` and
+:func:`refresh_costars`.
+
+Usage:
+    python -m app.db.neighbours rebuild
+"""
+
+import argparse
+import heapq
+import math
+import sys
+from collections import Counter, defaultdict
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from itertools import islice
+
+from sqlalchemy import Select, delete, event, insert, inspect, select, union
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.actor import Actor
+from app.models.actor_costar import ActorCostar
+from app.models.associations import movie_actors, movie_genres
+from app.models.director import Director
+from app.models.genre import Genre
+from app.models.movie import Movie
+from app.models.movie_neighbour import MovieNeighbour
+
+ACTOR_WEIGHT = 0.6
+GENRE_WEIGHT = 0.25
+DIRECTOR_WEIGHT = 0.15
+
+# Movies or actors per refresh chunk; keeps IN lists well below driver limits
+REFRESH_CHUNK_SIZE = 500
+
+# Beyond this many movies to rescore, reading every link is cheaper than
+# reading the neighbourhood of each
+NEIGHBOURHOOD_READ_LIMIT = 1000
+
+_CHANGED_KEY = "neighbour_sources"
+
+_NO_LINKS: frozenset[int] = frozenset()
+
+neighbour_table = MovieNeighbour.__table__
+costar_table = ActorCostar.__table__
+
+
+def _chunks(ids: Iterable[int], size: int = REFRESH_CHUNK_SIZE) -> Iterator[list[int]]:
+    iterator = iter(ids)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _cosine(a: set[int] | frozenset[int], b: set[int] | frozenset[int]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / math.sqrt(len(a) * len(b))
+
+
+def _invert(links: dict[int, set[int]]) -> dict[int, list[int]]:
+    inverted: dict[int, list[int]] = defaultdict(list)
+    for movie_id, values in links.items():
+        for value in values:
+            inverted[value].append(movie_id)
+    return inverted
+
+
+@dataclass
+class _Incidence:
+    """Directors, cast and genres of a set of movies, with the inverted lists."""
+
+    director_of: dict[int, int]
+    actors_of: dict[int, set[int]]
+    genres_of: dict[int, set[int]]
+    movies_of_actor: dict[int, list[int]] = field(init=False)
+    movies_of_director: dict[int, list[int]] = field(init=False)
+    _shortlists: dict[tuple, list[int]] = field(init=False, default_factory=dict)
+
+    def __post_init__(self) -> None:
+        self.movies_of_actor = _invert(self.actors_of)
+        self.movies_of_director = defaultdict(list)
+        for movie_id, director_id in self.director_of.items():
+            self.movies_of_director[director_id].append(movie_id)
+
+    def posting(self, link: tuple[type, int]) -> list[int]:
+        """Movies of an ``(Actor, id)`` or ``(Director, id)`` link."""
+        kind, link_id = link
+        return (self.movies_of_actor if kind is Actor else self.movies_of_director)[link_id]
+
+    def shortlist(self, link: tuple[type, int], genre_id: int | None, size: int) -> list[int]:
+        """
+        The ``size`` movies of ``link`` with ``genre_id`` (any when None) and the smallest casts.
+
+        Ties go to the lower ID; computed once per link and genre.
+        """
+        key = (link, genre_id, size)
+        shortlist = self._shortlists.get(key)
+        if shortlist is None:
+            posting = self.posting(link)
+            matching = (
+                posting
+                if genre_id is None
+                else [m for m in posting if genre_id in self.genres_of.get(m, _NO_LINKS)]
+            )
+            shortlist = heapq.nsmallest(
+                size, matching, key=lambda m: (len(self.actors_of.get(m, _NO_LINKS)), m)
+            )
+            self._shortlists[key] = shortlist
+        return shortlist
+
+
+def _load_incidence(connection: Connection, movie_ids: Select | None = None) -> _Incidence:
+    """Read the links of the movies selected by ``movie_ids`` (all movies when None)."""
+
+    def scoped(stmt: Select, column) -> Select:
+        return stmt if movie_ids is None else stmt.where(column.in_(movie_ids))
+
+    director_of = dict(
+        connection.execute(scoped(select(Movie.id, Movie.director_id), Movie.id)).all()
+    )
+    actors_of: dict[int, set[int]] = defaultdict(set)
+    for movie_id, actor_id in connection.execute(
+        scoped(select(movie_actors.c.movie_id, movie_actors.c.actor_id), movie_actors.c.movie_id)
+    ):
+        actors_of[movie_id].add(actor_id)
+    genres_of: dict[int, set[int]] = defaultdict(set)
+    for movie_id, genre_id in connection.execute(
+        scoped(select(movie_genres.c.movie_id, movie_genres.c.genre_id), movie_genres.c.movie_id)
+    ):
+        genres_of[movie_id].add(genre_id)
+    return _Incidence(director_of, dict(actors_of), dict(genres_of))
+
+
+def _neighbourhood(movie_ids: list[int]) -> Select:
+    """IDs of the movies sharing an actor or the director with one of ``movie_ids``."""
+    cast = select(movie_actors.c.actor_id).where(movie_actors.c.movie_id.in_(movie_ids))
+    directors = select(Movie.director_id).where(Movie.id.in_(movie_ids))
+    return union(
+        select(movie_actors.c.movie_id).where(movie_actors.c.actor_id.in_(cast)),
+        select(Movie.id).where(Movie.director_id.in_(directors)),
+    )
+
+
+def score_neighbours(
+    incidence: _Incidence,
+    movie_ids: Iterable[int],
+    top_k: int,
+    max_posting: int | None = None,
+) -> list[dict]:
+    """
+    Score the candidates of each movie and keep the best ``top_k``.
+
+    ``incidence`` must hold every movie sharing an actor or the director with
+    ``movie_ids``. Actors and directors with more than ``max_posting`` movies
+    (``NEIGHBOURS_MAX_POSTING`` when None) only propose their shortlists, but
+    count in the score of every candidate. Ties are broken by neighbour ID.
+
+    Returns:
+        ``movie_neighbours`` rows; movies missing from ``incidence`` get none
+    """
+    if max_posting is None:
+        max_posting = settings.NEIGHBOURS_MAX_POSTING
+    actors_of, genres_of, director_of = (
+        incidence.actors_of,
+        incidence.genres_of,
+        incidence.director_of,
+    )
+    rows = []
+    for movie_id in movie_ids:
+        director_id = director_of.get(movie_id)
+        if director_id is None:
+            continue
+        actors = actors_of.get(movie_id, _NO_LINKS)
+        genres = genres_of.get(movie_id, _NO_LINKS)
+
+        # |A & B| for every movie sharing an actor, without intersecting sets;
+        # only prolific actors are intersected, with the candidates they miss
+        shared_actors: Counter[int] = Counter()
+        prolific: set[int] = set()
+        candidates: set[int] = set()
+        for link in (*((Actor, actor_id) for actor_id in actors), (Director, director_id)):
+            posting = incidence.posting(link)
+            kind, link_id = link
+            if len(posting) <= max_posting:
+                if kind is Actor:
+                    shared_actors.update(posting)
+                else:
+                    candidates.update(posting)
+                continue
+            if kind is Actor:
+                prolific.add(link_id)
+            for genre_id in genres or (None,):
+                candidates.update(incidence.shortlist(link, genre_id, max_posting))
+        candidates.update(shared_actors)
+        candidates.discard(movie_id)
+
+        scored = []
+        for other in candidates:
+            score = 0.0
+            shared = shared_actors[other]
+            if prolific:
+                shared += len(prolific & actors_of.get(other, _NO_LINKS))
+            if shared:
+                score += ACTOR_WEIGHT * shared / math.sqrt(len(actors) * len(actors_of[other]))
+            score += GENRE_WEIGHT * _cosine(genres, genres_of.get(other, _NO_LINKS))
+            if director_of[other] == director_id:
+                score += DIRECTOR_WEIGHT
+            scored.append((-score, other))
+
+        for rank, (negative_score, other) in enumerate(heapq.nsmallest(top_k, scored), start=1):
+            rows.append(
+                {
+                    "movie_id": movie_id,
+                    "rank": rank,
+                    "neighbour_id": other,
+                    "score": -negative_score,
+                }
+            )
+    return rows
+
+
+def count_costars(
+    actors_of: dict[int, set[int]],
+    actor_ids: Iterable[int],
+    top_k: int,
+    movies_of_actor: dict[int, list[int]] | None = None,
+) -> list[dict]:
+    """
+    Rank the co-stars of each actor by movies shared, ties broken by actor ID.
+
+    ``actors_of`` must hold the cast of every movie of ``actor_ids``;
+    ``movies_of_actor`` is its inverse, computed when not given.
+
+    Returns:
+        ``actor_costars`` rows
+    """
+    if movies_of_actor is None:
+        movies_of_actor = _invert(actors_of)
+    rows = []
+    for actor_id in actor_ids:
+        shared: Counter[int] = Counter()
+        for movie_id in movies_of_actor.get(actor_id, ()):
+            shared.update(actors_of[movie_id])
+        del shared[actor_id]
+        best = heapq.nsmallest(top_k, shared.items(), key=lambda item: (-item[1], item[0]))
+        rows.extend(
+            {"actor_id": actor_id, "rank": rank, "costar_id": costar_id, "shared_movies": count}
+            for rank, (costar_id, count) in enumerate(best, start=1)
+        )
+    return rows
+
+
+def _write(connection: Connection, table, key_column, ids: list[int], rows: list[dict]) -> int:
+    connection.execute(delete(table).where(key_column.in_(ids)))
+    if rows:
+        connection.execute(insert(table), rows)
+    return len(rows)
+
+
+def refresh_related_movies(
+    connection: Connection, movie_ids: Iterable[int], former_neighbours: Iterable[int] = ()
+) -> int:
+    """
+    Recompute the neighbours of movies whose links changed, and of every movie they may affect.
+
+    Call after writing the new links of ``movie_ids`` (including deletions).
+
+    Args:
+        connection: Connection of the transaction that changed the links
+        movie_ids: Movies whose links changed
+        former_neighbours: Movies that shared an actor or the director with
+            ``movie_ids`` before the change, when links were removed
+
+    Returns:
+        Number of neighbour rows written
+    """
+    changed = list(dict.fromkeys(movie_ids))
+    affected = set(changed)
+    affected.update(former_neighbours)
+    for chunk in _chunks(changed):
+        affected.update(connection.execute(_neighbourhood(chunk)).scalars())
+        listing = select(neighbour_table.c.movie_id).where(
+            neighbour_table.c.neighbour_id.in_(chunk)
+        )
+        affected.update(connection.execute(listing).scalars())
+
+    if not affected:
+        return 0
+    # One read of the links: the neighbourhood of a small change, or the whole
+    # catalogue when a bulk change touches a large part of it anyway
+    if len(affected) <= NEIGHBOURHOOD_READ_LIMIT:
+        incidence = _load_incidence(connection, _neighbourhood(sorted(affected)))
+    else:
+        incidence = _load_incidence(connection)
+
+    written = 0
+    for chunk in _chunks(sorted(affected)):
+        rows = score_neighbours(incidence, chunk, settings.NEIGHBOURS_TOP_K)
+        written += _write(connection, neighbour_table, neighbour_table.c.movie_id, chunk, rows)
+    return written
+
+
+def refresh_costars(connection: Connection, actor_ids: Iterable[int]) -> int:
+    """
+    Recompute the co-stars of ``actor_ids``.
+
+    Call with the cast of every movie whose cast changed, before and after the change.
+
+    Returns:
+        Number of co-star rows written
+    """
+    written = 0
+    for chunk in _chunks(dict.fromkeys(actor_ids)):
+        their_movies = select(movie_actors.c.movie_id).where(movie_actors.c.actor_id.in_(chunk))
+        actors_of: dict[int, set[int]] = defaultdict(set)
+        for movie_id, actor_id in connection.execute(
+            select(movie_actors.c.movie_id, movie_actors.c.actor_id).where(
+                movie_actors.c.movie_id.in_(their_movies)
+            )
+        ):
+            actors_of[movie_id].add(actor_id)
+        rows = count_costars(actors_of, chunk, settings.NEIGHBOURS_TOP_K)
+        written += _write(connection, costar_table, costar_table.c.actor_id, chunk, rows)
+    return written
+
+
+def rebuild_neighbours(connection: Connection) -> tuple[int, int]:
+    """
+    Replace every neighbour and co-star row from links read in one pass.
+
+    Returns:
+        Tuple of (neighbour rows, co-star rows) written
+    """
+    connection.execute(delete(neighbour_table))
+    connection.execute(delete(costar_table))
+    incidence = _load_incidence(connection)
+    top_k = settings.NEIGHBOURS_TOP_K
+
+    neighbours = 0
+    for chunk in _chunks(sorted(incidence.director_of)):
+        rows = score_neighbours(incidence, chunk, top_k)
+        if rows:
+            connection.execute(insert(neighbour_table), rows)
+        neighbours += len(rows)
+
+    costars = 0
+    for chunk in _chunks(sorted(incidence.movies_of_actor)):
+        rows = count_costars(incidence.actors_of, chunk, top_k, incidence.movies_of_actor)
+        if rows:
+            connection.execute(insert(costar_table), rows)
+        costars += len(rows)
+    return neighbours, costars
+
+
+def neighbours_missing(connection: Connection) -> bool:
+    """
+    Whether a neighbour table is empty although it should have rows, e.g. before bootstrap.
+
+    Movies need neighbours once two of them share an actor or a director, and
+    actors need co-stars once a movie has two of them.
+    """
+    has_neighbours = connection.execute(select(neighbour_table.c.movie_id).limit(1)).first()
+    has_costars = connection.execute(select(costar_table.c.actor_id).limit(1)).first()
+    if has_neighbours is not None and has_costars is not None:
+        return False
+    other_movie, other_link = Movie.__table__.alias(), movie_actors.alias()
+    shared_director = select(Movie.id).join(
+        other_movie,
+        (other_movie.c.director_id == Movie.director_id) & (other_movie.c.id != Movie.id),
+    )
+    shared_actor = select(movie_actors.c.movie_id).join(
+        other_link,
+        (other_link.c.actor_id == movie_actors.c.actor_id)
+        & (other_link.c.movie_id != movie_actors.c.movie_id),
+    )
+    two_actors = select(movie_actors.c.movie_id).join(
+        other_link,
+        (other_link.c.movie_id == movie_actors.c.movie_id)
+        & (other_link.c.actor_id != movie_actors.c.actor_id),
+    )
+
+    def exists(stmt: Select) -> bool:
+        return connection.execute(stmt.limit(1)).first() is not None
+
+    if has_neighbours is None and (exists(shared_director) or exists(shared_actor)):
+        return True
+    return has_costars is None and exists(two_actors)
+
+
+def ensure_neighbours(connection: Connection) -> None:
+    """Build the neighbour tables of databases whose movies have none yet."""
+    if neighbours_missing(connection):
+        rebuild_neighbours(connection)
+
+
+def _neighbours_of(connection: Connection, movie_ids: set[int]) -> set[int]:
+    neighbours: set[int] = set()
+    for chunk in _chunks(movie_ids):
+        neighbours.update(connection.execute(_neighbourhood(chunk)).scalars())
+    return neighbours
+
+
+def _cast_of(connection: Connection, movie_ids: set[int]) -> set[int]:
+    cast: set[int] = set()
+    for chunk in _chunks(movie_ids):
+        stmt = select(movie_actors.c.actor_id).where(movie_actors.c.movie_id.in_(chunk))
+        cast.update(connection.execute(stmt).scalars())
+    return cast
+
+
+def _linked_movies(connection: Connection, link_column, value_ids: list[int]) -> set[int]:
+    table = link_column.table
+    stmt = select(table.c.movie_id).where(link_column.in_(value_ids))
+    return set(connection.execute(stmt).scalars())
+
+
+def _links_changed(movie: Movie) -> bool:
+    """Whether the flush changes the cast, genres or director of ``movie``."""
+    attrs = inspect(movie).attrs
+    return any(
+        getattr(attrs, name).history.has_changes()
+        for name in ("actors", "genres", "director", "director_id")
+    )
+
+
+@event.listens_for(Session, "before_flush")
+def _collect_changed_links(session: Session, flush_context, instances) -> None:
+    movie_ids, actor_ids, former_neighbours = session.info.setdefault(
+        _CHANGED_KEY, (set(), set(), set())
+    )
+    deleted: dict[type, list[int]] = {Actor: [], Genre: []}
+    for obj in (*session.dirty, *session.deleted):
+        if not isinstance(obj, Movie | Actor | Genre) or obj.id is None:
+            continue
+        if isinstance(obj, Movie):
+            if obj in session.deleted or _links_changed(obj):
+                movie_ids.add(obj.id)
+        elif obj in session.deleted:
+            deleted[type(obj)].append(obj.id)
+        else:
+            history = inspect(obj).attrs.movies.history
+            if history.has_changes():
+                movie_ids.update(
+                    movie.id for movie in (*history.added, *history.deleted) if movie.id is not None
+                )
+    # Links of deleted actors and genres disappear in this flush; read them now
+    connection = session.connection()
+    if deleted[Actor]:
+        movie_ids.update(_linked_movies(connection, movie_actors.c.actor_id, deleted[Actor]))
+        actor_ids.update(deleted[Actor])
+    if deleted[Genre]:
+        movie_ids.update(_linked_movies(connection, movie_genres.c.genre_id, deleted[Genre]))
+    # Actors about to leave a cast lose co-stars, and movies about to lose an
+    # actor or director in common may get new candidates
+    actor_ids.update(_cast_of(connection, movie_ids))
+    former_neighbours.update(_neighbours_of(connection, movie_ids))
+
+
+@event.listens_for(Session, "after_flush")
+def _refresh_neighbours(session: Session, flush_context) -> None:
+    movie_ids, actor_ids, former_neighbours = session.info.pop(_CHANGED_KEY, (set(), set(), set()))
+    movie_ids.update(obj.id for obj in session.new if isinstance(obj, Movie))
+    if not movie_ids and not actor_ids:
+        return
+    connection = session.connection()
+    refresh_related_movies(connection, movie_ids, former_neighbours)
+    actor_ids.update(_cast_of(connection, movie_ids))
+    refresh_costars(connection, actor_ids)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_changed_links(session: Session) -> None:
+    session.info.pop(_CHANGED_KEY, None)
+
+
+def main(argv: list[str] | None = None) -> int:
+    from app.db.session import engine
+
+    parser = argparse.ArgumentParser(description="Rebuild the related movie and co-star tables.")
+    parser.add_argument("command", choices=["rebuild"])
+    parser.parse_args(argv)
+
+    with engine.begin() as connection:
+        neighbours, costars = rebuild_neighbours(connection)
+    print(f"Rebuilt {neighbours} movie neighbours and {costars} co-stars")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
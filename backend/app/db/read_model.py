@@ -0,0 +1,257 @@
+"""Maintenance of the ``movie_list_cards`` read model.
+
+Each card holds the serialized ``MovieListItem`` of one movie next to copies
+of its filter and sort columns, so the movie list is read from one table
+instead of joining movies, directors and genres per page.
+
+Cards are refreshed in the transaction that changes their sources: ORM
+flushes touching movies, directors, genres or movie-genre links refresh the
+affected cards, and bulk writes call :func:`refresh_movie_cards` with the
+movie IDs they wrote.
+
+Usage:
+    python -m app.db.read_model check          # report cards that disagree
+    python -m app.db.read_model check --fix    # and refresh them
+    python -m app.db.read_model rebuild
+"""
+
+import argparse
+import sys
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from itertools import islice
+
+from sqlalchemy import delete, event, func, insert, inspect, select
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from app.models.associations import movie_genres
+from app.models.director import Director
+from app.models.genre import Genre
+from app.models.movie import Movie
+from app.models.movie_list_card import MovieListCard
+
+# Movies per refresh statement; keeps IN lists well below driver limits
+REFRESH_CHUNK_SIZE = 500
+
+_STALE_KEY = "stale_movie_cards"
+
+card_table = MovieListCard.__table__
+
+
+def _chunks(ids: Iterable[int], size: int = REFRESH_CHUNK_SIZE) -> Iterator[list[int]]:
+    iterator = iter(ids)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def build_movie_cards(connection: Connection, movie_ids: list[int]) -> dict[int, dict]:
+    """
+    Compute the card rows of ``movie_ids`` from the normalized tables.
+
+    Returns:
+        Mapping of movie ID to the row to store; movies that do not exist are absent
+    """
+    movies = connection.execute(
+        select(
+            Movie.id,
+            Movie.title,
+            Movie.release_year,
+            Movie.rating,
+            Movie.director_id,
+            Director.name.label("director_name"),
+        )
+        .join(Director, Director.id == Movie.director_id)
+        .where(Movie.id.in_(movie_ids))
+    )
+    genres: dict[int, list[dict]] = {}
+    for movie_id, genre_id, name in connection.execute(
+        select(movie_genres.c.movie_id, Genre.id, Genre.name)
+        .join(Genre, Genre.id == movie_genres.c.genre_id)
+        .where(movie_genres.c.movie_id.in_(movie_ids))
+        .order_by(movie_genres.c.movie_id, Genre.id)
+    ):
+        genres.setdefault(movie_id, []).append({"id": genre_id, "name": name})
+
+    return {
+        row.id: {
+            "id": row.id,
+            "title": row.title,
+            "release_year": row.release_year,
+            "rating": row.rating,
+            "director_id": row.director_id,
+            # The MovieListItem shape
+            "payload": {
+                "id": row.id,
+                "title": row.title,
+                "release_year": row.release_year,
+                "rating": row.rating,
+                "director": {"id": row.director_id, "name": row.director_name},
+                "genres": genres.get(row.id, []),
+            },
+        }
+        for row in movies
+    }
+
+
+def refresh_movie_cards(connection: Connection, movie_ids: Iterable[int]) -> int:
+    """
+    Recompute the cards of ``movie_ids``, dropping cards of deleted movies.
+
+    Returns:
+        Number of cards written
+    """
+    written = 0
+    for chunk in _chunks(dict.fromkeys(movie_ids)):
+        cards = build_movie_cards(connection, chunk)
+        connection.execute(delete(card_table).where(card_table.c.id.in_(chunk)))
+        if cards:
+            connection.execute(insert(card_table), list(cards.values()))
+        written += len(cards)
+    return written
+
+
+def rebuild_movie_cards(connection: Connection) -> int:
+    """Replace every card; returns the number of cards written."""
+    connection.execute(delete(card_table))
+    written = 0
+    last_id = 0
+    while chunk := list(
+        connection.execute(
+            select(Movie.id).where(Movie.id > last_id).order_by(Movie.id).limit(REFRESH_CHUNK_SIZE)
+        ).scalars()
+    ):
+        cards = build_movie_cards(connection, chunk)
+        connection.execute(insert(card_table), list(cards.values()))
+        written += len(cards)
+        last_id = chunk[-1]
+    return written
+
+
+def movie_cards_missing(connection: Connection) -> bool:
+    """Whether the database has movies but no cards yet, e.g. before its first bootstrap."""
+    if connection.execute(select(card_table.c.id).limit(1)).first() is not None:
+        return False
+    return connection.execute(select(Movie.id).limit(1)).first() is not None
+
+
+def ensure_movie_cards(connection: Connection) -> None:
+    """Build the read model of databases that have movies but no cards yet."""
+    if movie_cards_missing(connection):
+        rebuild_movie_cards(connection)
+
+
+@dataclass
+class ConsistencyReport:
+    """Differences between the read model and the normalized tables."""
+
+    checked: int = 0
+    missing: list[int] = field(default_factory=list)
+    orphaned: list[int] = field(default_factory=list)
+    stale: list[int] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not (self.missing or self.orphaned or self.stale)
+
+    @property
+    def broken_ids(self) -> list[int]:
+        return sorted({*self.missing, *self.orphaned, *self.stale})
+
+
+def check_movie_cards(connection: Connection) -> ConsistencyReport:
+    """Compare every stored card with the card the normalized tables produce."""
+    report = ConsistencyReport()
+    movie_ids = set(connection.execute(select(Movie.id)).scalars())
+    card_ids = set(connection.execute(select(card_table.c.id)).scalars())
+    report.missing = sorted(movie_ids - card_ids)
+    report.orphaned = sorted(card_ids - movie_ids)
+
+    for chunk in _chunks(sorted(movie_ids & card_ids)):
+        expected = build_movie_cards(connection, chunk)
+        stored = connection.execute(select(card_table).where(card_table.c.id.in_(chunk)))
+        for row in stored:
+            if dict(row._mapping) != expected[row.id]:
+                report.stale.append(row.id)
+        report.checked += len(chunk)
+    return report
+
+
+def _movie_ids_shown_with(session: Session, instances: list) -> set[int]:
+    """IDs of movies whose cards show any of the given directors or genres."""
+    connection = session.connection()
+    ids: set[int] = set()
+    director_ids = [obj.id for obj in instances if isinstance(obj, Director)]
+    genre_ids = [obj.id for obj in instances if isinstance(obj, Genre)]
+    if director_ids:
+        stmt = select(Movie.id).where(Movie.director_id.in_(director_ids))
+        ids.update(connection.execute(stmt).scalars())
+    if genre_ids:
+        stmt = select(movie_genres.c.movie_id).where(movie_genres.c.genre_id.in_(genre_ids))
+        ids.update(connection.execute(stmt).scalars())
+    return ids
+
+
+@event.listens_for(Session, "before_flush")
+def _collect_stale_cards(session: Session, flush_context, instances) -> None:
+    # Renamed or deleted directors/genres change the cards of all their
+    # movies; look those up while the links still exist
+    changed = [
+        obj
+        for obj in session.dirty
+        if isinstance(obj, Director | Genre)
+        and obj.id is not None
+        and inspect(obj).attrs.name.history.has_changes()
+    ]
+    changed += [obj for obj in session.deleted if isinstance(obj, Director | Genre)]
+    if changed:
+        session.info.setdefault(_STALE_KEY, set()).update(_movie_ids_shown_with(session, changed))
+
+
+@event.listens_for(Session, "after_flush")
+def _refresh_stale_cards(session: Session, flush_context) -> None:
+    stale = session.info.pop(_STALE_KEY, set())
+    stale.update(
+        obj.id
+        for obj in (*session.new, *session.dirty, *session.deleted)
+        if isinstance(obj, Movie) and obj.id is not None
+    )
+    if stale:
+        refresh_movie_cards(session.connection(), stale)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_stale_cards(session: Session) -> None:
+    session.info.pop(_STALE_KEY, None)
+
+
+def main(argv: list[str] | None = None) -> int:
+    from app.db.session import engine
+
+    parser = argparse.ArgumentParser(description="Check or rebuild the movie list read model.")
+    parser.add_argument("command", choices=["check", "rebuild"])
+    parser.add_argument("--fix", action="store_true", help="Refresh cards that fail the check")
+    args = parser.parse_args(argv)
+
+    with engine.begin() as connection:
+        if args.command == "rebuild":
+            print(f"Rebuilt {rebuild_movie_cards(connection)} movie cards")
+            return 0
+
+        report = check_movie_cards(connection)
+        total = connection.execute(select(func.count()).select_from(card_table)).scalar()
+        print(
+            f"Checked {report.checked} of {total} cards: {len(report.missing)} missing, "
+            f"{len(report.orphaned)} orphaned, {len(report.stale)} stale"
+        )
+        if report.ok:
+            return 0
+        if args.fix:
+            refresh_movie_cards(connection, report.broken_ids)
+            print(f"Refreshed {len(report.broken_ids)} cards")
+            return 0
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,76 @@
+"""Read replica selection.
+
+Read-only routes take their session from ``get_read_db`` (or
+``get_async_read_db``), which picks one of the engines configured in
+``DATABASE_REPLICA_URLS`` round-robin. A replica whose connection fails the
+checkout health check is skipped for ``DB_REPLICA_RETRY_SECONDS``; when no
+replica is usable, or the request asks to read its own writes, the request
+is served by the primary (``DATABASE_URL``).
+"""
+
+import itertools
+import logging
+import threading
+import time
+from collections.abc import Sequence
+from typing import Any
+
+from starlette.requests import Request
+
+logger = logging.getLogger("app.db.replicas")
+
+# Request header pinning a request to the primary, e.g. right after a write
+READ_YOUR_WRITES_HEADER = "X-Read-Your-Writes"
+
+
+def wants_primary(request: Request) -> bool:
+    """Whether the request asked to read from the primary."""
+    value = request.headers.get(READ_YOUR_WRITES_HEADER)
+    return value is not None and value.strip().lower() not in ("", "0", "false", "no")
+
+
+class ReplicaSet:
+    """Round-robin over replica engines (sync or async), skipping recently failed ones."""
+
+    def __init__(self, engines: Sequence[Any], retry_after: float):
+        self.engines = list(engines)
+        self.retry_after = retry_after
+        self._turn = itertools.count()
+        self._lock = threading.Lock()
+        self._down_until: dict[int, float] = {}
+
+    def __len__(self) -> int:
+        return len(self.engines)
+
+    def _index(self, engine) -> int:
+        return next(index for index, candidate in enumerate(self.engines) if candidate is engine)
+
+    def candidates(self) -> list:
+        """Usable engines, starting with the next one in turn."""
+        if not self.engines:
+            return []
+        with self._lock:
+            start = next(self._turn) % len(self.engines)
+        now = time.monotonic()
+        order = list(range(start, len(self.engines))) + list(range(start))
+        return [self.engines[index] for index in order if self._down_until.get(index, 0.0) <= now]
+
+    def mark_down(self, engine, error: Exception) -> None:
+        """Skip ``engine`` for ``retry_after`` seconds after a failed health check."""
+        index = self._index(engine)
+        self._down_until[index] = time.monotonic() + self.retry_after
+        logger.warning("read replica %d unavailable: %s", index, error.__class__.__name__)
+
+    def mark_up(self, engine) -> None:
+        self._down_until.pop(self._index(engine), None)
+
+    def status(self) -> list[dict]:
+        """Health of each replica, for /health/replicas."""
+        now = time.monotonic()
+        return [
+            {
+                "url": engine.url.render_as_string(hide_password=True),
+                "healthy": self._down_until.get(index, 0.0) <= now,
+            }
+            for index, engine in enumerate(self.engines)
+        ]
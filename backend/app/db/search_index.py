@@ -0,0 +1,104 @@
+"""Full-text index on movie titles.
+
+SQLite uses an external-content FTS5 table (``movies_fts``) kept in sync with
+``movies`` by triggers. Postgres uses a GIN index over
+``to_tsvector('simple', title)``, which the planner keeps current on its own.
+"""
+
+import sqlite3
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection, Engine
+
+from app.core.config import settings
+
+SQLITE_FTS_TABLE = "movies_fts"
+POSTGRES_TSVECTOR = "to_tsvector('simple', title)"
+
+_SQLITE_TRIGGERS = [
+    f"""
+    CREATE TRIGGER IF NOT EXISTS movies_fts_ai AFTER INSERT ON movies BEGIN
+        INSERT INTO {SQLITE_FTS_TABLE}(rowid, title) VALUES (new.id, new.title);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS movies_fts_ad AFTER DELETE ON movies BEGIN
+        INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}, rowid, title)
+        VALUES ('delete', old.id, old.title);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS movies_fts_au AFTER UPDATE OF title ON movies BEGIN
+        INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}, rowid, title)
+        VALUES ('delete', old.id, old.title);
+        INSERT INTO {SQLITE_FTS_TABLE}(rowid, title) VALUES (new.id, new.title);
+    END
+    """,
+]
+
+
+def sqlite_tokenizer() -> str:
+    """Return the FTS5 tokenizer to use, falling back when trigram is unavailable."""
+    tokenizer = settings.SEARCH_SQLITE_TOKENIZER
+    if tokenizer == "trigram" and sqlite3.sqlite_version_info < (3, 34, 0):
+        return "unicode61"
+    return tokenizer
+
+
+def _create_sqlite_index(connection: Connection) -> None:
+    tokenizer = sqlite_tokenizer()
+    # Prefix indexes make "term*" queries cheap for word-based tokenizers
+    prefix = "" if tokenizer == "trigram" else ", prefix='2 3'"
+    connection.execute(
+        text(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {SQLITE_FTS_TABLE} USING fts5("
+            f"title, content='movies', content_rowid='id', tokenize='{tokenizer}'{prefix})"
+        )
+    )
+    for trigger in _SQLITE_TRIGGERS:
+        connection.execute(text(trigger))
+
+
+def create_search_index(target, connection: Connection, **kw) -> None:
+    """Create the title search index after the ``movies`` table is created."""
+    dialect = connection.dialect.name
+    if dialect == "sqlite":
+        _create_sqlite_index(connection)
+        rebuild_search_index(connection)
+    elif dialect == "postgresql":
+        connection.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS ix_movies_title_tsv "
+                f"ON movies USING GIN ({POSTGRES_TSVECTOR})"
+            )
+        )
+
+
+def drop_search_index(target, connection: Connection, **kw) -> None:
+    """Drop the SQLite FTS table before ``movies`` is dropped."""
+    if connection.dialect.name == "sqlite":
+        connection.execute(text(f"DROP TABLE IF EXISTS {SQLITE_FTS_TABLE}"))
+
+
+def rebuild_search_index(connection: Connection) -> None:
+    """Repopulate the SQLite FTS table from ``movies`` (no-op elsewhere)."""
+    if connection.dialect.name == "sqlite":
+        connection.execute(
+            text(f"INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}) VALUES ('rebuild')")
+        )
+
+
+def ensure_search_index(engine: Engine) -> None:
+    """
+    Create the search index on databases created before it existed.
+
+    Idempotent; the index is only rebuilt when it had to be created.
+    """
+    with engine.begin() as connection:
+        if connection.dialect.name == "sqlite":
+            if SQLITE_FTS_TABLE in inspect(connection).get_table_names():
+                return
+            _create_sqlite_index(connection)
+            rebuild_search_index(connection)
+        else:
+            create_search_index(None, connection)
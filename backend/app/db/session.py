@@ -1,12 +1,193 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+import logging
+import sqlite3
+import time
 
-from app.core.config import settings
+from fastapi import Depends, Request
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import QueuePool
 
-engine = create_engine(
-    settings.DATABASE_URL,
-    connect_args={"check_same_thread": False} if "sqlite" in settings.DATABASE_URL else {},
+from app.core.config import settings
+from app.core.metrics import RequestStats, current_request_stats
+from app.db import (
+    catalogue_events,  # noqa: F401  (registers cache invalidation hooks)
+    read_model,  # noqa: F401  (registers read model refresh hooks)
 )
+from app.db.replicas import ReplicaSet, wants_primary
+
+slow_query_logger = logging.getLogger("app.db.slow_query")
+
+# Longest bind parameter repr written to the slow query log
+SLOW_QUERY_PARAMS_MAX_CHARS = 1000
+
+_QUERY_STARTED_KEY = "query_started"
+
+
+def is_sqlite_memory(url: str) -> bool:
+    parsed = make_url(url)
+    return parsed.get_backend_name() == "sqlite" and parsed.database in (None, "", ":memory:")
+
+
+def pool_options(url: str) -> dict:
+    """Pool arguments from settings; in-memory SQLite keeps its single-connection pool."""
+    if is_sqlite_memory(url):
+        return {}
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+
+def connect_options(url: str) -> dict:
+    backend = make_url(url).get_backend_name()
+    if backend == "sqlite":
+        return {"check_same_thread": False}
+    if backend == "postgresql" and settings.DB_STATEMENT_TIMEOUT_MS:
+        return {"options": f"-c statement_timeout={settings.DB_STATEMENT_TIMEOUT_MS}"}
+    return {}
+
+
+def apply_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """
+    Tune each new SQLite connection.
+
+    WAL lets readers proceed while a writer commits, and synchronous=NORMAL is
+    durable under WAL except for the last transactions on power loss. The page
+    cache and memory map keep hot pages out of the read() path.
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        try:
+            cursor.execute(f"PRAGMA journal_mode={settings.SQLITE_JOURNAL_MODE}")
+        except sqlite3.OperationalError:
+            # The journal mode belongs to the database file; read-only
+            # connections (e.g. replicas opened with mode=ro) keep the file's mode
+            pass
+        cursor.execute(f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}")
+        cursor.execute(f"PRAGMA cache_size=-{int(settings.SQLITE_CACHE_SIZE_KB)}")
+        cursor.execute(f"PRAGMA mmap_size={int(settings.SQLITE_MMAP_SIZE)}")
+        cursor.execute(f"PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT_MS)}")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+    finally:
+        cursor.close()
+
+
+def configure_engine(engine: Engine) -> Engine:
+    """Install per-connection hooks on a (sync) engine."""
+    if engine.dialect.name == "sqlite":
+        event.listen(engine, "connect", apply_sqlite_pragmas)
+    return engine
+
+
+def normalize_statement(statement: str) -> str:
+    """Collapse whitespace so one statement logs as one line."""
+    return " ".join(statement.split())
+
+
+class _RowCountingCursor:
+    """DB-API cursor proxy adding the rows fetched through it to a request's stats."""
+
+    __slots__ = ("_cursor", "_stats")
+
+    def __init__(self, cursor, stats: RequestStats):
+        object.__setattr__(self, "_cursor", cursor)
+        object.__setattr__(self, "_stats", stats)
+
+    def __getattr__(self, name: str):
+        return getattr(self._cursor, name)
+
+    def __setattr__(self, name: str, value) -> None:
+        setattr(self._cursor, name, value)
+
+    def fetchone(self):
+        row = self._cursor.fetchone()
+        if row is not None:
+            self._stats.rows += 1
+        return row
+
+    def fetchmany(self, *args, **kwargs):
+        rows = self._cursor.fetchmany(*args, **kwargs)
+        self._stats.rows += len(rows)
+        return rows
+
+    def fetchall(self):
+        rows = self._cursor.fetchall()
+        self._stats.rows += len(rows)
+        return rows
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_query_timer(conn, cursor, statement, parameters, context, executemany) -> None:
+    conn.info.setdefault(_QUERY_STARTED_KEY, []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _record_query(conn, cursor, statement, parameters, context, executemany) -> None:
+    elapsed = time.perf_counter() - conn.info[_QUERY_STARTED_KEY].pop()
+
+    stats = current_request_stats.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.db_seconds += elapsed
+        if context is not None and cursor.description is not None:
+            # Count rows as the result fetches them, whether the ORM, a Core
+            # select or a column select reads it (SQLite reports no rowcount)
+            context.cursor = _RowCountingCursor(cursor, stats)
+        elif context is not None and (context.isinsert or context.isupdate or context.isdelete):
+            stats.rows += max(cursor.rowcount, 0)
+
+    threshold = settings.SLOW_QUERY_LOG_MS
+    if threshold is not None and elapsed * 1000 >= threshold:
+        slow_query_logger.warning(
+            "slow query (%.1f ms): %s; parameters: %s",
+            elapsed * 1000,
+            normalize_statement(statement),
+            repr(parameters)[:SLOW_QUERY_PARAMS_MAX_CHARS],
+        )
+
+
+@event.listens_for(Engine, "handle_error")
+def _discard_query_timer(exception_context) -> None:
+    connection = exception_context.connection
+    if connection is not None and connection.info.get(_QUERY_STARTED_KEY):
+        connection.info[_QUERY_STARTED_KEY].pop()
+
+
+def create_db_engine(url: str) -> Engine:
+    """Create an engine with the configured pool and connection settings."""
+    engine = create_engine(url, connect_args=connect_options(url), **pool_options(url))
+    return configure_engine(engine)
+
+
+def pool_status(engine: Engine) -> dict:
+    """
+    Report connection usage of an engine's pool.
+
+    Returns:
+        Dictionary with the pool class and, for queue pools, configured size,
+        idle (checked in), in-use (checked out) and overflow connections
+    """
+    pool = engine.pool
+    status = {"pool": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        status.update(
+            {
+                "size": pool.size(),
+                "max_overflow": pool._max_overflow,
+                "checked_in": pool.checkedin(),
+                "checked_out": pool.checkedout(),
+                "overflow": max(pool.overflow(), 0),
+            }
+        )
+    return status
+
+
+engine = create_db_engine(settings.DATABASE_URL)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -17,3 +198,38 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+read_replicas = ReplicaSet(
+    [create_db_engine(url) for url in settings.DATABASE_REPLICA_URLS],
+    retry_after=settings.DB_REPLICA_RETRY_SECONDS,
+)
+
+ReplicaSessionLocal = sessionmaker(autocommit=False, autoflush=False)
+
+
+def get_read_db(request: Request, db: Session = Depends(get_db)):
+    """
+    Session for read-only routes: a healthy replica, or the primary session.
+
+    The primary is used when no replica is configured or usable, and for
+    requests sent with ``X-Read-Your-Writes: 1``. Building on :func:`get_db`
+    keeps dependency overrides of the primary session in effect.
+    """
+    if read_replicas and not wants_primary(request):
+        for replica in read_replicas.candidates():
+            replica_db = ReplicaSessionLocal(bind=replica)
+            try:
+                # Health check: check out a connection (pre-pinged when enabled)
+                replica_db.connection()
+            except SQLAlchemyError as exc:
+                replica_db.close()
+                read_replicas.mark_down(replica, exc)
+                continue
+            read_replicas.mark_up(replica)
+            try:
+                yield replica_db
+            finally:
+                replica_db.close()
+            return
+    yield db
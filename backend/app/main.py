@@ -1,18 +1,17 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 
 from app.api.v1.api import api_router
-from app.db.base import Base
-from app.db.init_db import seed_data
+from app.core.compression import CompressionMiddleware
+from app.core.config import settings
+from app.core.json import FastJSONResponse
+from app.core.metrics import registry
+from app.core.middleware import MetricsMiddleware
+from app.db.bootstrap import bootstrap_database
 from app.db.session import engine
 
-# Import all models so SQLAlchemy can discover them
-from app.models.actor import Actor  # noqa: F401
-from app.models.director import Director  # noqa: F401
-from app.models.genre import Genre  # noqa: F401
-from app.models.movie import Movie  # noqa: F401
-
-app = FastAPI(title="Movie Explorer API")
+app = FastAPI(title="Movie Explorer API", default_response_class=FastJSONResponse)
 
 # CORS middleware
 app.add_middleware(
@@ -23,26 +22,39 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(CompressionMiddleware)
+
+# Added last so it wraps compression and counts the bytes actually sent
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
 # Include API router
 app.include_router(api_router, prefix="/api/v1")
 
 
+@app.get("/metrics", include_in_schema=False, response_class=PlainTextResponse)
+def metrics():
+    """
+    Request and SQL metrics of this worker process in the Prometheus text format.
+
+    Includes per-route latency histograms, request counts by status, response
+    bytes, the SQL statements, database time and rows each route used, and
+    the bytes in and out and CPU time of response compression.
+    """
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
+
+
 @app.on_event("startup")
 def on_startup():
     """
     Initialize database on application startup.
 
     Creates all database tables if they don't exist and seeds initial data.
-    This runs automatically when the FastAPI application starts.
+    Backfilling derived tables of an existing catalogue is left to
+    ``python -m app.db.bootstrap``. Deployments running several workers should
+    set DB_BOOTSTRAP_ON_STARTUP=false and run that command once instead, so
+    workers start without touching the database.
     """
-    # Create tables
-    Base.metadata.create_all(bind=engine)
-
-    # Seed data
-    from app.db.session import SessionLocal
-
-    db = SessionLocal()
-    try:
-        seed_data(db)
-    finally:
-        db.close()
+    if settings.DB_BOOTSTRAP_ON_STARTUP:
+        bootstrap_database(engine, backfill=False)
@@ -0,0 +1,19 @@
+from sqlalchemy import Column, Integer
+
+from app.db.base import Base
+
+
+class ActorCostar(Base):
+    """
+    Precomputed co-stars: the actors sharing the most movies with each actor.
+
+    The primary key serves the lookup of one actor's co-stars in rank order.
+    Maintained by :mod:`app.db.neighbours`.
+    """
+
+    __tablename__ = "actor_costars"
+
+    actor_id = Column(Integer, primary_key=True)
+    rank = Column(Integer, primary_key=True)
+    costar_id = Column(Integer, nullable=False)
+    shared_movies = Column(Integer, nullable=False)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, ForeignKey, Integer, Table
+from sqlalchemy import Column, ForeignKey, Index, Integer, Table
 
 from app.db.base import Base
 
@@ -7,6 +7,8 @@ movie_actors = Table(
     Base.metadata,
     Column("movie_id", Integer, ForeignKey("movies.id"), primary_key=True),
     Column("actor_id", Integer, ForeignKey("actors.id"), primary_key=True),
+    # The primary key serves movie -> actors; this serves actor -> movies
+    Index("ix_movie_actors_actor_id_movie_id", "actor_id", "movie_id"),
 )
 
 movie_genres = Table(
@@ -14,4 +16,6 @@ movie_genres = Table(
     Base.metadata,
     Column("movie_id", Integer, ForeignKey("movies.id"), primary_key=True),
     Column("genre_id", Integer, ForeignKey("genres.id"), primary_key=True),
+    # The primary key serves movie -> genres; this serves genre -> movies
+    Index("ix_movie_genres_genre_id_movie_id", "genre_id", "movie_id"),
 )
@@ -0,0 +1,17 @@
+from sqlalchemy import Column, Integer, event, insert
+
+from app.db.base import Base
+
+
+class CatalogueRevision(Base):
+    """Single-row counter bumped by every transaction that changes the catalogue."""
+
+    __tablename__ = "catalogue_revision"
+
+    id = Column(Integer, primary_key=True)
+    revision = Column(Integer, nullable=False, default=0)
+
+
+@event.listens_for(CatalogueRevision.__table__, "after_create")
+def _insert_revision_row(target, connection, **kw) -> None:
+    connection.execute(insert(target).values(id=1, revision=0))
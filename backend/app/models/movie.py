@@ -1,7 +1,8 @@
-from sqlalchemy import Column, Float, ForeignKey, Integer, String
+from sqlalchemy import Column, Float, ForeignKey, Index, Integer, String, event
 from sqlalchemy.orm import relationship
 
 from app.db.base import Base
+from app.db.search_index import create_search_index, drop_search_index
 from app.models.associations import movie_actors, movie_genres
 
 
@@ -10,10 +11,21 @@ class Movie(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, nullable=False, index=True)
-    release_year = Column(Integer, nullable=False, index=True)
-    rating = Column(Float, nullable=False)
+    release_year = Column(Integer, nullable=False)
+    rating = Column(Float, nullable=False, index=True)
     director_id = Column(Integer, ForeignKey("directors.id"), nullable=False)
 
+    # Filter + sort indexes for the movie list; (release_year, rating) also
+    # serves plain release_year lookups, so the single-column index is gone
+    __table_args__ = (
+        Index("ix_movies_release_year_rating", "release_year", "rating"),
+        Index("ix_movies_director_id_release_year", "director_id", "release_year"),
+    )
+
     director = relationship("Director", back_populates="movies")
     actors = relationship("Actor", secondary=movie_actors, back_populates="movies")
     genres = relationship("Genre", secondary=movie_genres, back_populates="movies")
+
+
+event.listen(Movie.__table__, "after_create", create_search_index)
+event.listen(Movie.__table__, "before_drop", drop_search_index)
@@ -0,0 +1,29 @@
+from sqlalchemy import JSON, Column, Float, Index, Integer, String
+
+from app.db.base import Base
+
+
+class MovieListCard(Base):
+    """
+    Denormalized read model: one pre-serialized ``MovieListItem`` per movie.
+
+    Filter and sort columns are copied from ``movies`` under the same names,
+    so the movie list filters and sort keys apply unchanged. Maintained by
+    :mod:`app.db.read_model`.
+    """
+
+    __tablename__ = "movie_list_cards"
+
+    id = Column(Integer, primary_key=True)
+    title = Column(String, nullable=False)
+    release_year = Column(Integer, nullable=False)
+    rating = Column(Float, nullable=False)
+    director_id = Column(Integer, nullable=False)
+    payload = Column(JSON, nullable=False)
+
+    __table_args__ = (
+        Index("ix_movie_list_cards_release_year_rating", "release_year", "rating"),
+        Index("ix_movie_list_cards_director_id_release_year", "director_id", "release_year"),
+        Index("ix_movie_list_cards_rating", "rating"),
+        Index("ix_movie_list_cards_title", "title"),
+    )
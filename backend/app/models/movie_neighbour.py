@@ -0,0 +1,22 @@
+from sqlalchemy import Column, Float, Index, Integer
+
+from app.db.base import Base
+
+
+class MovieNeighbour(Base):
+    """
+    Precomputed "related movies": the best scored neighbours of each movie.
+
+    The primary key serves the lookup of one movie's neighbours in rank
+    order; the neighbour index finds the lists naming a movie whose links
+    changed. Maintained by :mod:`app.db.neighbours`.
+    """
+
+    __tablename__ = "movie_neighbours"
+
+    movie_id = Column(Integer, primary_key=True)
+    rank = Column(Integer, primary_key=True)
+    neighbour_id = Column(Integer, nullable=False)
+    score = Column(Float, nullable=False)
+
+    __table_args__ = (Index("ix_movie_neighbours_neighbour_id", "neighbour_id"),)
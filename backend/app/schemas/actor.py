@@ -10,9 +10,30 @@ class ActorListItem(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class Costar(BaseModel):
+    id: int
+    name: str
+    shared_movies: int
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ActorSummary(BaseModel):
+    id: int
+    name: str
+    movie_count: int
+    average_rating: float | None
+    first_year: int | None
+    last_year: int | None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
 class ActorDetail(BaseModel):
     id: int
     name: str
     movies: list[MovieReference]
+    # Cursor for /{people}/{id}/movies when more movies exist than embedded
+    movies_next_cursor: str | None = None
 
     model_config = ConfigDict(from_attributes=True)
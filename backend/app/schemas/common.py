@@ -7,4 +7,15 @@ T = TypeVar("T")
 
 class PaginatedResponse(BaseModel, Generic[T]):
     items: list[T]
-    total: int
+    total: int | None
+    total_is_estimate: bool = False
+    next_cursor: str | None = None
+
+
+class BatchRequest(BaseModel):
+    ids: list[int]
+
+
+class BatchResponse(BaseModel, Generic[T]):
+    items: list[T]
+    missing: list[int]
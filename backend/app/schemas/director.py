@@ -3,9 +3,22 @@ from pydantic import BaseModel, ConfigDict
 from app.schemas.movie import MovieReference
 
 
+class DirectorSummary(BaseModel):
+    id: int
+    name: str
+    movie_count: int
+    average_rating: float | None
+    first_year: int | None
+    last_year: int | None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
 class DirectorDetail(BaseModel):
     id: int
     name: str
     movies: list[MovieReference]
+    # Cursor for /{people}/{id}/movies when more movies exist than embedded
+    movies_next_cursor: str | None = None
 
     model_config = ConfigDict(from_attributes=True)
@@ -52,3 +52,24 @@ class MovieDetail(BaseModel):
     actors: list[ActorInfo]
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class FacetCount(BaseModel):
+    id: int
+    name: str
+    count: int
+
+
+class ReleaseYearCount(BaseModel):
+    release_year: int
+    count: int
+
+
+class MovieFacets(BaseModel):
+    total: int
+    genres: list[FacetCount]
+    directors: list[FacetCount]
+    # Directors are capped at MAX_FACET_VALUES; movies of the ones left out
+    directors_truncated: bool = False
+    directors_other_count: int = 0
+    release_years: list[ReleaseYearCount]
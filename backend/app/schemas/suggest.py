@@ -0,0 +1,9 @@
+from pydantic import BaseModel
+
+from app.schemas.movie import ActorInfo, DirectorInfo, MovieReference
+
+
+class Suggestions(BaseModel):
+    movies: list[MovieReference]
+    actors: list[ActorInfo]
+    directors: list[DirectorInfo]
@@ -1,15 +1,84 @@
 """Actor service layer for business logic related to actors."""
 
+from collections.abc import Sequence
+from typing import Literal
+
+from sqlalchemy import Row, Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
 from app.models.actor import Actor
-from app.models.genre import Genre
+from app.models.actor_costar import ActorCostar
+from app.models.associations import movie_actors, movie_genres
 from app.models.movie import Movie
+from app.services.batch import in_request_order
+from app.services.filmography import (
+    SummarySort,
+    embedded_movies_statement,
+    movie_aggregates,
+    summary_sort,
+    with_embedded_movies,
+)
+from app.services.filters import link_filter
+from app.services.pagination import SortOrder, column_sort
+
+
+def build_actors_statement(
+    movie_id: int | None = None, genre_id: int | None = None, stmt: Select | None = None
+) -> Select:
+    """
+    Build the filtered actor statement shared by the sync and async services.
+
+    Args:
+        movie_id: Filter by movie ID (optional)
+        genre_id: Filter by genre ID (optional)
+        stmt: Statement selecting from ``actors`` to filter; defaults to Actor entities
+
+    Returns:
+        Statement selecting matching actors, each at most once (semi-joins, no DISTINCT)
+    """
+    if stmt is None:
+        stmt = select(Actor)
+
+    if movie_id:
+        stmt = stmt.where(
+            link_filter(Actor.id, movie_actors.c.actor_id, movie_actors.c.movie_id, [movie_id])
+        )
+
+    if genre_id:
+        movies_in_genre = select(movie_genres.c.movie_id).where(movie_genres.c.genre_id == genre_id)
+        stmt = stmt.where(
+            Actor.id.in_(
+                select(movie_actors.c.actor_id).where(movie_actors.c.movie_id.in_(movies_in_genre))
+            )
+        )
+
+    return stmt
+
+
+# Columns of an actor list item; rows are serialized without loading entities
+ACTOR_LIST_COLUMNS = (Actor.id, Actor.name)
+
+# Columns the actor list can be sorted by (ties are broken by id)
+ActorSort = Literal["id", "name"]
+
+
+def _sorted_actors(
+    movie_id: int | None, genre_id: int | None, sort: ActorSort, order: SortOrder
+) -> Select:
+    sort_key = column_sort(sort, getattr(Actor, sort), Actor.id, order)
+    stmt = build_actors_statement(movie_id, genre_id, select(*ACTOR_LIST_COLUMNS))
+    return stmt.order_by(*sort_key.order_by())
 
 
 def get_actors(
-    db: Session, movie_id: int | None = None, genre_id: int | None = None
-) -> list[Actor]:
+    db: Session,
+    movie_id: int | None = None,
+    genre_id: int | None = None,
+    sort: ActorSort = "id",
+    order: SortOrder = "asc",
+) -> list[Row]:
     """
     Retrieve actors with optional filtering.
 
@@ -20,21 +89,206 @@ def get_actors(
         db: Database session
         movie_id: Filter by movie ID - returns actors who acted in this movie (optional)
         genre_id: Filter by genre ID - returns actors who acted in movies of this genre (optional)
+        sort: "id" or "name", served by the primary key and the name index;
+            ties are broken by id
+        order: "asc" or "desc"
 
     Returns:
-        List of Actor objects matching the filters
+        List of (id, name) rows of the matching actors
     """
-    query = db.query(Actor)
+    return list(db.execute(_sorted_actors(movie_id, genre_id, sort, order)).all())
 
-    if movie_id:
-        query = query.join(Actor.movies).filter(Movie.id == movie_id)
 
-    if genre_id:
-        query = (
-            query.join(Actor.movies)
-            .join(Movie.genres)
-            .filter(Genre.id == genre_id)
-            .distinct()
-        )
+async def get_actors_async(
+    db: AsyncSession,
+    movie_id: int | None = None,
+    genre_id: int | None = None,
+    sort: ActorSort = "id",
+    order: SortOrder = "asc",
+) -> list[Row]:
+    """Async counterpart of :func:`get_actors`."""
+    return list((await db.execute(_sorted_actors(movie_id, genre_id, sort, order))).all())
+
+
+def _actor_summaries(
+    movie_id: int | None, genre_id: int | None, sort: SummarySort, order: SortOrder
+) -> Select:
+    aggregates = movie_aggregates()
+    stmt = (
+        select(Actor.id, Actor.name, *aggregates)
+        .outerjoin(movie_actors, movie_actors.c.actor_id == Actor.id)
+        .outerjoin(Movie, Movie.id == movie_actors.c.movie_id)
+        .group_by(Actor.id, Actor.name)
+    )
+    stmt = build_actors_statement(movie_id, genre_id, stmt)
+    return stmt.order_by(*summary_sort(Actor, aggregates, sort, order).order_by())
+
+
+def get_actor_summaries(
+    db: Session,
+    movie_id: int | None = None,
+    genre_id: int | None = None,
+    sort: SummarySort = "id",
+    order: SortOrder = "asc",
+) -> list[Row]:
+    """
+    Retrieve actors with aggregates over their filmographies, in one grouped query.
+
+    Takes the filters of :func:`get_actors`; aggregates always cover every
+    movie of the matching actors.
+
+    Args:
+        db: Database session
+        movie_id: Filter by movie ID (optional)
+        genre_id: Filter by genre ID (optional)
+        sort: "id", "name" or one of the aggregates; ties are broken by id
+        order: "asc" or "desc"
+
+    Returns:
+        List of (id, name, movie_count, average_rating, first_year, last_year)
+        rows; actors without movies have a count of 0 and null aggregates
+    """
+    return list(db.execute(_actor_summaries(movie_id, genre_id, sort, order)).all())
+
+
+async def get_actor_summaries_async(
+    db: AsyncSession,
+    movie_id: int | None = None,
+    genre_id: int | None = None,
+    sort: SummarySort = "id",
+    order: SortOrder = "asc",
+) -> list[Row]:
+    """Async counterpart of :func:`get_actor_summaries`."""
+    return list((await db.execute(_actor_summaries(movie_id, genre_id, sort, order))).all())
+
+
+def get_actor_summary(db: Session, actor_id: int) -> Row | None:
+    """Retrieve the :func:`get_actor_summaries` row of one actor, or None if not found."""
+    stmt = _actor_summaries(None, None, "id", "asc").where(Actor.id == actor_id)
+    return db.execute(stmt).first()
+
+
+async def get_actor_summary_async(db: AsyncSession, actor_id: int) -> Row | None:
+    """Async counterpart of :func:`get_actor_summary`."""
+    stmt = _actor_summaries(None, None, "id", "asc").where(Actor.id == actor_id)
+    return (await db.execute(stmt)).first()
+
+
+def actor_exists(db: Session, actor_id: int) -> bool:
+    """Whether an actor with this ID exists."""
+    return db.execute(select(Actor.id).where(Actor.id == actor_id)).first() is not None
+
+
+async def actor_exists_async(db: AsyncSession, actor_id: int) -> bool:
+    """Async counterpart of :func:`actor_exists`."""
+    return (await db.execute(select(Actor.id).where(Actor.id == actor_id))).first() is not None
+
+
+def _actor_statement(actor_id: int) -> Select:
+    return select(Actor.id, Actor.name).where(Actor.id == actor_id)
+
+
+def get_actor_by_id(
+    db: Session, actor_id: int, movies_limit: int = settings.EMBEDDED_MOVIES_LIMIT
+) -> dict | None:
+    """
+    Retrieve a single actor by ID with the start of their filmography.
+
+    Args:
+        db: Database session
+        actor_id: The ID of the actor to retrieve
+        movies_limit: Most movies embedded, by release year
+
+    Returns:
+        Actor dict (see :func:`~app.services.filmography.with_embedded_movies`)
+        if found, None otherwise
+    """
+    actor = db.execute(_actor_statement(actor_id)).first()
+    if actor is None:
+        return None
+    stmt = embedded_movies_statement(movie_actors.c.actor_id, movies_limit, [actor_id])
+    return with_embedded_movies([actor], db.execute(stmt).all(), movies_limit)[0]
+
+
+async def get_actor_by_id_async(
+    db: AsyncSession, actor_id: int, movies_limit: int = settings.EMBEDDED_MOVIES_LIMIT
+) -> dict | None:
+    """Async counterpart of :func:`get_actor_by_id`."""
+    actor = (await db.execute(_actor_statement(actor_id))).first()
+    if actor is None:
+        return None
+    stmt = embedded_movies_statement(movie_actors.c.actor_id, movies_limit, [actor_id])
+    return with_embedded_movies([actor], (await db.execute(stmt)).all(), movies_limit)[0]
+
+
+def get_actors_by_ids(db: Session, ids: Sequence[int]) -> tuple[list[dict], list[int]]:
+    """
+    Retrieve several actors with the start of their filmographies in two queries.
+
+    Each actor embeds the same movies as ``GET /actors/{id}`` with the
+    default ``moviesLimit``.
+
+    Args:
+        db: Database session
+        ids: IDs of the actors to retrieve, without duplicates
+
+    Returns:
+        Tuple of (actor dicts in the order of ``ids``, IDs that do not exist)
+    """
+    actors, missing = in_request_order(
+        db.execute(select(Actor.id, Actor.name).where(Actor.id.in_(ids))), ids
+    )
+    limit = settings.EMBEDDED_MOVIES_LIMIT
+    rows = db.execute(embedded_movies_statement(movie_actors.c.actor_id, limit, ids)).all()
+    return with_embedded_movies(actors, rows, limit), missing
+
+
+async def get_actors_by_ids_async(
+    db: AsyncSession, ids: Sequence[int]
+) -> tuple[list[dict], list[int]]:
+    """Async counterpart of :func:`get_actors_by_ids`."""
+    actors, missing = in_request_order(
+        await db.execute(select(Actor.id, Actor.name).where(Actor.id.in_(ids))), ids
+    )
+    limit = settings.EMBEDDED_MOVIES_LIMIT
+    rows = (await db.execute(embedded_movies_statement(movie_actors.c.actor_id, limit, ids))).all()
+    return with_embedded_movies(actors, rows, limit), missing
+
+
+def _costars_statement(actor_id: int) -> Select:
+    return (
+        select(Actor.id, Actor.name, ActorCostar.shared_movies)
+        .join(ActorCostar, ActorCostar.costar_id == Actor.id)
+        .where(ActorCostar.actor_id == actor_id)
+        .order_by(ActorCostar.rank)
+    )
+
+
+def get_costars(db: Session, actor_id: int) -> list[Row] | None:
+    """
+    Retrieve the actors who shared the most movies with an actor.
+
+    Reads the precomputed ``actor_costars`` rows (see :mod:`app.db.neighbours`)
+    with one lookup on their primary key; only an empty result costs a second
+    query, to tell an unknown actor apart.
+
+    Args:
+        db: Database session
+        actor_id: The ID of the actor
+
+    Returns:
+        List of (id, name, shared_movies) rows, most shared movies first, or
+        None if the actor does not exist
+    """
+    costars = list(db.execute(_costars_statement(actor_id)).all())
+    if not costars and not actor_exists(db, actor_id):
+        return None
+    return costars
+
 
-    return query.all()
+async def get_costars_async(db: AsyncSession, actor_id: int) -> list[Row] | None:
+    """Async counterpart of :func:`get_costars`."""
+    costars = list((await db.execute(_costars_statement(actor_id))).all())
+    if not costars and not await actor_exists_async(db, actor_id):
+        return None
+    return costars
@@ -0,0 +1,23 @@
+"""Helpers for loading entities by a client-supplied list of IDs."""
+
+from collections.abc import Iterable, Sequence
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+def in_request_order(entities: Iterable[T], ids: Sequence[int]) -> tuple[list[T], list[int]]:
+    """
+    Arrange entities loaded with ``id IN (...)`` in the order they were requested.
+
+    Args:
+        entities: Loaded entities with an ``id`` attribute, in any order
+        ids: Requested IDs without duplicates
+
+    Returns:
+        Tuple of (entities in the order of ``ids``, requested IDs that were not found)
+    """
+    by_id = {entity.id: entity for entity in entities}
+    found = [by_id[entity_id] for entity_id in ids if entity_id in by_id]
+    missing = [entity_id for entity_id in ids if entity_id not in by_id]
+    return found, missing
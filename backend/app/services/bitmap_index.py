@@ -0,0 +1,374 @@
+"""In-memory bitmap index over the filterable movie columns.
+
+The filter and sort columns of the whole catalogue fit comfortably in RAM, so
+instead of sending every ``genreId``/``actorId``/``directorId``/``releaseYear``
+combination to the database as a new multi-join statement, the index answers
+it by intersecting precomputed sets and the database only hydrates the page.
+
+Movies are numbered by position in ID order. Dense sets (one per genre and per
+release year, each covering a sizable share of the catalogue) are bitsets held
+in Python integers, so AND/OR/popcount run over machine words in C. Sparse
+sets (one per actor and per director, a handful of movies each) are sorted
+position arrays, which keeps tens of thousands of them small. Ratings, years
+and titles are kept per position, with one precomputed ordering per sort
+column.
+
+The index is tagged with the catalogue revision it was built at. The first
+request that sees another revision starts a rebuild in a background thread,
+so neither it nor the event loop of async workers waits for the full scan;
+requests use the SQL path until the new index is in place.
+"""
+
+import logging
+import re
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
+
+from sqlalchemy import select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.db.async_session import to_sync_url
+from app.db.catalogue_events import get_catalogue_revision
+from app.db.session import create_db_engine, is_sqlite_memory
+from app.models.associations import movie_actors, movie_genres
+from app.models.movie import Movie
+from app.services.filters import MatchMode
+
+logger = logging.getLogger("app.services.bitmap_index")
+
+# Results up to this size are materialized as a position list and sorted;
+# larger ones are paged by walking the precomputed ordering of the sort column
+SMALL_RESULT = 4096
+
+_NONZERO_BYTE = re.compile(rb"[^\x00]")
+
+_EMPTY = array("I")
+
+# Offsets of the set bits of every byte value
+_BYTE_BITS = [tuple(bit for bit in range(8) if value >> bit & 1) for value in range(256)]
+
+
+def _to_bitset(positions: Iterable[int], size: int) -> int:
+    buffer = bytearray((size + 7) // 8)
+    for position in positions:
+        buffer[position >> 3] |= 1 << (position & 7)
+    return int.from_bytes(buffer, "little")
+
+
+def _union(sets: Iterable[int]) -> int:
+    union = 0
+    for bits in sets:
+        union |= bits
+    return union
+
+
+@dataclass
+class Selection:
+    """Movies matching a filter: a sorted position list or a bitset."""
+
+    count: int
+    positions: list[int] | None = None
+    bits: bytes | None = None
+
+    def __contains__(self, position: int) -> bool:
+        return self.bits[position >> 3] >> (position & 7) & 1
+
+
+class MovieBitmapIndex:
+    """Filter and sort columns of every movie, indexed by position."""
+
+    def __init__(
+        self,
+        revision: int,
+        ids: array,
+        director_ids: array,
+        release_years: array,
+        ratings: array,
+        titles: list[str],
+        genre_links: Iterable[tuple[int, int]],
+        actor_links: Iterable[tuple[int, int]],
+    ):
+        """
+        Build the index from column values in ID order and (movie, value) links.
+
+        Links must be ordered by (value, movie_id).
+        """
+        self.revision = revision
+        self.ids = ids
+        self.size = len(ids)
+        self._nbytes = (self.size + 7) // 8
+        self._all = (1 << self.size) - 1
+        position_of = {movie_id: position for position, movie_id in enumerate(ids)}
+
+        self._values = {"release_year": release_years, "rating": ratings, "title": titles}
+        # Positions sorted by (value, id): positions are in ID order and the sort is stable
+        self._orderings = {
+            name: array("I", sorted(range(self.size), key=values.__getitem__))
+            for name, values in self._values.items()
+        }
+
+        self._year_bits = {
+            year: _to_bitset(positions, self.size)
+            for year, positions in groupby(
+                self._orderings["release_year"], key=release_years.__getitem__
+            )
+        }
+        self._directors = {
+            director_id: array("I", positions)
+            for director_id, positions in groupby(
+                sorted(range(self.size), key=director_ids.__getitem__),
+                key=director_ids.__getitem__,
+            )
+        }
+        self._genre_bits = {
+            genre_id: _to_bitset(map(position_of.__getitem__, map(itemgetter(0), links)), self.size)
+            for genre_id, links in groupby(genre_links, key=itemgetter(1))
+        }
+        # Ordered by actor then movie, so each array comes out sorted
+        self._actors = {
+            actor_id: array("I", map(position_of.__getitem__, map(itemgetter(0), links)))
+            for actor_id, links in groupby(actor_links, key=itemgetter(1))
+        }
+
+    @classmethod
+    def build(cls, db: Session, revision: int) -> "MovieBitmapIndex":
+        """Load the index from the database in three statements."""
+        # Core rows on the session's connection: no ORM result processing
+        connection = db.connection()
+        movies = connection.execute(
+            select(
+                Movie.id, Movie.director_id, Movie.release_year, Movie.rating, Movie.title
+            ).order_by(Movie.id)
+        ).all()
+        ids, director_ids, release_years, ratings, titles = (
+            zip(*movies, strict=True) if movies else [()] * 5
+        )
+
+        def links(table, column):
+            value = table.c[column]
+            stmt = select(table.c.movie_id, value).order_by(value, table.c.movie_id)
+            return connection.execute(stmt).all()
+
+        return cls(
+            revision,
+            array("q", ids),
+            array("q", director_ids),
+            array("i", release_years),
+            array("d", ratings),
+            list(titles),
+            links(movie_genres, "genre_id"),
+            links(movie_actors, "actor_id"),
+        )
+
+    def _bitset_positions(self, bits: int) -> list[int]:
+        data = bits.to_bytes(self._nbytes, "little")
+        positions = []
+        for match in _NONZERO_BYTE.finditer(data):
+            base = match.start() * 8
+            positions.extend([base + bit for bit in _BYTE_BITS[data[match.start()]]])
+        return positions
+
+    def select(
+        self,
+        genre_ids: Sequence[int] = (),
+        director_id: int | None = None,
+        actor_ids: Sequence[int] = (),
+        release_year: int | None = None,
+        genre_match: MatchMode = "any",
+        actor_match: MatchMode = "any",
+    ) -> Selection:
+        """Match the ``/movies`` filters; semantics follow ``build_movies_statement``."""
+        bits = self._all
+        if genre_ids:
+            sets = [self._genre_bits.get(genre_id, 0) for genre_id in genre_ids]
+            if genre_match == "all":
+                for genre_bits in sets:
+                    bits &= genre_bits
+            else:
+                bits &= _union(sets)
+        if release_year:
+            bits &= self._year_bits.get(release_year, 0)
+
+        sparse: list[Sequence[int]] = []
+        if director_id:
+            sparse.append(self._directors.get(director_id, _EMPTY))
+        if actor_ids:
+            sets = [self._actors.get(actor_id, _EMPTY) for actor_id in actor_ids]
+            if actor_match == "all":
+                sparse.extend(sets)
+            else:
+                sparse.append(sorted(set().union(*sets)))
+
+        if sparse:
+            # Probe the smallest set's members against everything else
+            sparse.sort(key=len)
+            checks = [set(positions).__contains__ for positions in sparse[1:]]
+            if bits != self._all:
+                checks.append(Selection(0, bits=bits.to_bytes(self._nbytes, "little")).__contains__)
+            positions = [
+                position for position in sparse[0] if all(check(position) for check in checks)
+            ]
+            return Selection(len(positions), positions=positions)
+
+        count = bits.bit_count()
+        if count <= SMALL_RESULT:
+            return Selection(count, positions=self._bitset_positions(bits))
+        return Selection(count, bits=bits.to_bytes(self._nbytes, "little"))
+
+    def sort_key(self, sort: str) -> Callable[[int], tuple]:
+        """Sort key values of a position, as stored in page cursors."""
+        ids = self.ids
+        if sort == "id":
+            return lambda position: (ids[position],)
+        values = self._values[sort]
+        return lambda position: (values[position], ids[position])
+
+    def page(
+        self,
+        selection: Selection,
+        sort: str,
+        descending: bool,
+        limit: int,
+        offset: int = 0,
+        after: Sequence | None = None,
+    ) -> list[tuple]:
+        """
+        Return the sort key values of one page of a selection.
+
+        Args:
+            selection: Result of :meth:`select`
+            sort: "id", "title", "release_year" or "rating"; ties are broken by id
+            descending: Sort (and break ties) in descending order
+            limit: Maximum number of rows
+            offset: Rows to skip
+            after: Sort key values of the last row of the previous page (optional)
+
+        Returns:
+            One tuple of sort key values per row, ending with the movie ID
+
+        Raises:
+            TypeError: If ``after`` does not compare with the sort values
+        """
+        key = self.sort_key(sort)
+        if selection.positions is not None:
+            ordering = selection.positions
+            if sort != "id":
+                ordering = sorted(ordering, key=key)
+        else:
+            ordering = range(self.size) if sort == "id" else self._orderings[sort]
+
+        start, stop, step = 0, len(ordering), 1
+        if descending:
+            start, stop, step = len(ordering) - 1, -1, -1
+        if after is not None:
+            after = tuple(after)
+            if descending:
+                start = bisect_left(ordering, after, key=key) - 1
+            else:
+                start = bisect_right(ordering, after, key=key)
+
+        rows = []
+        for index in range(start, stop, step):
+            position = ordering[index]
+            if selection.positions is None and position not in selection:
+                continue
+            if offset:
+                offset -= 1
+                continue
+            rows.append(key(position))
+            if len(rows) == limit:
+                break
+        return rows
+
+
+_index: MovieBitmapIndex | None = None
+_rebuild_lock = threading.Lock()
+_rebuild_thread: threading.Thread | None = None
+
+
+def _rebuild(bind: Engine) -> None:
+    global _index
+    try:
+        with Session(bind) as db:
+            _index = MovieBitmapIndex.build(db, get_catalogue_revision(db))
+    except Exception:
+        # The next request that finds the index stale tries again
+        logger.exception("bitmap index rebuild failed")
+    finally:
+        _rebuild_lock.release()
+
+
+@lru_cache
+def _rebuild_engine(url: str) -> Engine:
+    # Async engines only run inside their event loop, so rebuilds for async
+    # sessions read the same database through a sync engine of their own
+    return create_db_engine(to_sync_url(url).render_as_string(hide_password=False))
+
+
+def start_rebuild(bind: Engine) -> threading.Thread | None:
+    """
+    Rebuild the index from ``bind`` in a background thread.
+
+    Returns:
+        The rebuild thread, or None if a rebuild is already running
+    """
+    global _rebuild_thread
+    if not _rebuild_lock.acquire(blocking=False):
+        return None
+    _rebuild_thread = threading.Thread(
+        target=_rebuild, args=(bind,), name="bitmap-index-rebuild", daemon=True
+    )
+    _rebuild_thread.start()
+    return _rebuild_thread
+
+
+def current_index(db: Session) -> MovieBitmapIndex | None:
+    """
+    Return the index at (or past) the catalogue revision seen by ``db``.
+
+    A missing or stale index gets rebuilt from the database ``db`` reads in
+    the background (see :func:`start_rebuild`); callers get None meanwhile and
+    should use the SQL path. Async callers go through ``AsyncSession.run_sync``,
+    which only costs the revision read.
+    """
+    global _index
+    revision = get_catalogue_revision(db)
+    index = _index
+    # A newer index is kept for sessions on a lagging replica, so replicas at
+    # different revisions do not make it rebuild back and forth
+    if index is not None and index.revision >= revision:
+        return index
+    bind = db.get_bind()
+    url = bind.url.render_as_string(hide_password=False)
+    if is_sqlite_memory(url):
+        # Other connections do not see this database: build in the request
+        if not _rebuild_lock.acquire(blocking=False):
+            return None
+        try:
+            index = _index = MovieBitmapIndex.build(db, revision)
+        finally:
+            _rebuild_lock.release()
+        return index
+    start_rebuild(_rebuild_engine(url) if bind.dialect.is_async else bind)
+    return None
+
+
+def wait_for_rebuild(timeout: float | None = None) -> None:
+    """Block until a running rebuild finished, e.g. in tests and CLI tools."""
+    thread = _rebuild_thread
+    if thread is not None:
+        thread.join(timeout)
+
+
+def reset_index() -> None:
+    """Drop the index, e.g. after the database was replaced wholesale."""
+    global _index
+    wait_for_rebuild()
+    _index = None
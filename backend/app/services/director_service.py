@@ -0,0 +1,197 @@
+"""Director service layer for business logic related to directors."""
+
+from collections.abc import Sequence
+from typing import Literal
+
+from sqlalchemy import Row, Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.director import Director
+from app.models.movie import Movie
+from app.services.batch import in_request_order
+from app.services.filmography import (
+    SummarySort,
+    embedded_movies_statement,
+    movie_aggregates,
+    summary_sort,
+    with_embedded_movies,
+)
+from app.services.pagination import SortOrder, column_sort
+
+# Columns the full director list can be sorted by (ties are broken by id)
+DirectorSort = Literal["id", "name"]
+
+
+def _sorted_directors(sort: DirectorSort, order: SortOrder) -> Select:
+    sort_key = column_sort(sort, getattr(Director, sort), Director.id, order)
+    return select(Director.id, Director.name).order_by(*sort_key.order_by())
+
+
+def get_directors(
+    db: Session,
+    sort: DirectorSort = "id",
+    order: SortOrder = "asc",
+    movies_limit: int = settings.EMBEDDED_MOVIES_LIMIT,
+) -> list[dict]:
+    """
+    Retrieve all directors with the start of their filmographies.
+
+    Each director embeds at most ``movies_limit`` movies by release year, all
+    read by one windowed query for the whole list. Use
+    :func:`get_director_summaries` when the movies themselves are not needed.
+
+    Args:
+        db: Database session
+        sort: "id" or "name"; ties are broken by id
+        order: "asc" or "desc"
+        movies_limit: Most movies embedded per director
+
+    Returns:
+        List of director dicts (see :func:`~app.services.filmography.with_embedded_movies`)
+    """
+    directors = db.execute(_sorted_directors(sort, order)).all()
+    rows = db.execute(embedded_movies_statement(Movie.director_id, movies_limit)).all()
+    return with_embedded_movies(directors, rows, movies_limit)
+
+
+async def get_directors_async(
+    db: AsyncSession,
+    sort: DirectorSort = "id",
+    order: SortOrder = "asc",
+    movies_limit: int = settings.EMBEDDED_MOVIES_LIMIT,
+) -> list[dict]:
+    """Async counterpart of :func:`get_directors`."""
+    directors = (await db.execute(_sorted_directors(sort, order))).all()
+    rows = (await db.execute(embedded_movies_statement(Movie.director_id, movies_limit))).all()
+    return with_embedded_movies(directors, rows, movies_limit)
+
+
+def _director_summaries(sort: SummarySort, order: SortOrder) -> Select:
+    aggregates = movie_aggregates()
+    stmt = (
+        select(Director.id, Director.name, *aggregates)
+        .outerjoin(Movie, Movie.director_id == Director.id)
+        .group_by(Director.id, Director.name)
+    )
+    return stmt.order_by(*summary_sort(Director, aggregates, sort, order).order_by())
+
+
+def get_director_summaries(
+    db: Session, sort: SummarySort = "id", order: SortOrder = "asc"
+) -> list[Row]:
+    """
+    Retrieve directors with aggregates over their filmographies, in one grouped query.
+
+    Args:
+        db: Database session
+        sort: "id", "name" or one of the aggregates; ties are broken by id
+        order: "asc" or "desc"
+
+    Returns:
+        List of (id, name, movie_count, average_rating, first_year, last_year)
+        rows; directors without movies have a count of 0 and null aggregates
+    """
+    return list(db.execute(_director_summaries(sort, order)).all())
+
+
+async def get_director_summaries_async(
+    db: AsyncSession, sort: SummarySort = "id", order: SortOrder = "asc"
+) -> list[Row]:
+    """Async counterpart of :func:`get_director_summaries`."""
+    return list((await db.execute(_director_summaries(sort, order))).all())
+
+
+def get_director_summary(db: Session, director_id: int) -> Row | None:
+    """Retrieve the :func:`get_director_summaries` row of one director, or None if not found."""
+    stmt = _director_summaries("id", "asc").where(Director.id == director_id)
+    return db.execute(stmt).first()
+
+
+async def get_director_summary_async(db: AsyncSession, director_id: int) -> Row | None:
+    """Async counterpart of :func:`get_director_summary`."""
+    stmt = _director_summaries("id", "asc").where(Director.id == director_id)
+    return (await db.execute(stmt)).first()
+
+
+def director_exists(db: Session, director_id: int) -> bool:
+    """Whether a director with this ID exists."""
+    return db.execute(select(Director.id).where(Director.id == director_id)).first() is not None
+
+
+async def director_exists_async(db: AsyncSession, director_id: int) -> bool:
+    """Async counterpart of :func:`director_exists`."""
+    stmt = select(Director.id).where(Director.id == director_id)
+    return (await db.execute(stmt)).first() is not None
+
+
+def _director_statement(director_id: int) -> Select:
+    return select(Director.id, Director.name).where(Director.id == director_id)
+
+
+def get_director_by_id(
+    db: Session, director_id: int, movies_limit: int = settings.EMBEDDED_MOVIES_LIMIT
+) -> dict | None:
+    """
+    Retrieve a single director by ID with the start of their filmography.
+
+    Args:
+        db: Database session
+        director_id: The ID of the director to retrieve
+        movies_limit: Most movies embedded, by release year
+
+    Returns:
+        Director dict (see :func:`~app.services.filmography.with_embedded_movies`)
+        if found, None otherwise
+    """
+    director = db.execute(_director_statement(director_id)).first()
+    if director is None:
+        return None
+    stmt = embedded_movies_statement(Movie.director_id, movies_limit, [director_id])
+    return with_embedded_movies([director], db.execute(stmt).all(), movies_limit)[0]
+
+
+async def get_director_by_id_async(
+    db: AsyncSession, director_id: int, movies_limit: int = settings.EMBEDDED_MOVIES_LIMIT
+) -> dict | None:
+    """Async counterpart of :func:`get_director_by_id`."""
+    director = (await db.execute(_director_statement(director_id))).first()
+    if director is None:
+        return None
+    stmt = embedded_movies_statement(Movie.director_id, movies_limit, [director_id])
+    return with_embedded_movies([director], (await db.execute(stmt)).all(), movies_limit)[0]
+
+
+def get_directors_by_ids(db: Session, ids: Sequence[int]) -> tuple[list[dict], list[int]]:
+    """
+    Retrieve several directors with the start of their filmographies in two queries.
+
+    Each director embeds the same movies as ``GET /directors/{id}`` with the
+    default ``moviesLimit``.
+
+    Args:
+        db: Database session
+        ids: IDs of the directors to retrieve, without duplicates
+
+    Returns:
+        Tuple of (director dicts in the order of ``ids``, IDs that do not exist)
+    """
+    directors, missing = in_request_order(
+        db.execute(select(Director.id, Director.name).where(Director.id.in_(ids))), ids
+    )
+    limit = settings.EMBEDDED_MOVIES_LIMIT
+    rows = db.execute(embedded_movies_statement(Movie.director_id, limit, ids)).all()
+    return with_embedded_movies(directors, rows, limit), missing
+
+
+async def get_directors_by_ids_async(
+    db: AsyncSession, ids: Sequence[int]
+) -> tuple[list[dict], list[int]]:
+    """Async counterpart of :func:`get_directors_by_ids`."""
+    directors, missing = in_request_order(
+        await db.execute(select(Director.id, Director.name).where(Director.id.in_(ids))), ids
+    )
+    limit = settings.EMBEDDED_MOVIES_LIMIT
+    rows = (await db.execute(embedded_movies_statement(Movie.director_id, limit, ids))).all()
+    return with_embedded_movies(directors, rows, limit), missing
@@ -0,0 +1,168 @@
+"""Streaming catalogue export.
+
+Rows are read with ``yield_per`` so the driver streams them in fixed-size
+partitions (a server-side cursor where the backend supports one), and each
+partition is encoded and handed to the response before the next is fetched.
+Memory use depends on the partition size, not on the catalogue size.
+"""
+
+import csv
+import io
+import json
+from collections.abc import Callable, Iterator, Sequence
+from typing import Literal
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.actor import Actor
+from app.models.associations import movie_genres
+from app.models.director import Director
+from app.models.genre import Genre
+from app.models.movie import Movie
+from app.services.actor_service import build_actors_statement
+from app.services.filters import MatchMode
+from app.services.movie_service import build_movies_statement
+
+ExportFormat = Literal["ndjson", "csv"]
+
+MOVIE_CSV_FIELDS = [
+    "id",
+    "title",
+    "release_year",
+    "rating",
+    "director_id",
+    "director_name",
+    "genre_ids",
+    "genre_names",
+]
+PERSON_CSV_FIELDS = ["id", "name"]
+
+
+def _genres_by_movie(db: Session, movie_ids: list[int]) -> dict[int, list[dict]]:
+    """Load the genres of one partition of movies with a single query."""
+    stmt = (
+        select(movie_genres.c.movie_id, Genre.id, Genre.name)
+        .join(Genre, Genre.id == movie_genres.c.genre_id)
+        .where(movie_genres.c.movie_id.in_(movie_ids))
+        .order_by(movie_genres.c.movie_id, Genre.id)
+    )
+    genres: dict[int, list[dict]] = {}
+    for movie_id, genre_id, name in db.execute(stmt):
+        genres.setdefault(movie_id, []).append({"id": genre_id, "name": name})
+    return genres
+
+
+def iter_movie_records(
+    db: Session,
+    genre_id: int | Sequence[int] | None = None,
+    director_id: int | None = None,
+    actor_id: int | Sequence[int] | None = None,
+    release_year: int | None = None,
+    q: str | None = None,
+    genre_match: MatchMode = "any",
+    actor_match: MatchMode = "any",
+) -> Iterator[list[dict]]:
+    """
+    Stream filtered movies as partitions of ``MovieListItem``-shaped dicts.
+
+    Accepts the same filters as :func:`app.services.movie_service.get_movies`.
+
+    Yields:
+        Lists of at most ``EXPORT_BATCH_SIZE`` movie dicts
+    """
+    base = select(
+        Movie.id,
+        Movie.title,
+        Movie.release_year,
+        Movie.rating,
+        Director.id.label("director_id"),
+        Director.name.label("director_name"),
+    ).join(Director, Director.id == Movie.director_id)
+    stmt, sort_key = build_movies_statement(
+        db.get_bind().dialect.name,
+        genre_id,
+        director_id,
+        actor_id,
+        release_year,
+        q,
+        stmt=base,
+        genre_match=genre_match,
+        actor_match=actor_match,
+    )
+    stmt = stmt.order_by(*sort_key.order_by())
+
+    result = db.execute(stmt.execution_options(yield_per=settings.EXPORT_BATCH_SIZE))
+    for partition in result.partitions():
+        genres = _genres_by_movie(db, [row.id for row in partition])
+        yield [
+            {
+                "id": row.id,
+                "title": row.title,
+                "release_year": row.release_year,
+                "rating": row.rating,
+                "director": {"id": row.director_id, "name": row.director_name},
+                "genres": genres.get(row.id, []),
+            }
+            for row in partition
+        ]
+
+
+def _iter_people(db: Session, stmt) -> Iterator[list[dict]]:
+    result = db.execute(stmt.execution_options(yield_per=settings.EXPORT_BATCH_SIZE))
+    for partition in result.partitions():
+        yield [{"id": row.id, "name": row.name} for row in partition]
+
+
+def iter_actor_records(
+    db: Session, movie_id: int | None = None, genre_id: int | None = None
+) -> Iterator[list[dict]]:
+    """Stream filtered actors as partitions of ``{"id", "name"}`` dicts."""
+    stmt = build_actors_statement(movie_id, genre_id, stmt=select(Actor.id, Actor.name))
+    return _iter_people(db, stmt.order_by(Actor.id))
+
+
+def iter_director_records(db: Session) -> Iterator[list[dict]]:
+    """Stream all directors as partitions of ``{"id", "name"}`` dicts."""
+    return _iter_people(db, select(Director.id, Director.name).order_by(Director.id))
+
+
+def flatten_movie_record(record: dict) -> dict:
+    """Flatten a movie record into a CSV row (multi-valued fields joined by ``|``)."""
+    return {
+        "id": record["id"],
+        "title": record["title"],
+        "release_year": record["release_year"],
+        "rating": record["rating"],
+        "director_id": record["director"]["id"],
+        "director_name": record["director"]["name"],
+        "genre_ids": "|".join(str(genre["id"]) for genre in record["genres"]),
+        "genre_names": "|".join(genre["name"] for genre in record["genres"]),
+    }
+
+
+def encode_ndjson(partitions: Iterator[list[dict]]) -> Iterator[bytes]:
+    """Encode each partition as newline-delimited JSON."""
+    for records in partitions:
+        yield "".join(
+            json.dumps(record, separators=(",", ":")) + "\n" for record in records
+        ).encode()
+
+
+def encode_csv(
+    partitions: Iterator[list[dict]],
+    fields: list[str],
+    flatten: Callable[[dict], dict] | None = None,
+) -> Iterator[bytes]:
+    """Encode partitions as CSV, writing the header first."""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fields)
+    writer.writeheader()
+    yield buffer.getvalue().encode()
+
+    for records in partitions:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(map(flatten, records) if flatten else records)
+        yield buffer.getvalue().encode()
@@ -0,0 +1,190 @@
+"""Facet counts for the movie list filters.
+
+Counts per genre, director and release year over the movies matching a
+filter set, computed in a single statement: one aggregate per facet,
+combined with UNION ALL. Each aggregate applies the filters itself rather
+than reading a shared materialized set, so it can group along the index
+that orders its facet (release years and directors on the list table,
+genres on the genre-to-movie link index) without sorting the matches.
+"""
+
+from collections.abc import Sequence
+
+from sqlalchemy import CompoundSelect, String, func, literal, null, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.associations import movie_genres
+from app.models.director import Director
+from app.models.genre import Genre
+from app.models.movie import Movie
+from app.models.movie_list_card import MovieListCard
+from app.services.filters import MatchMode
+from app.services.movie_service import build_movies_statement, read_model_missing
+
+
+def build_facets_statement(
+    dialect_name: str,
+    genre_id: int | Sequence[int] | None = None,
+    director_id: int | None = None,
+    actor_id: int | Sequence[int] | None = None,
+    release_year: int | None = None,
+    q: str | None = None,
+    genre_match: MatchMode = "any",
+    actor_match: MatchMode = "any",
+    read_model: bool = True,
+) -> CompoundSelect:
+    """
+    Build the facet count statement for the ``get_movies`` filters.
+
+    Returns:
+        Statement yielding (facet, key, name, count) rows, where facet is
+        "genre", "director" or "release_year"; directors are limited to the
+        ``MAX_FACET_VALUES`` with the most movies; ``read_model=False`` counts
+        the normalized tables even with ``MOVIE_LIST_READ_MODEL`` on
+    """
+    source = MovieListCard if settings.MOVIE_LIST_READ_MODEL and read_model else Movie
+
+    def filtered(stmt):
+        stmt, _ = build_movies_statement(
+            dialect_name,
+            genre_id,
+            director_id,
+            actor_id,
+            release_year,
+            q,
+            stmt=stmt,
+            genre_match=genre_match,
+            actor_match=actor_match,
+            source=source,
+        )
+        return stmt
+
+    count = func.count().label("count")
+
+    genre_counts = select(movie_genres.c.genre_id, count).group_by(movie_genres.c.genre_id)
+    if genre_id or director_id or actor_id or release_year or q:
+        genre_counts = genre_counts.where(movie_genres.c.movie_id.in_(filtered(select(source.id))))
+    genre_counts = genre_counts.subquery()
+    genres = select(
+        literal("genre").label("facet"),
+        Genre.id.label("key"),
+        Genre.name.label("name"),
+        genre_counts.c.count,
+    ).join(genre_counts, genre_counts.c.genre_id == Genre.id)
+
+    director_counts = (
+        filtered(select(source.director_id, count))
+        .group_by(source.director_id)
+        .order_by(count.desc(), source.director_id)
+        .limit(settings.MAX_FACET_VALUES)
+        .subquery()
+    )
+    directors = select(
+        literal("director"), Director.id, Director.name, director_counts.c.count
+    ).join(director_counts, director_counts.c.director_id == Director.id)
+
+    years = filtered(
+        select(literal("release_year"), source.release_year, null().cast(String), count)
+    ).group_by(source.release_year)
+
+    return union_all(genres, directors, years)
+
+
+def _collect(rows) -> dict:
+    facets: dict = {"total": 0, "genres": [], "directors": [], "release_years": []}
+    for facet, key, name, count in rows:
+        if facet == "genre":
+            facets["genres"].append({"id": key, "name": name, "count": count})
+        elif facet == "director":
+            facets["directors"].append({"id": key, "name": name, "count": count})
+        else:
+            # Every movie has exactly one release year
+            facets["total"] += count
+            facets["release_years"].append({"release_year": key, "count": count})
+    facets["genres"].sort(key=lambda item: (-item["count"], item["id"]))
+    facets["directors"].sort(key=lambda item: (-item["count"], item["id"]))
+    facets["release_years"].sort(key=lambda item: item["release_year"])
+    # Every movie has exactly one director, so the capped list leaves out the rest
+    other = facets["total"] - sum(item["count"] for item in facets["directors"])
+    facets["directors_truncated"] = other > 0
+    facets["directors_other_count"] = other
+    return facets
+
+
+def get_movie_facets(
+    db: Session,
+    genre_id: int | Sequence[int] | None = None,
+    director_id: int | None = None,
+    actor_id: int | Sequence[int] | None = None,
+    release_year: int | None = None,
+    q: str | None = None,
+    genre_match: MatchMode = "any",
+    actor_match: MatchMode = "any",
+) -> dict:
+    """
+    Count the movies matching the filters per genre, director and release year.
+
+    Args:
+        db: Database session
+        genre_id, director_id, actor_id, release_year, q, genre_match,
+            actor_match: The filters of :func:`app.services.movie_service.get_movies`
+
+    Returns:
+        ``MovieFacets``-shaped dict: the total and the counts per facet value,
+        genres and directors by descending count, release years ascending;
+        ``directors_truncated`` and ``directors_other_count`` report the
+        directors and movies beyond ``MAX_FACET_VALUES``
+    """
+
+    def facets(read_model: bool = True) -> dict:
+        stmt = build_facets_statement(
+            db.get_bind().dialect.name,
+            genre_id,
+            director_id,
+            actor_id,
+            release_year,
+            q,
+            genre_match,
+            actor_match,
+            read_model,
+        )
+        return _collect(db.execute(stmt))
+
+    result = facets()
+    if not result["total"] and read_model_missing(db):
+        result = facets(read_model=False)
+    return result
+
+
+async def get_movie_facets_async(
+    db: AsyncSession,
+    genre_id: int | Sequence[int] | None = None,
+    director_id: int | None = None,
+    actor_id: int | Sequence[int] | None = None,
+    release_year: int | None = None,
+    q: str | None = None,
+    genre_match: MatchMode = "any",
+    actor_match: MatchMode = "any",
+) -> dict:
+    """Async counterpart of :func:`get_movie_facets`."""
+
+    async def facets(read_model: bool = True) -> dict:
+        stmt = build_facets_statement(
+            db.get_bind().dialect.name,
+            genre_id,
+            director_id,
+            actor_id,
+            release_year,
+            q,
+            genre_match,
+            actor_match,
+            read_model,
+        )
+        return _collect(await db.execute(stmt))
+
+    result = await facets()
+    if not result["total"] and await db.run_sync(read_model_missing):
+        result = await facets(read_model=False)
+    return result
@@ -0,0 +1,112 @@
+"""Per-person movie aggregates and embedded filmographies for actors and directors.
+
+Summary listings report how many movies a person made, their average rating
+and the first and last release year. They are computed by the database in
+one grouped statement over the person's links instead of by loading every
+person's ``movies`` collection.
+
+Detail responses embed at most ``moviesLimit`` movies per person, read for
+all people at once with a window function, plus a cursor that continues the
+filmography on ``GET /{people}/{id}/movies``.
+"""
+
+from collections import defaultdict
+from collections.abc import Sequence
+from typing import Literal
+
+from sqlalchemy import Column, Label, Row, Select, func, select
+
+from app.models.movie import Movie
+from app.services.pagination import SortKey, SortOrder, column_sort, encode_cursor
+
+# Columns a summary listing can be sorted by (ties are broken by id)
+SummarySort = Literal["id", "name", "movie_count", "average_rating", "first_year", "last_year"]
+
+# Sorts that need the aggregates, i.e. are only available in summary mode
+AGGREGATE_SORTS = ("movie_count", "average_rating", "first_year", "last_year")
+
+
+def movie_aggregates() -> list[Label]:
+    """Aggregate columns over the ``movies`` rows joined to each person (none for no movies)."""
+    return [
+        func.count(Movie.id).label("movie_count"),
+        func.avg(Movie.rating).label("average_rating"),
+        func.min(Movie.release_year).label("first_year"),
+        func.max(Movie.release_year).label("last_year"),
+    ]
+
+
+def summary_sort(person, aggregates: list[Label], sort: SummarySort, order: SortOrder) -> SortKey:
+    """Sort a summary statement by a person column or one of its ``aggregates``."""
+    by_name = {aggregate.name: aggregate for aggregate in aggregates}
+    column = by_name[sort] if sort in by_name else getattr(person, sort)
+    return column_sort(sort, column, person.id, order)
+
+
+# Order of embedded filmographies: the default sort of /{people}/{id}/movies,
+# so the embedded next cursor is valid there
+EMBEDDED_SORT = column_sort("release_year", Movie.release_year, Movie.id)
+
+
+def embedded_movies_statement(
+    person_column: Column, limit: int, person_ids: Sequence[int] | None = None
+) -> Select:
+    """
+    Select the first ``limit + 1`` movies of every person (or of ``person_ids``).
+
+    ``person_column`` is ``Movie.director_id`` or the person column of a link
+    table with a ``movie_id`` column. The extra row per person tells whether
+    the filmography goes on.
+    """
+    rank = (
+        func.row_number()
+        .over(partition_by=person_column, order_by=EMBEDDED_SORT.order_by())
+        .label("rank")
+    )
+    stmt = select(
+        person_column.label("person_id"),
+        Movie.id,
+        Movie.title,
+        Movie.release_year,
+        Movie.rating,
+        rank,
+    )
+    if person_column.table is not Movie.__table__:
+        stmt = stmt.join_from(
+            person_column.table, Movie, person_column.table.c.movie_id == Movie.id
+        )
+    if person_ids is not None:
+        stmt = stmt.where(person_column.in_(person_ids))
+    window = stmt.subquery()
+    return (
+        select(window).where(window.c.rank <= limit + 1).order_by(window.c.person_id, window.c.rank)
+    )
+
+
+def with_embedded_movies(people: Sequence, rows: Sequence[Row], limit: int) -> list[dict]:
+    """
+    Combine people with the rows of :func:`embedded_movies_statement`.
+
+    Returns:
+        One dict per person, in order, with ``movies`` (at most ``limit``) and
+        ``movies_next_cursor`` (None when every movie is embedded)
+    """
+    movies_of = defaultdict(list)
+    for row in rows:
+        movies_of[row.person_id].append(row)
+    result = []
+    for person in people:
+        movies = movies_of[person.id]
+        next_cursor = None
+        if len(movies) > limit:
+            movies = movies[:limit]
+            next_cursor = encode_cursor(EMBEDDED_SORT, [movies[-1].release_year, movies[-1].id])
+        result.append(
+            {
+                "id": person.id,
+                "name": person.name,
+                "movies": movies,
+                "movies_next_cursor": next_cursor,
+            }
+        )
+    return result
@@ -0,0 +1,68 @@
+"""Semi-join filters over the many-to-many link tables.
+
+Filtering through a link table with a JOIN multiplies rows (one per matching
+link) and needs a DISTINCT over the whole result to undo it. These helpers
+filter with ``id IN (SELECT ... FROM link ...)`` instead, which the database
+runs as a semi-join: each row qualifies at most once and no DISTINCT is needed.
+
+A semi-join reads every link of the filter values before the first row is
+returned. When only the first rows in index order are wanted (a top-N page)
+and the filter matches a large share of rows, a correlated ``EXISTS`` probe
+per candidate row is cheaper: see ``probe`` on :func:`link_filter`.
+"""
+
+from collections.abc import Sequence
+from typing import Literal
+
+from sqlalchemy import ColumnElement, and_, exists, select
+
+# "any": at least one of the values matches; "all": every value matches
+MatchMode = Literal["any", "all"]
+
+
+def as_ids(value: int | Sequence[int] | None) -> list[int]:
+    """Normalize a single or multi-value ID filter to a list without duplicates or zeros."""
+    if value is None:
+        return []
+    if isinstance(value, int):
+        value = [value]
+    return [item for item in dict.fromkeys(value) if item]
+
+
+def link_filter(
+    id_column: ColumnElement,
+    link_column: ColumnElement,
+    value_column: ColumnElement,
+    ids: Sequence[int],
+    match: MatchMode = "any",
+    probe: bool = False,
+) -> ColumnElement:
+    """
+    Build a semi-join predicate through a link table.
+
+    Args:
+        id_column: Key of the filtered entity (e.g. ``Movie.id``)
+        link_column: Link table column referencing it (e.g. ``movie_genres.c.movie_id``)
+        value_column: Link table column holding the filter values
+            (e.g. ``movie_genres.c.genre_id``)
+        ids: Filter values; must not be empty
+        match: "any" keeps rows linked to at least one value, "all" only rows
+            linked to every value
+        probe: Test each row with a correlated ``EXISTS`` on the (key, value)
+            primary key instead of collecting the matching keys up front, so
+            a sorted scan can stop after ``LIMIT`` rows. Only worth it for
+            values linked to a large share of rows, such as genres.
+
+    Returns:
+        Predicate to pass to ``Select.where``
+    """
+
+    def matching(condition: ColumnElement) -> ColumnElement:
+        if probe:
+            return exists().where(link_column == id_column, condition)
+        return id_column.in_(select(link_column).where(condition))
+
+    if match == "all" and len(ids) > 1:
+        # One lookup per value, each served by an index on the link table
+        return and_(*(matching(value_column == value) for value in ids))
+    return matching(value_column == ids[0] if len(ids) == 1 else value_column.in_(ids))
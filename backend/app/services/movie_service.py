@@ -1,67 +1,416 @@
 """Movie service layer for business logic related to movies."""
 
-from sqlalchemy.orm import Session
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Literal
 
-from app.models.actor import Actor
-from app.models.genre import Genre
+from sqlalchemy import Select, Text, TypeDecorator, cast, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload, selectinload
+
+from app.core.config import settings
+from app.core.json import RawJSON
+from app.db.read_model import movie_cards_missing
+from app.models.associations import movie_actors, movie_genres
 from app.models.movie import Movie
+from app.models.movie_list_card import MovieListCard
+from app.models.movie_neighbour import MovieNeighbour
+from app.services.batch import in_request_order
+from app.services.bitmap_index import MovieBitmapIndex, current_index
+from app.services.filters import MatchMode, as_ids, link_filter
+from app.services.pagination import (
+    CountMode,
+    Page,
+    SortKey,
+    SortOrder,
+    build_page,
+    column_sort,
+    decode_cursor,
+    paginate,
+    paginate_async,
+)
+from app.services.search_service import title_search_subquery
 
+# Tables the movie list can be read from; both have id, title, release_year,
+# rating and director_id columns
+MovieSource = type[Movie] | type[MovieListCard]
 
-def get_movies(
-    db: Session,
-    genre_id: int | None = None,
+# Columns the movie list can be sorted by (ties are broken by id)
+MovieSort = Literal["id", "title", "release_year", "rating"]
+
+# Loader strategies per endpoint. The director is a many-to-one and rides along
+# in the main SELECT; collections are fetched with one SELECT ... IN per page.
+MOVIE_LIST_OPTIONS = (joinedload(Movie.director), selectinload(Movie.genres))
+MOVIE_DETAIL_OPTIONS = (
+    joinedload(Movie.director),
+    selectinload(Movie.genres),
+    selectinload(Movie.actors),
+)
+
+
+class _RawJSONText(TypeDecorator):
+    """Text column read back as :class:`RawJSON`."""
+
+    impl = Text
+    cache_ok = True
+
+    def process_result_value(self, value, dialect):
+        return None if value is None else RawJSON(value)
+
+
+# The stored MovieListItem of a card, read as JSON text so responses can embed
+# it without decoding and re-encoding it
+LIST_CARD_JSON = cast(MovieListCard.payload, _RawJSONText())
+
+
+def build_movies_statement(
+    dialect_name: str,
+    genre_id: int | Sequence[int] | None = None,
     director_id: int | None = None,
-    actor_id: int | None = None,
+    actor_id: int | Sequence[int] | None = None,
     release_year: int | None = None,
     q: str | None = None,
-) -> tuple[list[Movie], int]:
+    stmt: Select | None = None,
+    genre_match: MatchMode = "any",
+    actor_match: MatchMode = "any",
+    source: MovieSource = Movie,
+    sort: MovieSort | None = None,
+    order: SortOrder = "asc",
+    top_n: bool = False,
+    read_model: bool = True,
+) -> tuple[Select, SortKey]:
     """
-    Retrieve movies with optional filtering.
+    Build the filtered movie statement shared by the sync and async services.
 
-    Filters movies based on genre, director, actor, release year, or search query.
-    Multiple filters can be combined. Returns both the filtered movies and total count.
+    Genre and actor filters are semi-joins on the link tables, so every movie
+    appears at most once and the statement needs no DISTINCT. By default the
+    statement selects the pre-serialized list cards of the ``movie_list_cards``
+    read model as JSON text (one row per movie, no joins); with ``MOVIE_LIST_READ_MODEL``
+    off it selects Movie entities with their director and genres eager loaded.
+
+    Every sort column is indexed on both source tables. With ``top_n`` the
+    genre filter probes each row instead of collecting the genre's movies
+    first, so a sorted page is read in index order and stops after ``LIMIT``
+    rows rather than sorting the whole filtered set.
 
     Args:
-        db: Database session
-        genre_id: Filter by genre ID (optional)
+        dialect_name: Name of the database dialect, used to pick the search index
+        genre_id: Filter by one or more genre IDs (optional)
         director_id: Filter by director ID (optional)
-        actor_id: Filter by actor ID (optional)
+        actor_id: Filter by one or more actor IDs (optional)
         release_year: Filter by exact release year (optional)
-        q: Search query for movie title (case-insensitive partial match) (optional)
+        q: Search query for movie title (optional)
+        stmt: Statement selecting from ``source`` to filter; defaults to the
+            list card payloads or Movie entities, as described above
+        genre_match: With several genre IDs, match "any" or "all" of them
+        actor_match: With several actor IDs, match "any" or "all" of them
+        source: Table ``stmt`` selects from (ignored when ``stmt`` is None)
+        sort: Column to sort by; defaults to relevance for searches and id otherwise
+        order: "asc" or "desc"
+        top_n: The statement is only paged, not counted (see above)
+        read_model: False selects Movie entities even with ``MOVIE_LIST_READ_MODEL``
+            on, for databases whose read model is not built yet
 
     Returns:
-        Tuple of (list of Movie objects, total count)
+        Tuple of (unordered statement, sort key to page it with)
     """
-    query = db.query(Movie)
+    if stmt is None:
+        if settings.MOVIE_LIST_READ_MODEL and read_model:
+            source, stmt = MovieListCard, select(LIST_CARD_JSON)
+        else:
+            source, stmt = Movie, select(Movie).options(*MOVIE_LIST_OPTIONS)
 
-    if genre_id:
-        query = query.join(Movie.genres).filter(Genre.id == genre_id)
+    if genre_ids := as_ids(genre_id):
+        stmt = stmt.where(
+            link_filter(
+                source.id,
+                movie_genres.c.movie_id,
+                movie_genres.c.genre_id,
+                genre_ids,
+                genre_match,
+                # Every genre covers a sizable share of the catalogue
+                probe=top_n,
+            )
+        )
 
     if director_id:
-        query = query.filter(Movie.director_id == director_id)
+        stmt = stmt.where(source.director_id == director_id)
 
-    if actor_id:
-        query = query.join(Movie.actors).filter(Actor.id == actor_id)
+    if actor_ids := as_ids(actor_id):
+        stmt = stmt.where(
+            link_filter(
+                source.id, movie_actors.c.movie_id, movie_actors.c.actor_id, actor_ids, actor_match
+            )
+        )
 
     if release_year:
-        query = query.filter(Movie.release_year == release_year)
+        stmt = stmt.where(source.release_year == release_year)
 
+    # Keyset-friendly default ordering: the primary key is unique and indexed
+    sort_key = column_sort(sort or "id", getattr(source, sort or "id"), source.id, order)
     if q:
-        search_term = f"%{q}%"
-        query = query.filter(Movie.title.ilike(search_term))
+        matches = title_search_subquery(dialect_name, q)
+        if matches is None:
+            search_term = f"%{q}%"
+            stmt = stmt.where(source.title.ilike(search_term))
+        else:
+            # Served by the full-text index; best matches first. The index
+            # has one row per movie, so the join cannot duplicate movies.
+            stmt = stmt.join(matches, matches.c.movie_id == source.id)
+            if sort is None:
+                sort_key = SortKey(
+                    name="relevance",
+                    columns=[(matches.c.rank, False), (source.id, False)],
+                )
+
+    return stmt, sort_key
+
+
+@dataclass
+class _BitmapLookup:
+    """A page located by the bitmap index, waiting for its items."""
 
-    # Remove duplicates if multiple joins
-    query = query.distinct()
+    sort_key: SortKey
+    keys: list[tuple]
+    total: int | None
+    limit: int
+    count: CountMode
 
-    total = query.count()
-    items = query.all()
+    @property
+    def ids(self) -> list[int]:
+        return [key[-1] for key in self.keys]
+
+    def statement(self, read_model: bool = True) -> Select:
+        """Load the page's items as (id, item) rows, in the shape the SQL path returns."""
+        if settings.MOVIE_LIST_READ_MODEL and read_model:
+            return select(MovieListCard.id, LIST_CARD_JSON).where(MovieListCard.id.in_(self.ids))
+        return select(Movie.id, Movie).options(*MOVIE_LIST_OPTIONS).where(Movie.id.in_(self.ids))
+
+    def page(self, items: dict[int, object]) -> Page:
+        rows = [(items[key[-1]], *key) for key in self.keys if key[-1] in items]
+        return build_page(rows, self.sort_key, self.limit, self.total, self.count)
+
+
+def read_model_missing(db: Session) -> bool:
+    """
+    Whether lists should be read from the read model but it is not built yet.
 
-    return items, total
+    Until ``python -m app.db.bootstrap`` builds it, reads fall back to the
+    normalized tables rather than answering with nothing; only reads that
+    found nothing ask, so a built read model costs no extra query.
+    """
+    return settings.MOVIE_LIST_READ_MODEL and movie_cards_missing(db.connection())
+
+
+def _bitmap_lookup(
+    index: MovieBitmapIndex | None,
+    genre_id: int | Sequence[int] | None,
+    director_id: int | None,
+    actor_id: int | Sequence[int] | None,
+    release_year: int | None,
+    limit: int,
+    offset: int,
+    cursor: str | None,
+    count: CountMode,
+    genre_match: MatchMode,
+    actor_match: MatchMode,
+    sort: MovieSort | None,
+    order: SortOrder,
+) -> _BitmapLookup | None:
+    """
+    Find a page of :func:`get_movies` in the bitmap index.
+
+    Returns None when the index is being rebuilt or the cursor values do not
+    compare with the sort column; the caller then uses the SQL path.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    if index is None:
+        return None
+    name = sort or "id"
+    sort_key = column_sort(name, getattr(Movie, name), Movie.id, order)
+    after = decode_cursor(sort_key, cursor) if cursor else None
+    selection = index.select(
+        as_ids(genre_id), director_id, as_ids(actor_id), release_year, genre_match, actor_match
+    )
+    try:
+        keys = index.page(
+            selection, name, order == "desc", limit + 1, 0 if cursor else offset, after
+        )
+    except TypeError:
+        return None
+    total = None if count == "none" else selection.count
+    return _BitmapLookup(sort_key, keys, total, limit, count)
+
+
+def get_movies(
+    db: Session,
+    genre_id: int | Sequence[int] | None = None,
+    director_id: int | None = None,
+    actor_id: int | Sequence[int] | None = None,
+    release_year: int | None = None,
+    q: str | None = None,
+    limit: int = 100,
+    offset: int = 0,
+    cursor: str | None = None,
+    count: CountMode = "exact",
+    genre_match: MatchMode = "any",
+    actor_match: MatchMode = "any",
+    sort: MovieSort | None = None,
+    order: SortOrder = "asc",
+) -> Page:
+    """
+    Retrieve a page of movies with optional filtering.
+
+    Filters movies based on genre, director, actor, release year, or search query.
+    Multiple filters can be combined. Only ``limit`` rows are loaded; use the
+    returned ``next_cursor`` to continue with a keyset seek rather than a growing
+    offset. Items are read from the list card read model as ready-made
+    ``MovieListItem`` JSON documents (:class:`RawJSON`), or, with the read
+    model disabled, as Movie objects with director and genres eager loaded;
+    either way a page costs a fixed number of queries.
+
+    Args:
+        db: Database session
+        genre_id: Filter by one or more genre IDs (optional)
+        director_id: Filter by director ID (optional)
+        actor_id: Filter by one or more actor IDs (optional)
+        release_year: Filter by exact release year (optional)
+        q: Search query for movie title (case-insensitive partial match), served
+            by the full-text index and ranked by relevance when possible (optional)
+        limit: Maximum number of movies to return
+        offset: Number of movies to skip (ignored when a cursor is given)
+        cursor: Opaque cursor from a previous page (optional)
+        count: How to compute the total: "exact", "estimate" or "none"
+        genre_match: With several genre IDs, match "any" or "all" of them
+        actor_match: With several actor IDs, match "any" or "all" of them
+        sort: Column to sort by, ties broken by id; defaults to relevance for
+            searches and id otherwise. With ``count="none"`` a sorted page
+            reads about ``limit`` rows (top-N fast path).
+        order: "asc" or "desc"
+
+    With ``MOVIE_BITMAP_INDEX`` on, requests without ``q`` are matched in the
+    in-memory bitmap index and only the page is read from the database.
+
+    Returns:
+        Page with the movies, total count and next cursor
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    if settings.MOVIE_BITMAP_INDEX and not q:
+        lookup = _bitmap_lookup(
+            current_index(db),
+            genre_id,
+            director_id,
+            actor_id,
+            release_year,
+            limit,
+            offset,
+            cursor,
+            count,
+            genre_match,
+            actor_match,
+            sort,
+            order,
+        )
+        if lookup is not None:
+            items = dict(db.execute(lookup.statement()).all())
+            if lookup.keys and not items and read_model_missing(db):
+                items = dict(db.execute(lookup.statement(read_model=False)).all())
+            return lookup.page(items)
+
+    def page(read_model: bool = True) -> Page:
+        stmt, sort_key = build_movies_statement(
+            db.get_bind().dialect.name,
+            genre_id,
+            director_id,
+            actor_id,
+            release_year,
+            q,
+            genre_match=genre_match,
+            actor_match=actor_match,
+            sort=sort,
+            order=order,
+            top_n=count == "none",
+            read_model=read_model,
+        )
+        return paginate(db, stmt, sort_key, limit=limit, offset=offset, cursor=cursor, count=count)
+
+    result = page()
+    if not result.items and read_model_missing(db):
+        result = page(read_model=False)
+    return result
+
+
+async def get_movies_async(
+    db: AsyncSession,
+    genre_id: int | Sequence[int] | None = None,
+    director_id: int | None = None,
+    actor_id: int | Sequence[int] | None = None,
+    release_year: int | None = None,
+    q: str | None = None,
+    limit: int = 100,
+    offset: int = 0,
+    cursor: str | None = None,
+    count: CountMode = "exact",
+    genre_match: MatchMode = "any",
+    actor_match: MatchMode = "any",
+    sort: MovieSort | None = None,
+    order: SortOrder = "asc",
+) -> Page:
+    """Async counterpart of :func:`get_movies`."""
+    if settings.MOVIE_BITMAP_INDEX and not q:
+        lookup = _bitmap_lookup(
+            await db.run_sync(current_index),
+            genre_id,
+            director_id,
+            actor_id,
+            release_year,
+            limit,
+            offset,
+            cursor,
+            count,
+            genre_match,
+            actor_match,
+            sort,
+            order,
+        )
+        if lookup is not None:
+            items = dict((await db.execute(lookup.statement())).all())
+            if lookup.keys and not items and await db.run_sync(read_model_missing):
+                items = dict((await db.execute(lookup.statement(read_model=False))).all())
+            return lookup.page(items)
+
+    async def page(read_model: bool = True) -> Page:
+        stmt, sort_key = build_movies_statement(
+            db.get_bind().dialect.name,
+            genre_id,
+            director_id,
+            actor_id,
+            release_year,
+            q,
+            genre_match=genre_match,
+            actor_match=actor_match,
+            sort=sort,
+            order=order,
+            top_n=count == "none",
+            read_model=read_model,
+        )
+        return await paginate_async(
+            db, stmt, sort_key, limit=limit, offset=offset, cursor=cursor, count=count
+        )
+
+    result = await page()
+    if not result.items and await db.run_sync(read_model_missing):
+        result = await page(read_model=False)
+    return result
 
 
 def get_movie_by_id(db: Session, movie_id: int) -> Movie | None:
     """
-    Retrieve a single movie by its ID.
+    Retrieve a single movie by its ID with director, genres and actors loaded.
 
     Args:
         db: Database session
@@ -70,4 +419,94 @@ def get_movie_by_id(db: Session, movie_id: int) -> Movie | None:
     Returns:
         Movie object if found, None otherwise
     """
-    return db.query(Movie).filter(Movie.id == movie_id).first()
+    stmt = select(Movie).options(*MOVIE_DETAIL_OPTIONS).where(Movie.id == movie_id)
+    return db.execute(stmt).scalars().first()
+
+
+async def get_movie_by_id_async(db: AsyncSession, movie_id: int) -> Movie | None:
+    """Async counterpart of :func:`get_movie_by_id`."""
+    stmt = select(Movie).options(*MOVIE_DETAIL_OPTIONS).where(Movie.id == movie_id)
+    return (await db.execute(stmt)).scalars().first()
+
+
+def get_movies_by_ids(db: Session, ids: Sequence[int]) -> tuple[list[Movie], list[int]]:
+    """
+    Retrieve several movies with director, genres and actors loaded.
+
+    Costs the same fixed number of queries as :func:`get_movie_by_id`,
+    whatever the number of IDs.
+
+    Args:
+        db: Database session
+        ids: IDs of the movies to retrieve, without duplicates
+
+    Returns:
+        Tuple of (movies in the order of ``ids``, IDs that do not exist)
+    """
+    stmt = select(Movie).options(*MOVIE_DETAIL_OPTIONS).where(Movie.id.in_(ids))
+    return in_request_order(db.execute(stmt).scalars(), ids)
+
+
+async def get_movies_by_ids_async(
+    db: AsyncSession, ids: Sequence[int]
+) -> tuple[list[Movie], list[int]]:
+    """Async counterpart of :func:`get_movies_by_ids`."""
+    stmt = select(Movie).options(*MOVIE_DETAIL_OPTIONS).where(Movie.id.in_(ids))
+    return in_request_order((await db.execute(stmt)).scalars(), ids)
+
+
+def _related_movies_statement(movie_id: int, read_model: bool = True) -> Select:
+    if settings.MOVIE_LIST_READ_MODEL and read_model:
+        stmt = select(LIST_CARD_JSON).join(
+            MovieNeighbour, MovieNeighbour.neighbour_id == MovieListCard.id
+        )
+    else:
+        stmt = (
+            select(Movie)
+            .options(*MOVIE_LIST_OPTIONS)
+            .join(MovieNeighbour, MovieNeighbour.neighbour_id == Movie.id)
+        )
+    return stmt.where(MovieNeighbour.movie_id == movie_id).order_by(MovieNeighbour.rank)
+
+
+def _movie_exists(movie_id: int) -> Select:
+    return select(Movie.id).where(Movie.id == movie_id)
+
+
+def get_related_movies(db: Session, movie_id: int) -> list | None:
+    """
+    Retrieve the movies most similar to a movie, most similar first.
+
+    Reads the precomputed ``movie_neighbours`` rows (see
+    :mod:`app.db.neighbours`) with one lookup on their primary key; only an
+    empty result costs more queries, to tell an unknown movie apart and to
+    check that the read model is built.
+
+    Args:
+        db: Database session
+        movie_id: The ID of the movie
+
+    Returns:
+        List items shaped like those of :func:`get_movies`, or None if the
+        movie does not exist
+    """
+    items = list(db.execute(_related_movies_statement(movie_id)).scalars())
+    if not items:
+        if db.execute(_movie_exists(movie_id)).first() is None:
+            return None
+        if read_model_missing(db):
+            stmt = _related_movies_statement(movie_id, read_model=False)
+            items = list(db.execute(stmt).scalars())
+    return items
+
+
+async def get_related_movies_async(db: AsyncSession, movie_id: int) -> list | None:
+    """Async counterpart of :func:`get_related_movies`."""
+    items = list((await db.execute(_related_movies_statement(movie_id))).scalars())
+    if not items:
+        if (await db.execute(_movie_exists(movie_id))).first() is None:
+            return None
+        if await db.run_sync(read_model_missing):
+            stmt = _related_movies_statement(movie_id, read_model=False)
+            items = list((await db.execute(stmt)).scalars())
+    return items
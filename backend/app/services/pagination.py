@@ -0,0 +1,273 @@
+"""Pagination helpers shared by list services.
+
+Supports classic limit/offset paging plus opaque keyset cursors. A cursor
+encodes the sort key values of the last row of a page, so the next page is
+fetched with a seek predicate (``WHERE (key) > (last key)``) instead of an
+OFFSET scan.
+"""
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any, Literal
+
+from sqlalchemy import Select, and_, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+
+CountMode = Literal["exact", "estimate", "none"]
+SortOrder = Literal["asc", "desc"]
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded or does not match the sort."""
+
+
+@dataclass
+class SortKey:
+    """An ordered list of (column, descending) pairs ending in a unique column."""
+
+    name: str
+    columns: list[tuple[Any, bool]]
+
+    def order_by(self) -> list:
+        return [
+            column.desc() if descending else column.asc() for column, descending in self.columns
+        ]
+
+    def labelled_columns(self) -> list:
+        """Sort columns labelled so their values can be read back from result rows."""
+        return [column.label(f"_sort_{index}") for index, (column, _) in enumerate(self.columns)]
+
+
+def column_sort(name: str, column, id_column, order: SortOrder = "asc") -> SortKey:
+    """
+    Sort by ``column`` then by the unique ``id_column``, both in ``order``.
+
+    The tie-break runs in the same direction as the main column, so an index
+    on ``column`` (which ends in the row ID) serves the whole ORDER BY when
+    scanned forwards or backwards.
+    """
+    descending = order == "desc"
+    columns = [(id_column, descending)]
+    if column is not id_column:
+        columns.insert(0, (column, descending))
+    return SortKey(name=name if order == "asc" else f"-{name}", columns=columns)
+
+
+@dataclass
+class Page:
+    items: list
+    total: int | None
+    next_cursor: str | None = None
+    total_is_estimate: bool = False
+
+
+def encode_cursor(sort_key: SortKey, values: list) -> str:
+    """
+    Encode the sort key values of a row into an opaque, URL-safe cursor.
+
+    Args:
+        sort_key: The sort the cursor belongs to
+        values: Values of the sort key columns for the last row of a page
+
+    Returns:
+        URL-safe base64 string
+    """
+    payload = json.dumps({"s": sort_key.name, "v": values}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def _accepts(column, value) -> bool:
+    """Whether a decoded cursor value can be compared with a sort column."""
+    if value is None:
+        # Aggregates over people without movies sort as NULL
+        return True
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        # Untyped SQL expression: any scalar passes
+        return isinstance(value, str | int | float)
+    if isinstance(value, bool):
+        return python_type is bool
+    if python_type in (float, Decimal):
+        # JSON drops the fraction of whole numbers written by other encoders
+        return isinstance(value, int | float)
+    return isinstance(value, python_type)
+
+
+def decode_cursor(sort_key: SortKey, cursor: str) -> list:
+    """
+    Decode a cursor produced by :func:`encode_cursor`.
+
+    Args:
+        sort_key: The sort the cursor is expected to belong to
+        cursor: Cursor string from the client
+
+    Returns:
+        List of sort key values
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed, was issued for another
+            sort or holds a value of another type than its sort column
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise InvalidCursorError("Malformed cursor") from exc
+
+    if not isinstance(payload, dict) or payload.get("s") != sort_key.name:
+        raise InvalidCursorError("Cursor does not match the requested sort")
+    values = payload.get("v")
+    if not isinstance(values, list) or len(values) != len(sort_key.columns):
+        raise InvalidCursorError("Malformed cursor")
+    # Nested JSON would reach the query as a bind parameter, and a string in
+    # a numeric position would compare by storage class on SQLite (or fail
+    # on PostgreSQL) instead of seeking
+    if not all(
+        _accepts(column, value) for (column, _), value in zip(sort_key.columns, values, strict=True)
+    ):
+        raise InvalidCursorError("Malformed cursor")
+    return values
+
+
+def seek_predicate(sort_key: SortKey, values: list):
+    """
+    Build a predicate selecting rows strictly after ``values`` in sort order.
+
+    Expands the row-value comparison into ``a > x OR (a = x AND b > y) ...`` so
+    mixed ascending/descending keys work on every backend.
+    """
+    clauses = []
+    for index, (column, descending) in enumerate(sort_key.columns):
+        value = values[index]
+        step = column < value if descending else column > value
+        equal_prefix = [
+            prefix_column == values[prefix_index]
+            for prefix_index, (prefix_column, _) in enumerate(sort_key.columns[:index])
+        ]
+        clauses.append(and_(*equal_prefix, step))
+    return or_(*clauses)
+
+
+def count_statement(stmt: Select, mode: CountMode) -> Select | None:
+    """
+    Build the statement counting the rows of a filtered statement.
+
+    Args:
+        stmt: Filtered, unordered statement
+        mode: "exact" runs a full count, "estimate" counts at most
+            ``COUNT_ESTIMATE_CAP`` rows, "none" skips counting
+
+    Returns:
+        Count statement, or None when counting is skipped
+    """
+    if mode == "none":
+        return None
+    inner = stmt.order_by(None)
+    if mode == "estimate":
+        # Count one row past the cap to know whether it was reached
+        inner = inner.limit(settings.COUNT_ESTIMATE_CAP + 1)
+    return select(func.count()).select_from(inner.subquery())
+
+
+def page_statement(
+    stmt: Select,
+    sort_key: SortKey,
+    limit: int,
+    offset: int = 0,
+    cursor: str | None = None,
+) -> Select:
+    """
+    Apply sorting and keyset or offset paging to a filtered statement.
+
+    The sort key values are selected alongside each entity so the cursor can
+    be built from columns that are not entity attributes (e.g. a search rank),
+    and one extra row is fetched to tell whether another page follows.
+
+    Raises:
+        InvalidCursorError: If the cursor is invalid for this sort
+    """
+    stmt = stmt.order_by(*sort_key.order_by())
+    if cursor:
+        stmt = stmt.where(seek_predicate(sort_key, decode_cursor(sort_key, cursor)))
+    elif offset:
+        stmt = stmt.offset(offset)
+    return stmt.add_columns(*sort_key.labelled_columns()).limit(limit + 1)
+
+
+def build_page(
+    rows: list, sort_key: SortKey, limit: int, total: int | None, mode: CountMode
+) -> Page:
+    """Turn the rows of a :func:`page_statement` into a :class:`Page`."""
+    total_is_estimate = False
+    if mode == "estimate" and total is not None and total > settings.COUNT_ESTIMATE_CAP:
+        total, total_is_estimate = settings.COUNT_ESTIMATE_CAP, True
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(sort_key, list(rows[-1][1:]))
+
+    return Page(
+        items=[row[0] for row in rows],
+        total=total,
+        next_cursor=next_cursor,
+        total_is_estimate=total_is_estimate,
+    )
+
+
+def paginate(
+    db: Session,
+    stmt: Select,
+    sort_key: SortKey,
+    limit: int,
+    offset: int = 0,
+    cursor: str | None = None,
+    count: CountMode = "exact",
+) -> Page:
+    """
+    Count and fetch one page of a filtered statement.
+
+    Args:
+        db: Database session
+        stmt: Filtered statement selecting a single entity
+        sort_key: Sort to apply; its last column must be unique
+        limit: Maximum number of rows to return
+        offset: Number of rows to skip (ignored when a cursor is given)
+        cursor: Opaque cursor returned by a previous page (optional)
+        count: How to compute the total ("exact", "estimate" or "none")
+
+    Returns:
+        Page with items, total and the cursor for the following page
+
+    Raises:
+        InvalidCursorError: If the cursor is invalid for this sort
+    """
+    page_stmt = page_statement(stmt, sort_key, limit, offset, cursor)
+    total_stmt = count_statement(stmt, count)
+    total = db.execute(total_stmt).scalar_one() if total_stmt is not None else None
+    rows = db.execute(page_stmt).all()
+    return build_page(rows, sort_key, limit, total, count)
+
+
+async def paginate_async(
+    db: AsyncSession,
+    stmt: Select,
+    sort_key: SortKey,
+    limit: int,
+    offset: int = 0,
+    cursor: str | None = None,
+    count: CountMode = "exact",
+) -> Page:
+    """Async counterpart of :func:`paginate`."""
+    page_stmt = page_statement(stmt, sort_key, limit, offset, cursor)
+    total_stmt = count_statement(stmt, count)
+    total = (await db.execute(total_stmt)).scalar_one() if total_stmt is not None else None
+    rows = (await db.execute(page_stmt)).all()
+    return build_page(rows, sort_key, limit, total, count)
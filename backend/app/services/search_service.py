@@ -0,0 +1,84 @@
+"""Title search backed by the full-text index in ``app.db.search_index``."""
+
+import re
+
+from sqlalchemy import Float, column, func, literal_column, select, table
+from sqlalchemy.sql import Subquery
+
+from app.db.search_index import POSTGRES_TSVECTOR, SQLITE_FTS_TABLE, sqlite_tokenizer
+from app.models.movie import Movie
+
+# Trigram tokens are three characters long; shorter queries cannot use the index
+TRIGRAM_MIN_LENGTH = 3
+
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def _sqlite_match_expression(q: str) -> str | None:
+    if sqlite_tokenizer() == "trigram":
+        if len(q) < TRIGRAM_MIN_LENGTH:
+            return None
+        # A quoted phrase matches the query as a case-insensitive substring
+        return '"' + q.replace('"', '""') + '"'
+
+    words = _WORD_RE.findall(q)
+    if not words:
+        return None
+    return " ".join(f'"{word}"*' for word in words)
+
+
+def _postgres_tsquery(q: str) -> str | None:
+    words = _WORD_RE.findall(q.lower())
+    if not words:
+        return None
+    return " & ".join(f"{word}:*" for word in words)
+
+
+def title_search_subquery(dialect_name: str, q: str) -> Subquery | None:
+    """
+    Build a subquery of ``(movie_id, rank)`` for movies whose title matches ``q``.
+
+    Lower ranks are better matches. Every word (or, with the trigram tokenizer,
+    the whole query) is matched as a prefix/substring so search-as-you-type
+    works from the first few characters.
+
+    Args:
+        dialect_name: Name of the database dialect ("sqlite", "postgresql", ...)
+        q: Raw search text from the client
+
+    Returns:
+        Subquery to join on ``movies.id``, or None when the index cannot serve
+        the query (unsupported backend or too-short trigram query)
+    """
+    q = q.strip()
+    if dialect_name == "sqlite":
+        expression = _sqlite_match_expression(q)
+        if expression is None:
+            return None
+        fts_table = table(SQLITE_FTS_TABLE, column("rowid"))
+        fts = literal_column(SQLITE_FTS_TABLE)
+        return (
+            select(
+                fts_table.c.rowid.label("movie_id"),
+                func.bm25(fts, type_=Float).label("rank"),
+            )
+            .where(fts.op("MATCH")(expression))
+            .subquery("title_matches")
+        )
+
+    if dialect_name == "postgresql":
+        tsquery_text = _postgres_tsquery(q)
+        if tsquery_text is None:
+            return None
+        tsvector = literal_column(POSTGRES_TSVECTOR)
+        tsquery = func.to_tsquery(literal_column("'simple'"), tsquery_text)
+        return (
+            select(
+                Movie.id.label("movie_id"),
+                (-func.ts_rank(tsvector, tsquery, type_=Float)).label("rank"),
+            )
+            .where(tsvector.op("@@")(tsquery))
+            .subquery("title_matches")
+        )
+
+    return None
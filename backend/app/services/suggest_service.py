@@ -0,0 +1,300 @@
+"""Typeahead suggestions from an in-memory prefix index.
+
+Movie titles, actor names and director names are folded (case and
+diacritics: "Amélie" -> "amelie") and indexed once per word, so "nol"
+suggests "Christopher Nolan". Each kind keeps its keys in one sorted list:
+the entries matching a prefix are the contiguous range found by two
+bisections. Suggestions are ranked by rating: a movie's own rating, and
+for a person the best rating among their movies.
+
+Short prefixes match a large share of the catalogue, so the best entries
+for every prefix of up to ``SHORT_PREFIX_LENGTH`` characters are computed
+when the index is built; longer prefixes rank the entries in their range,
+and remember the result when that range is large.
+
+Like the bitmap index, the suggestion index remembers the catalogue
+revision it was built at and is rebuilt in a background thread when the
+revision moves. Requests arriving during a rebuild are answered from the
+previous index, without validators, since the body lags the revision.
+"""
+
+import heapq
+import logging
+import re
+import threading
+import unicodedata
+from bisect import bisect_left
+from dataclasses import dataclass
+from functools import lru_cache
+
+from sqlalchemy import func, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.async_session import to_sync_url
+from app.db.catalogue_events import get_catalogue_revision
+from app.db.session import create_db_engine, is_sqlite_memory
+from app.models.actor import Actor
+from app.models.associations import movie_actors
+from app.models.director import Director
+from app.models.movie import Movie
+
+# Prefixes up to this length are answered from precomputed lists
+SHORT_PREFIX_LENGTH = 3
+
+# Longer prefixes matching more keys than this keep their ranking once computed
+HEAVY_RANGE = 2048
+
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+_SPACES_RE = re.compile(r"\s+")
+
+# Sorts after every character that can follow a prefix
+_PREFIX_END = "\U0010ffff"
+
+logger = logging.getLogger("app.services.suggest_service")
+
+
+def fold(text: str) -> str:
+    """Casefold ``text``, strip diacritics and collapse whitespace."""
+    if text.isascii():
+        return _SPACES_RE.sub(" ", text.lower()).strip()
+    decomposed = unicodedata.normalize("NFKD", text)
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return _SPACES_RE.sub(" ", stripped.casefold()).strip()
+
+
+def _word_keys(folded: str) -> set[str]:
+    """The folded text from the start of each of its words."""
+    return {folded[match.start() :] for match in _WORD_RE.finditer(folded)} or {folded}
+
+
+@dataclass
+class Entry:
+    id: int
+    name: str
+    rating: float
+    release_year: int | None = None
+
+
+class PrefixIndex:
+    """Entries of one kind, searchable by the prefix of any of their words."""
+
+    def __init__(self, entries: list[Entry], top_k: int):
+        # Best first: highest rating, then name and ID for a stable order
+        self.entries = sorted(entries, key=lambda entry: (-entry.rating, entry.name, entry.id))
+
+        pairs = []
+        short: dict[str, list[int]] = {}
+        for rank, entry in enumerate(self.entries):
+            keys = _word_keys(fold(entry.name))
+            pairs.extend((key, rank) for key in keys)
+            prefixes = {
+                key[:length] for key in keys for length in range(1, SHORT_PREFIX_LENGTH + 1)
+            }
+            for prefix in prefixes:
+                # Entries are visited best first, so each list is already ranked
+                ranks = short.setdefault(prefix, [])
+                if len(ranks) < top_k:
+                    ranks.append(rank)
+        pairs.sort()
+        self.keys = [key for key, _ in pairs]
+        self.ranks = [rank for _, rank in pairs]
+        self.short = short
+        self.top_k = top_k
+        self._heavy: dict[str, list[int]] = {}
+
+    def search(self, prefix: str, limit: int) -> list[Entry]:
+        """Return the best ``limit`` entries with a word starting with folded ``prefix``."""
+        if len(prefix) <= SHORT_PREFIX_LENGTH:
+            ranks = self.short.get(prefix, ())
+        elif (ranks := self._heavy.get(prefix)) is None:
+            start = bisect_left(self.keys, prefix)
+            stop = bisect_left(self.keys, prefix + _PREFIX_END, start)
+            if stop - start <= HEAVY_RANGE:
+                ranks = heapq.nsmallest(limit, set(self.ranks[start:stop]))
+            else:
+                ranks = self._heavy[prefix] = heapq.nsmallest(
+                    self.top_k, set(self.ranks[start:stop])
+                )
+        return [self.entries[rank] for rank in ranks[:limit]]
+
+
+class SuggestIndex:
+    """Prefix indexes over movie titles, actor names and director names."""
+
+    def __init__(
+        self, revision: int, movies: list[Entry], actors: list[Entry], directors: list[Entry]
+    ):
+        top_k = settings.SUGGEST_MAX_LIMIT
+        self.revision = revision
+        self.movies = PrefixIndex(movies, top_k)
+        self.actors = PrefixIndex(actors, top_k)
+        self.directors = PrefixIndex(directors, top_k)
+
+    @classmethod
+    def build(cls, db: Session, revision: int) -> "SuggestIndex":
+        """Load names and ratings in three statements."""
+        connection = db.connection()
+        movies = [
+            Entry(*row)
+            for row in connection.execute(
+                select(Movie.id, Movie.title, Movie.rating, Movie.release_year)
+            )
+        ]
+        best_actor_rating = (
+            select(movie_actors.c.actor_id, func.max(Movie.rating).label("rating"))
+            .join(Movie, Movie.id == movie_actors.c.movie_id)
+            .group_by(movie_actors.c.actor_id)
+            .subquery()
+        )
+        actors = [
+            Entry(*row)
+            for row in connection.execute(
+                select(
+                    Actor.id, Actor.name, func.coalesce(best_actor_rating.c.rating, 0)
+                ).outerjoin(best_actor_rating, best_actor_rating.c.actor_id == Actor.id)
+            )
+        ]
+        best_director_rating = (
+            select(Movie.director_id, func.max(Movie.rating).label("rating"))
+            .group_by(Movie.director_id)
+            .subquery()
+        )
+        directors = [
+            Entry(*row)
+            for row in connection.execute(
+                select(
+                    Director.id, Director.name, func.coalesce(best_director_rating.c.rating, 0)
+                ).outerjoin(best_director_rating, best_director_rating.c.director_id == Director.id)
+            )
+        ]
+        return cls(revision, movies, actors, directors)
+
+    def suggest(self, q: str, limit: int) -> dict[str, list[dict]]:
+        """Best ``limit`` movies, actors and directors for the text typed so far."""
+        prefix = fold(q)
+        if not prefix:
+            return {"movies": [], "actors": [], "directors": []}
+        return {
+            "movies": [
+                {
+                    "id": entry.id,
+                    "title": entry.name,
+                    "release_year": entry.release_year,
+                    "rating": entry.rating,
+                }
+                for entry in self.movies.search(prefix, limit)
+            ],
+            "actors": [
+                {"id": entry.id, "name": entry.name} for entry in self.actors.search(prefix, limit)
+            ],
+            "directors": [
+                {"id": entry.id, "name": entry.name}
+                for entry in self.directors.search(prefix, limit)
+            ],
+        }
+
+
+_index: SuggestIndex | None = None
+_rebuild_lock = threading.Lock()
+_rebuild_thread: threading.Thread | None = None
+
+
+def _rebuild(bind: Engine) -> None:
+    global _index
+    try:
+        with Session(bind) as db:
+            _index = SuggestIndex.build(db, get_catalogue_revision(db))
+    except Exception:
+        # The next request that finds the index stale tries again
+        logger.exception("suggestion index rebuild failed")
+    finally:
+        _rebuild_lock.release()
+
+
+@lru_cache
+def _rebuild_engine(url: str) -> Engine:
+    # Same as bitmap_index._rebuild_engine: rebuild threads need a sync engine
+    return create_db_engine(to_sync_url(url).render_as_string(hide_password=False))
+
+
+def start_suggest_rebuild(bind: Engine) -> threading.Thread | None:
+    """
+    Rebuild the index from ``bind`` in a background thread.
+
+    Returns:
+        The rebuild thread, or None if a rebuild is already running
+    """
+    global _rebuild_thread
+    if not _rebuild_lock.acquire(blocking=False):
+        return None
+    _rebuild_thread = threading.Thread(
+        target=_rebuild, args=(bind,), name="suggest-index-rebuild", daemon=True
+    )
+    _rebuild_thread.start()
+    return _rebuild_thread
+
+
+def current_suggest_index(db: Session) -> SuggestIndex:
+    """
+    Return the suggestion index, at the catalogue revision seen by ``db`` if it has one.
+
+    A stale index starts a rebuild in the background (see
+    :func:`start_suggest_rebuild`) and keeps answering until the new one is
+    swapped in, so callers should compare its ``revision``. Only the very
+    first build, and builds over in-memory SQLite that other connections
+    cannot see, run in the request and make concurrent requests wait.
+    """
+    global _index
+    revision = get_catalogue_revision(db)
+    index = _index
+    # Newer than a lagging replica is fine; see bitmap_index.current_index
+    if index is not None and index.revision >= revision:
+        return index
+    bind = db.get_bind()
+    url = bind.url.render_as_string(hide_password=False)
+    if index is not None and not is_sqlite_memory(url):
+        start_suggest_rebuild(_rebuild_engine(url) if bind.dialect.is_async else bind)
+        return index
+    if not _rebuild_lock.acquire(blocking=index is None):
+        return index
+    try:
+        if _index is None or _index.revision < revision:
+            _index = SuggestIndex.build(db, revision)
+        return _index
+    finally:
+        _rebuild_lock.release()
+
+
+def wait_for_suggest_rebuild(timeout: float | None = None) -> None:
+    """Block until a running rebuild finished, e.g. in tests."""
+    thread = _rebuild_thread
+    if thread is not None:
+        thread.join(timeout)
+
+
+def reset_suggest_index() -> None:
+    """Drop the index, e.g. after the database was replaced wholesale."""
+    global _index
+    wait_for_suggest_rebuild()
+    _index = None
+
+
+def get_suggestions(db: Session, q: str, limit: int) -> tuple[int, dict[str, list[dict]]]:
+    """
+    Suggest movies, actors and directors whose title or name has a word starting with ``q``.
+
+    Args:
+        db: Database session; reads the catalogue revision, and starts a
+            rebuild of the index when it changed
+        q: Text typed so far; case and diacritics are ignored
+        limit: Suggestions per kind, at most ``SUGGEST_MAX_LIMIT``
+
+    Returns:
+        The catalogue revision of the index that answered, which is behind
+        ``db`` while a rebuild runs, and a dict with "movies", "actors" and
+        "directors" lists, best rated first
+    """
+    index = current_suggest_index(db)
+    return index.revision, index.suggest(q, limit)
@@ -3,10 +3,14 @@ from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
+from app.core.cache import get_cache
 from app.db.base import Base
 from app.db.init_db import seed_data
+from app.db.query_counter import QueryCounter
 from app.db.session import get_db
 from app.main import app
+from app.services.bitmap_index import reset_index
+from app.services.suggest_service import reset_suggest_index
 
 # Create test database (in-memory SQLite)
 SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
@@ -38,6 +42,9 @@ def client(db):
         yield db
 
     app.dependency_overrides[get_db] = override_get_db
+    get_cache().clear()
+    reset_index()
+    reset_suggest_index()
 
     # Seed minimal data
     seed_data(db)
@@ -46,3 +53,22 @@ def client(db):
         yield test_client
 
     app.dependency_overrides.clear()
+
+
+@pytest.fixture(scope="function")
+def query_counter():
+    """QueryCounter bound to the test engine; use it as a context manager."""
+    return QueryCounter(engine)
+
+
+@pytest.fixture(scope="function")
+def count_queries():
+    """Return a function that counts the SQL statements issued by one request."""
+
+    def _count(client, url):
+        with QueryCounter(engine) as counter:
+            response = client.get(url)
+        assert response.status_code == 200, response.text
+        return counter.count
+
+    return _count
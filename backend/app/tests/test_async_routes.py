@@ -0,0 +1,109 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.api.v1.api import build_api_router
+from app.core.cache import get_cache
+from app.core.config import settings
+from app.db import async_session
+from app.db.async_session import get_async_db, to_async_url
+from app.db.replicas import READ_YOUR_WRITES_HEADER, ReplicaSet
+from app.services import bitmap_index
+from app.services.bitmap_index import wait_for_rebuild
+from app.tests.conftest import SQLALCHEMY_DATABASE_URL
+from app.tests.test_replicas import make_replica
+
+pytest.importorskip("aiosqlite")
+
+
+@pytest.fixture(scope="function")
+def async_client(client):
+    """Client for an app serving the catalogue routes with async handlers."""
+    async_engine = create_async_engine(to_async_url(SQLALCHEMY_DATABASE_URL))
+    sessionmaker = async_sessionmaker(async_engine, expire_on_commit=False)
+
+    async def override_get_async_db():
+        async with sessionmaker() as db:
+            yield db
+
+    async_app = FastAPI()
+    async_app.include_router(build_api_router(async_mode=True), prefix="/api/v1")
+    async_app.dependency_overrides[get_async_db] = override_get_async_db
+
+    with TestClient(async_app) as test_client:
+        yield test_client
+
+
+def test_to_async_url_swaps_driver():
+    assert to_async_url("sqlite:///./movie.db").drivername == "sqlite+aiosqlite"
+    assert to_async_url("postgresql://u:p@host/db").drivername == "postgresql+asyncpg"
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "/api/v1/movies",
+        "/api/v1/movies?limit=4",
+        "/api/v1/movies?q=the",
+        "/api/v1/movies/1",
+        "/api/v1/movies/facets?genreId=1",
+        "/api/v1/movies/1/related",
+        "/api/v1/actors",
+        "/api/v1/actors/1",
+        "/api/v1/actors/1/costars",
+        "/api/v1/actors/1/movies?sort=rating",
+        "/api/v1/actors?summary=true&sort=movie_count&order=desc",
+        "/api/v1/actors/1?summary=true",
+        "/api/v1/directors",
+        "/api/v1/directors/1",
+        "/api/v1/directors/1/movies",
+        "/api/v1/directors?summary=true",
+        "/api/v1/directors/1?summary=true",
+        "/api/v1/genres",
+    ],
+)
+def test_async_routes_match_sync_routes(client, async_client, url):
+    sync_response = client.get(url)
+    async_response = async_client.get(url)
+    assert async_response.status_code == sync_response.status_code == 200
+    assert async_response.json() == sync_response.json()
+
+
+def test_async_routes_validate_parameters(async_client):
+    assert async_client.get("/api/v1/movies?genreId=0").status_code == 400
+    assert async_client.get("/api/v1/movies?cursor=bad").status_code == 400
+    assert async_client.get("/api/v1/movies/99999").status_code == 404
+
+
+@pytest.mark.parametrize("resource", ["movies", "actors", "directors"])
+def test_async_batch_matches_sync_batch(client, async_client, resource):
+    body = {"ids": [2, 99999, 1]}
+    async_response = async_client.post(f"/api/v1/{resource}/batch", json=body)
+    assert async_response.status_code == 200
+    assert async_response.json() == client.post(f"/api/v1/{resource}/batch", json=body).json()
+
+
+def test_async_bitmap_index_matches_sync(client, async_client, monkeypatch):
+    monkeypatch.setattr(settings, "MOVIE_BITMAP_INDEX", True)
+    url = "/api/v1/movies?genreId=1&genreId=2&sort=rating&order=desc&limit=3"
+    async_client.get(url)
+    wait_for_rebuild()
+    assert bitmap_index._index is not None
+    async_response = async_client.get(url)
+    assert async_response.status_code == 200
+    assert async_response.json() == client.get(url).json()
+
+
+def test_async_reads_are_served_by_a_replica(async_client, monkeypatch, tmp_path):
+    make_replica(tmp_path / "replica.db", "From Replica").dispose()
+    url = f"sqlite:///file:{tmp_path / 'replica.db'}?mode=ro&uri=true"
+    replica = async_session.create_async_db_engine(to_async_url(url), url)
+    replicas = ReplicaSet([replica], retry_after=60)
+    monkeypatch.setattr(async_session, "get_async_replicas", lambda: replicas)
+
+    get_cache().clear()
+    assert async_client.get("/api/v1/movies/1").json()["title"] == "From Replica"
+    get_cache().clear()
+    pinned = async_client.get("/api/v1/movies/1", headers={READ_YOUR_WRITES_HEADER: "1"})
+    assert pinned.json()["title"] == "Inception"
@@ -0,0 +1,49 @@
+import pytest
+
+from app.core.config import settings
+from app.db.query_counter import QueryCounter
+from app.tests.conftest import engine
+
+
+@pytest.mark.parametrize("resource", ["movies", "actors", "directors"])
+def test_batch_preserves_order_and_reports_missing(client, resource):
+    response = client.post(f"/api/v1/{resource}/batch", json={"ids": [3, 99999, 1, 3, 2]})
+    assert response.status_code == 200
+    body = response.json()
+    assert [item["id"] for item in body["items"]] == [3, 1, 2]
+    assert body["missing"] == [99999]
+    # Same representation as the single-item endpoint
+    assert body["items"][1] == client.get(f"/api/v1/{resource}/1").json()
+
+
+@pytest.mark.parametrize(
+    "ids",
+    [[], [0], [1, -2], list(range(1, settings.MAX_BATCH_SIZE + 2))],
+)
+def test_batch_rejects_invalid_ids(client, ids):
+    response = client.post("/api/v1/movies/batch", json={"ids": ids})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid ids"
+
+
+def test_batch_requires_id_list(client):
+    assert client.post("/api/v1/movies/batch", json={}).status_code == 422
+    assert client.post("/api/v1/movies/batch", json={"ids": "1,2"}).status_code == 422
+
+
+@pytest.mark.parametrize("resource", ["movies", "actors", "directors"])
+def test_batch_query_count_does_not_grow_with_ids(client, resource):
+    counts = []
+    for ids in ([1], [1, 2, 3, 4, 5]):
+        with QueryCounter(engine) as counter:
+            response = client.post(f"/api/v1/{resource}/batch", json={"ids": ids})
+        assert response.status_code == 200
+        counts.append(counter.count)
+    # The entity query plus one selectin load per relationship, however many IDs
+    assert counts[0] == counts[1] <= 4
+
+
+def test_batch_skips_conditional_headers(client):
+    response = client.post("/api/v1/movies/batch", json={"ids": [1]})
+    assert response.status_code == 200
+    assert "etag" not in response.headers
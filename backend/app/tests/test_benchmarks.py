@@ -0,0 +1,77 @@
+import json
+
+from sqlalchemy import func, select
+
+from app.core.config import settings
+from app.models.movie import Movie
+from benchmarks import endpoints, neighbours, serialization
+from benchmarks.synthetic import generate_records, open_catalogue, parse_scale
+
+
+def test_generator_is_deterministic():
+    first = list(generate_records(200, seed=7))
+    assert first == list(generate_records(200, seed=7))
+    assert first != list(generate_records(200, seed=8))
+
+    for record in first:
+        assert 1 <= len(record["genres"]) <= 3
+        assert 2 <= len(record["actors"]) <= 12
+        assert 1.0 <= record["rating"] <= 10.0
+
+
+def test_parse_scale():
+    assert parse_scale("100k") == 100_000
+    assert parse_scale("1M") == 1_000_000
+    assert parse_scale("2500") == 2500
+
+
+def test_endpoint_benchmark_writes_json(tmp_path):
+    database = tmp_path / "bench.db"
+    engine = open_catalogue(database, 300, seed=1)
+    with engine.connect() as connection:
+        assert connection.execute(select(func.count()).select_from(Movie)).scalar() == 300
+
+    output = tmp_path / "results.json"
+    endpoints.main(
+        [
+            "--database",
+            str(database),
+            "--reuse",
+            "--requests",
+            "3",
+            "--warmup",
+            "0",
+            "--case",
+            "^(movies|movie detail|genres)$",
+            "--output",
+            str(output),
+        ]
+    )
+
+    report = json.loads(output.read_text())
+    assert report["meta"]["movies"] == 300
+    results = {row["name"]: row for row in report["results"]}
+    assert set(results) == {"movies", "movie detail", "genres"}
+    for row in results.values():
+        assert row["errors"] == 0
+        assert row["p50_ms"] <= row["p95_ms"] <= row["p99_ms"]
+        assert row["queries_per_request"] > 0
+
+
+def test_serialization_benchmark_compares_paths(tmp_path):
+    engine = open_catalogue(tmp_path / "bench.db", 200, seed=1)
+    pairs = serialization.compare(engine, serialization.build_cases(limit=50), 2, 0)
+
+    assert settings.FAST_SERIALIZATION is True
+    for validated, fast in pairs:
+        assert validated.name == fast.name
+        assert validated.errors == fast.errors == 0
+        assert validated.response_bytes > 0 and fast.response_bytes > 0
+
+
+def test_neighbour_scoring_scales_linearly():
+    # Small inverted lists make the prolific ones show at small scales; scanning
+    # them in full grows the cost per movie about 1.6x per doubling
+    results = [neighbours.measure(movies, max_posting=25, repeat=2) for movies in (1000, 8000)]
+    assert all(result.neighbours for result in results)
+    assert neighbours.growth_per_doubling(results) < 1.4
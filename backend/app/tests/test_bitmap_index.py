@@ -0,0 +1,140 @@
+import threading
+
+import pytest
+
+from app.core.config import settings
+from app.models.movie import Movie
+from app.services import bitmap_index
+from app.services.bitmap_index import MovieBitmapIndex, current_index, wait_for_rebuild
+from app.tests.test_sorting import MOVIE_SORTS, walk
+
+QUERIES = [
+    "",
+    "genreId=1",
+    "genreId=1&genreId=2",
+    "genreId=1&genreId=2&genreMatch=all",
+    "genreId=99",
+    "directorId=1",
+    "directorId=1&genreId=3",
+    "actorId=1",
+    "actorId=1&actorId=2",
+    "actorId=1&actorId=2&actorMatch=all",
+    "releaseYear=2010",
+    "releaseYear=2010&genreId=1&actorId=1",
+    "count=estimate&genreId=2",
+    "count=none&offset=2&limit=3",
+    "offset=3&limit=2&sort=rating&order=desc",
+]
+
+
+def build_index(client):
+    """Have a request start the background rebuild of the index and wait for it."""
+    client.get("/api/v1/movies?limit=1")
+    wait_for_rebuild()
+
+
+def responses(client, monkeypatch, url):
+    """Response bodies of ``url`` from the SQL path and from the bitmap index."""
+    monkeypatch.setattr(settings, "MOVIE_BITMAP_INDEX", False)
+    sql = client.get(url).json()
+    monkeypatch.setattr(settings, "MOVIE_BITMAP_INDEX", True)
+    build_index(client)
+    return sql, client.get(url).json()
+
+
+@pytest.mark.parametrize("read_model", [True, False])
+@pytest.mark.parametrize("query", QUERIES)
+def test_index_matches_sql_path(client, monkeypatch, query, read_model):
+    monkeypatch.setattr(settings, "MOVIE_LIST_READ_MODEL", read_model)
+    sql, indexed = responses(client, monkeypatch, f"/api/v1/movies?{query}")
+    assert indexed == sql
+
+
+@pytest.mark.parametrize("order", ["asc", "desc"])
+@pytest.mark.parametrize("sort", MOVIE_SORTS)
+def test_index_cursors_walk_like_sql_cursors(client, monkeypatch, sort, order):
+    for query in ("", "genreId=1&genreId=2", "actorId=1&actorId=3"):
+        url = f"/api/v1/movies?{query}&sort={sort}&order={order}&limit=2&count=none"
+        monkeypatch.setattr(settings, "MOVIE_BITMAP_INDEX", False)
+        expected = walk(client, url)
+        monkeypatch.setattr(settings, "MOVIE_BITMAP_INDEX", True)
+        build_index(client)
+        assert walk(client, url) == expected
+
+
+def test_large_results_walk_the_sort_ordering(client, monkeypatch):
+    monkeypatch.setattr(bitmap_index, "SMALL_RESULT", 0)
+    for sort in MOVIE_SORTS:
+        url = f"/api/v1/movies?genreId=1&genreId=2&sort={sort}&order=desc&limit=3&count=none"
+        monkeypatch.setattr(settings, "MOVIE_BITMAP_INDEX", False)
+        expected = walk(client, url)
+        monkeypatch.setattr(settings, "MOVIE_BITMAP_INDEX", True)
+        build_index(client)
+        assert walk(client, url) == expected
+
+
+def test_index_only_hydrates_the_page(client, monkeypatch, count_queries):
+    monkeypatch.setattr(settings, "MOVIE_BITMAP_INDEX", True)
+    url = "/api/v1/movies?genreId=1&genreId=2&genreMatch=all&actorId=1&limit=5"
+    build_index(client)
+    # ETag revision lookup + index revision check + one page of cards
+    assert count_queries(client, url) == 3
+
+
+def test_index_is_rebuilt_when_the_catalogue_changes(client, db, monkeypatch):
+    monkeypatch.setattr(settings, "MOVIE_BITMAP_INDEX", True)
+    before = client.get("/api/v1/movies?directorId=1").json()
+    movie = Movie(title="Index Test", release_year=2030, rating=9.9, director_id=1)
+    db.add(movie)
+    db.commit()
+
+    build_index(client)
+    after = client.get("/api/v1/movies?directorId=1").json()
+    assert after["total"] == before["total"] + 1
+    assert after["items"][-1]["id"] == movie.id
+    sql, indexed = responses(client, monkeypatch, "/api/v1/movies?releaseYear=2030")
+    assert indexed == sql
+    assert indexed["total"] == 1
+
+
+def test_search_and_busy_rebuilds_use_the_sql_path(client, db, monkeypatch):
+    monkeypatch.setattr(settings, "MOVIE_BITMAP_INDEX", True)
+    assert client.get("/api/v1/movies?q=the").json()["items"]
+
+    # Another request holds the rebuild lock: fall back instead of waiting
+    with bitmap_index._rebuild_lock:
+        assert current_index(db) is None
+        assert client.get("/api/v1/movies?genreId=1").status_code == 200
+    assert current_index(db) is None
+    wait_for_rebuild()
+    assert current_index(db) is not None
+
+
+def test_stale_index_is_rebuilt_in_the_background(client, monkeypatch):
+    monkeypatch.setattr(settings, "MOVIE_BITMAP_INDEX", True)
+    release = threading.Event()
+    build = MovieBitmapIndex.build.__func__
+
+    def slow_build(cls, db, revision):
+        release.wait(timeout=10)
+        return build(cls, db, revision)
+
+    monkeypatch.setattr(MovieBitmapIndex, "build", classmethod(slow_build))
+    url = "/api/v1/movies?genreId=1&limit=3"
+    try:
+        # Served by the SQL path while the build is stuck
+        sql = client.get(url)
+        assert sql.status_code == 200
+        assert bitmap_index._index is None
+    finally:
+        release.set()
+    wait_for_rebuild()
+    assert bitmap_index._index is not None
+    assert client.get(url).json() == sql.json()
+
+
+def test_index_rejects_cursor_of_another_sort(client, monkeypatch):
+    monkeypatch.setattr(settings, "MOVIE_BITMAP_INDEX", True)
+    cursor = client.get("/api/v1/movies?sort=rating&limit=2").json()["next_cursor"]
+    response = client.get(f"/api/v1/movies?sort=title&cursor={cursor}")
+    assert response.status_code == 400
@@ -0,0 +1,87 @@
+import time
+
+from app.core.cache import CachedPayload, InMemoryLRUCache, get_cache, make_cache_key
+from app.models.genre import Genre
+from app.models.movie import Movie
+
+
+def payload(size):
+    return CachedPayload(body=b"x" * size)
+
+
+def test_cache_key_normalizes_parameters():
+    assert make_cache_key("movies", {"b": 2, "a": 1, "c": None}) == "movies:a=1&b=2"
+    assert make_cache_key("genres") == "genres:"
+
+
+def test_lru_evicts_least_recently_used():
+    cache = InMemoryLRUCache(max_entries=2, max_bytes=1000, default_ttl=60)
+    cache.set("a:1", payload(1))
+    cache.set("a:2", payload(1))
+    assert cache.get("a:1") is not None
+    cache.set("a:3", payload(1))
+
+    assert cache.get("a:2") is None
+    assert cache.get("a:1") is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_lru_is_bounded_by_bytes():
+    cache = InMemoryLRUCache(max_entries=100, max_bytes=10, default_ttl=60)
+    cache.set("a:1", payload(6))
+    cache.set("a:2", payload(6))
+    assert cache.stats()["bytes"] == 6
+    assert cache.get("a:1") is None
+
+
+def test_entries_expire_after_ttl():
+    cache = InMemoryLRUCache(max_entries=10, max_bytes=1000, default_ttl=60)
+    cache.set("a:1", payload(1), ttl=0.01)
+    time.sleep(0.02)
+    assert cache.get("a:1") is None
+    assert cache.stats()["expirations"] == 1
+
+
+def test_invalidate_namespace():
+    cache = InMemoryLRUCache(max_entries=10, max_bytes=1000, default_ttl=60)
+    cache.set("movie:id=1", payload(1))
+    cache.set("genres:", payload(1))
+    cache.invalidate("movie")
+    assert cache.get("movie:id=1") is None
+    assert cache.get("genres:") is not None
+
+
+def test_repeated_requests_are_cache_hits(client, count_queries):
+    client.get("/api/v1/genres")
+    hits_before = client.get("/api/v1/health/cache").json()["hits"]
+
+    # Only the catalogue revision read remains on a hit
+    assert count_queries(client, "/api/v1/genres") == 1
+    assert count_queries(client, "/api/v1/movies/1") > 1
+    assert count_queries(client, "/api/v1/movies/1") == 1
+    assert client.get("/api/v1/health/cache").json()["hits"] == hits_before + 2
+
+
+def test_commit_invalidates_cached_responses(client, db):
+    before = client.get("/api/v1/genres").json()
+    db.add(Genre(name="Documentary"))
+    db.commit()
+    after = client.get("/api/v1/genres").json()
+    assert after["total"] == before["total"] + 1
+
+    client.get("/api/v1/movies/1")
+    movie = db.get(Movie, 1)
+    movie.title = "Renamed"
+    db.commit()
+    assert client.get("/api/v1/movies/1").json()["title"] == "Renamed"
+
+
+def test_bodies_read_at_another_revision_are_misses(client):
+    fresh = client.get("/api/v1/genres")
+    revision = int(fresh.headers["etag"].strip('"').split("-")[0])
+
+    # A request that read revision N stored its body after the cache was cleared for N+1
+    key = make_cache_key("genres")
+    get_cache().set(key, CachedPayload(body=b'{"items": [], "total": 0}', revision=revision - 1))
+    assert client.get("/api/v1/genres").json() == fresh.json()
+    assert get_cache().get(key).revision == revision
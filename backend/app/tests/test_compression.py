@@ -0,0 +1,106 @@
+import pytest
+
+from app.core import compression
+from app.core.compression import negotiate
+from app.core.config import settings
+from app.core.metrics import (
+    compression_cpu_seconds,
+    compression_input_bytes,
+    compression_output_bytes,
+    precompressed_responses,
+)
+
+GZIP = {"Accept-Encoding": "gzip"}
+IDENTITY = {"Accept-Encoding": "identity"}
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        (None, None),
+        ("identity", None),
+        ("gzip", "gzip"),
+        ("deflate, gzip;q=0.5", "gzip"),
+        ("gzip;q=0", None),
+        ("*", "gzip"),
+        ("*;q=0.1, gzip;q=0", None),
+    ],
+)
+def test_negotiate_without_brotli(monkeypatch, header, expected):
+    monkeypatch.setattr(compression, "brotli", None)
+    assert negotiate(header) == expected
+
+
+def test_negotiate_prefers_brotli_when_available(monkeypatch):
+    monkeypatch.setattr(compression, "brotli", object())
+    assert negotiate("gzip, br") == "br"
+    assert negotiate("gzip, br;q=0.5") == "gzip"
+
+
+def test_large_list_is_gzipped(client):
+    plain = client.get("/api/v1/movies", headers=IDENTITY)
+    assert "content-encoding" not in plain.headers
+    assert len(plain.content) >= settings.COMPRESSION_MIN_SIZE
+
+    before = compression_input_bytes.value(("gzip",))
+    response = client.get("/api/v1/movies", headers=GZIP)
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert int(response.headers["content-length"]) < len(plain.content)
+    assert response.content == plain.content
+    assert response.headers["etag"] == plain.headers["etag"].removesuffix('"') + '-gzip"'
+    assert compression_input_bytes.value(("gzip",)) == before + len(plain.content)
+
+
+def test_small_bodies_are_sent_as_is(client, monkeypatch):
+    monkeypatch.setattr(settings, "COMPRESSION_MIN_SIZE", 10**6)
+    response = client.get("/api/v1/movies", headers=GZIP)
+    assert "content-encoding" not in response.headers
+    assert "Accept-Encoding" in response.headers["vary"]
+
+
+def test_cached_payload_is_served_precompressed(client, monkeypatch):
+    monkeypatch.setattr(settings, "COMPRESSION_MIN_SIZE", 100)
+    url = "/api/v1/movies/1"
+    first = client.get(url, headers=GZIP)
+    assert first.headers["content-encoding"] == "gzip"
+
+    compressed_before = compression_input_bytes.value(("gzip",))
+    hits_before = precompressed_responses.value(("gzip",))
+    second = client.get(url, headers=GZIP)
+    assert second.headers["content-encoding"] == "gzip"
+    assert second.content == first.content == client.get(url, headers=IDENTITY).content
+    # Sent from the cache entry without compressing again
+    assert precompressed_responses.value(("gzip",)) == hits_before + 1
+    assert compression_input_bytes.value(("gzip",)) == compressed_before
+
+
+def test_compressed_variants_have_their_own_etag(client, monkeypatch):
+    monkeypatch.setattr(settings, "COMPRESSION_MIN_SIZE", 100)
+    for url in ("/api/v1/movies", "/api/v1/movies/1"):
+        plain = client.get(url, headers=IDENTITY).headers["etag"]
+        gzipped = client.get(url, headers=GZIP).headers["etag"]
+        assert gzipped != plain
+
+        # Either variant's ETag validates, and the 304 names the variant held
+        for etag in (plain, gzipped, f"W/{gzipped}"):
+            response = client.get(url, headers={**GZIP, "If-None-Match": etag})
+            assert response.status_code == 304
+            assert response.headers["etag"] == etag.removeprefix("W/")
+
+
+def test_streamed_export_is_compressed(client):
+    url = "/api/v1/export/movies?format=ndjson"
+    response = client.get(url, headers=GZIP)
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    assert response.content == client.get(url, headers=IDENTITY).content
+
+
+def test_compression_metrics_are_exposed(client):
+    client.get("/api/v1/movies", headers=GZIP)
+    assert compression_output_bytes.value(("gzip",)) < compression_input_bytes.value(("gzip",))
+    assert compression_cpu_seconds.value(("gzip",)) > 0
+    text = client.get("/metrics", headers=IDENTITY).text
+    assert 'http_compression_input_bytes_total{encoding="gzip"}' in text
+    assert 'http_compression_cpu_seconds_total{encoding="gzip"}' in text
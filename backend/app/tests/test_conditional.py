@@ -0,0 +1,48 @@
+from app.models.genre import Genre
+
+
+def test_catalogue_responses_carry_validators(client):
+    for url in ["/api/v1/movies", "/api/v1/movies/1", "/api/v1/actors", "/api/v1/genres"]:
+        response = client.get(url)
+        assert response.status_code == 200
+        assert response.headers["etag"].startswith('"')
+        assert "must-revalidate" in response.headers["cache-control"]
+
+
+def test_etag_differs_per_query(client):
+    first = client.get("/api/v1/movies?limit=5").headers["etag"]
+    second = client.get("/api/v1/movies?limit=6").headers["etag"]
+    reordered = client.get("/api/v1/movies?count=exact&limit=5").headers["etag"]
+    plain = client.get("/api/v1/movies?limit=5&count=exact").headers["etag"]
+    assert first != second
+    assert reordered == plain
+
+
+def test_matching_if_none_match_returns_304_without_querying(client, query_counter):
+    etag = client.get("/api/v1/movies").headers["etag"]
+
+    response = client.get("/api/v1/movies", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+    # Only the revision lookup runs
+    with query_counter as counter:
+        response = client.get("/api/v1/movies", headers={"If-None-Match": f'W/{etag}, "other"'})
+    assert response.status_code == 304
+    assert counter.count == 1
+
+
+def test_catalogue_write_changes_etag(client, db):
+    etag = client.get("/api/v1/genres").headers["etag"]
+    db.add(Genre(name="Documentary"))
+    db.commit()
+
+    response = client.get("/api/v1/genres", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert "Documentary" in {genre["name"] for genre in response.json()["items"]}
+
+
+def test_health_has_no_validators(client):
+    assert "etag" not in client.get("/api/v1/health").headers
@@ -0,0 +1,36 @@
+from sqlalchemy import text
+
+from app.db.session import create_db_engine, pool_status
+
+
+def test_sqlite_pragmas_applied_on_connect(tmp_path):
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'pragmas.db'}")
+    with engine.connect() as connection:
+        assert connection.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        # NORMAL == 1
+        assert connection.execute(text("PRAGMA synchronous")).scalar() == 1
+        assert connection.execute(text("PRAGMA cache_size")).scalar() < 0
+        assert connection.execute(text("PRAGMA busy_timeout")).scalar() > 0
+    engine.dispose()
+
+
+def test_pool_status_tracks_checked_out_connections(tmp_path):
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'pool.db'}")
+    with engine.connect():
+        status = pool_status(engine)
+        assert status["pool"] == "QueuePool"
+        assert status["checked_out"] == 1
+        assert status["overflow"] == 0
+    assert pool_status(engine)["checked_out"] == 0
+    engine.dispose()
+
+
+def test_in_memory_sqlite_keeps_default_pool():
+    engine = create_db_engine("sqlite://")
+    assert pool_status(engine)["pool"] == "SingletonThreadPool"
+
+
+def test_pool_status_endpoint(client):
+    response = client.get("/api/v1/health/pool")
+    assert response.status_code == 200
+    assert "checked_out" in response.json()["sync"]
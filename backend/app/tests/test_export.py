@@ -0,0 +1,55 @@
+import csv
+import io
+import json
+
+from app.core.config import settings
+
+
+def ndjson(response):
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+def test_export_movies_ndjson_matches_list(client, monkeypatch):
+    # Small partitions so the export spans several fetches
+    monkeypatch.setattr(settings, "EXPORT_BATCH_SIZE", 3)
+    response = client.get("/api/v1/export/movies")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    exported = ndjson(response)
+    listed = client.get("/api/v1/movies").json()["items"]
+    assert exported == listed
+
+
+def test_export_movies_applies_filters(client):
+    director_id = client.get("/api/v1/movies").json()["items"][0]["director"]["id"]
+    exported = ndjson(client.get(f"/api/v1/export/movies?directorId={director_id}"))
+    listed = client.get(f"/api/v1/movies?directorId={director_id}").json()["items"]
+    assert [movie["id"] for movie in exported] == [movie["id"] for movie in listed]
+
+    searched = ndjson(client.get("/api/v1/export/movies?q=dark"))
+    assert [movie["title"] for movie in searched] == ["The Dark Knight"]
+
+
+def test_export_movies_csv(client):
+    response = client.get("/api/v1/export/movies?format=csv")
+    assert response.status_code == 200
+    assert 'filename="movies.csv"' in response.headers["content-disposition"]
+
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert len(rows) == 20
+    assert rows[0]["director_name"]
+    assert all(row["genre_ids"] for row in rows)
+
+
+def test_export_actors_and_directors(client):
+    actors = ndjson(client.get("/api/v1/export/actors"))
+    assert len(actors) == client.get("/api/v1/actors").json()["total"]
+
+    rows = list(csv.DictReader(io.StringIO(client.get("/api/v1/export/directors?format=csv").text)))
+    assert [row["name"] for row in rows][:1] == ["Christopher Nolan"]
+
+
+def test_export_rejects_invalid_filters(client):
+    assert client.get("/api/v1/export/movies?genreId=0").status_code == 400
+    assert client.get("/api/v1/export/movies?format=xml").status_code == 422
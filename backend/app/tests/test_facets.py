@@ -0,0 +1,87 @@
+from collections import Counter
+
+import pytest
+
+from app.core.config import settings
+from app.models.genre import Genre
+from app.models.movie import Movie
+
+FILTERS = [
+    "",
+    "genreId=1",
+    "genreId=1&genreId=2",
+    "genreId=1&genreId=2&genreMatch=all",
+    "directorId=1",
+    "releaseYear=2010",
+    "q=the",
+    "genreId=2&q=the",
+]
+
+
+def expected_facets(client, query):
+    movies = client.get(f"/api/v1/movies?limit=500&{query}").json()["items"]
+    genres = Counter((g["id"], g["name"]) for m in movies for g in m["genres"])
+    directors = Counter((m["director"]["id"], m["director"]["name"]) for m in movies)
+    years = Counter(m["release_year"] for m in movies)
+
+    def ranked(counts):
+        return [
+            {"id": key, "name": name, "count": count}
+            for (key, name), count in sorted(counts.items(), key=lambda i: (-i[1], i[0][0]))
+        ]
+
+    return {
+        "total": len(movies),
+        "genres": ranked(genres),
+        "directors": ranked(directors),
+        "directors_truncated": False,
+        "directors_other_count": 0,
+        "release_years": [{"release_year": y, "count": c} for y, c in sorted(years.items())],
+    }
+
+
+@pytest.mark.parametrize("read_model", [True, False])
+@pytest.mark.parametrize("query", FILTERS)
+def test_facets_match_listing(client, monkeypatch, query, read_model):
+    monkeypatch.setattr(settings, "MOVIE_LIST_READ_MODEL", read_model)
+    monkeypatch.setattr(settings, "FACETS_CACHE_ENABLED", False)
+    response = client.get(f"/api/v1/movies/facets?{query}")
+    assert response.status_code == 200
+    assert response.json() == expected_facets(client, query)
+
+
+def test_facets_take_one_aggregate_query(client, count_queries, monkeypatch):
+    monkeypatch.setattr(settings, "FACETS_CACHE_ENABLED", False)
+    # Catalogue revision lookup + the facet statement
+    assert count_queries(client, "/api/v1/movies/facets?genreId=1&genreId=3") == 2
+
+
+def test_facets_are_cached_per_filter_set(client, db, count_queries):
+    url = "/api/v1/movies/facets?genreId=1&genreId=2"
+    client.get(url)
+    # Same filter set in another order: served from the cache
+    assert count_queries(client, "/api/v1/movies/facets?genreId=2&genreId=1") == 1
+    assert count_queries(client, "/api/v1/movies/facets?genreId=2") == 2
+
+    # A catalogue write invalidates the cached counts
+    movie = db.query(Movie).filter(~Movie.genres.any(Genre.id == 1)).first()
+    movie.genres.append(db.get(Genre, 1))
+    db.commit()
+    assert count_queries(client, url) == 2
+    assert client.get(url).json() == expected_facets(client, "genreId=1&genreId=2")
+
+
+def test_director_facet_is_limited(client, monkeypatch):
+    monkeypatch.setattr(settings, "MAX_FACET_VALUES", 2)
+    monkeypatch.setattr(settings, "FACETS_CACHE_ENABLED", False)
+    facets = client.get("/api/v1/movies/facets").json()
+    expected = expected_facets(client, "")["directors"]
+    assert len(facets["directors"]) == 2
+    assert facets["directors"] == expected[:2]
+    assert facets["directors_truncated"] is (len(expected) > 2)
+    assert facets["directors_other_count"] == sum(item["count"] for item in expected[2:])
+    assert facets["directors_other_count"] > 0
+
+
+def test_facets_validate_filters(client):
+    assert client.get("/api/v1/movies/facets?genreId=0").status_code == 400
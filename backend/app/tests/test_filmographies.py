@@ -0,0 +1,170 @@
+import pytest
+
+from app.core.config import settings
+from app.models.actor import Actor
+
+
+def summarize(movies):
+    years = [movie["release_year"] for movie in movies]
+    return {
+        "movie_count": len(movies),
+        "average_rating": (
+            pytest.approx(sum(movie["rating"] for movie in movies) / len(movies))
+            if movies
+            else None
+        ),
+        "first_year": min(years, default=None),
+        "last_year": max(years, default=None),
+    }
+
+
+def walk(client, url):
+    """Follow next_cursor from ``url`` and return every item."""
+    items, cursor = [], None
+    while True:
+        separator = "&" if "?" in url else "?"
+        page = client.get(url + (f"{separator}cursor={cursor}" if cursor else "")).json()
+        items.extend(page["items"])
+        if not (cursor := page["next_cursor"]):
+            return items
+
+
+@pytest.mark.parametrize("resource", ["actors", "directors"])
+def test_filmography_pages_cover_the_nested_movies(client, resource):
+    nested = client.get(f"/api/v1/{resource}/1").json()["movies"]
+    paged = walk(client, f"/api/v1/{resource}/1/movies?limit=1")
+
+    assert sorted(movie["id"] for movie in paged) == sorted(movie["id"] for movie in nested)
+    assert [(movie["release_year"], movie["id"]) for movie in paged] == sorted(
+        (movie["release_year"], movie["id"]) for movie in paged
+    )
+
+
+@pytest.mark.parametrize("resource", ["actors", "directors"])
+def test_embedded_movies_are_limited_and_continue_on_the_filmography(client, resource):
+    top = client.get(f"/api/v1/{resource}?summary=true&sort=movie_count&order=desc").json()
+    person = top["items"][0]
+    assert person["movie_count"] >= 2
+    url = f"/api/v1/{resource}/{person['id']}"
+
+    detail = client.get(f"{url}?moviesLimit=1").json()
+    assert len(detail["movies"]) == 1
+    cursor = detail["movies_next_cursor"]
+    rest = client.get(f"{url}/movies?cursor={cursor}").json()["items"]
+    assert [m["id"] for m in detail["movies"] + rest] == [
+        m["id"] for m in walk(client, f"{url}/movies")
+    ]
+    full = client.get(f"{url}?moviesLimit={person['movie_count']}").json()
+    assert len(full["movies"]) == person["movie_count"]
+    assert full["movies_next_cursor"] is None
+
+
+def test_director_list_limits_embedded_movies(client):
+    counts = {
+        d["id"]: d["movie_count"]
+        for d in client.get("/api/v1/directors?summary=true").json()["items"]
+    }
+    for director in client.get("/api/v1/directors?moviesLimit=1").json()["items"]:
+        assert len(director["movies"]) == min(counts[director["id"]], 1)
+        assert (director["movies_next_cursor"] is not None) == (counts[director["id"]] > 1)
+
+
+@pytest.mark.parametrize(
+    ("url", "filter_url"),
+    [
+        ("/api/v1/actors/1/movies", "/api/v1/movies?actorId=1"),
+        ("/api/v1/directors/1/movies", "/api/v1/movies?directorId=1"),
+    ],
+)
+def test_filmography_matches_movie_list(client, url, filter_url):
+    query = "sort=rating&order=desc&limit=2"
+    assert client.get(f"{url}?{query}").json() == client.get(f"{filter_url}&{query}").json()
+
+
+@pytest.mark.parametrize(
+    ("url", "status"),
+    [
+        ("/api/v1/actors/0/movies", 400),
+        ("/api/v1/actors/9999/movies", 404),
+        ("/api/v1/actors/1/movies?cursor=bogus", 400),
+        ("/api/v1/actors/1/movies?limit=0", 400),
+        ("/api/v1/directors/0/movies", 400),
+        ("/api/v1/directors/9999/movies", 404),
+        ("/api/v1/directors/1/movies?cursor=bogus", 400),
+        ("/api/v1/actors?sort=movie_count", 400),
+        ("/api/v1/directors?sort=average_rating", 400),
+        ("/api/v1/actors/1?moviesLimit=0", 400),
+        ("/api/v1/directors/1?moviesLimit=0", 400),
+        (f"/api/v1/directors?moviesLimit={settings.MAX_PAGE_SIZE + 1}", 400),
+    ],
+)
+def test_filmography_and_summary_validation(client, url, status):
+    assert client.get(url).status_code == status
+
+
+@pytest.mark.parametrize("resource", ["actors", "directors"])
+def test_summaries_aggregate_filmographies(client, resource):
+    summaries = client.get(f"/api/v1/{resource}?summary=true").json()
+    assert summaries["total"] == len(summaries["items"]) > 0
+
+    for summary in summaries["items"]:
+        assert "movies" not in summary
+        movies = client.get(f"/api/v1/{resource}/{summary['id']}").json()["movies"]
+        assert summary == {"id": summary["id"], "name": summary["name"], **summarize(movies)}
+        detail = client.get(f"/api/v1/{resource}/{summary['id']}?summary=true").json()
+        assert detail == summary
+
+
+@pytest.mark.parametrize("resource", ["actors", "directors"])
+def test_summaries_sort_by_aggregates(client, resource):
+    items = client.get(f"/api/v1/{resource}?summary=true&sort=movie_count&order=desc").json()[
+        "items"
+    ]
+    assert [(-item["movie_count"], -item["id"]) for item in items] == sorted(
+        (-item["movie_count"], -item["id"]) for item in items
+    )
+
+
+def test_actor_summaries_keep_filters(client):
+    cast = client.get("/api/v1/actors?movieId=1").json()["items"]
+    summaries = client.get("/api/v1/actors?movieId=1&summary=true").json()["items"]
+    assert [actor["id"] for actor in summaries] == [actor["id"] for actor in cast]
+    # Aggregates cover the whole filmography, not just the filtered movie
+    assert all(summary["movie_count"] >= 1 for summary in summaries)
+
+
+def test_summary_of_person_without_movies(client, db):
+    actor = Actor(name="Newcomer")
+    db.add(actor)
+    db.commit()
+    assert client.get(f"/api/v1/actors/{actor.id}?summary=true").json() == {
+        "id": actor.id,
+        "name": "Newcomer",
+        "movie_count": 0,
+        "average_rating": None,
+        "first_year": None,
+        "last_year": None,
+    }
+
+
+@pytest.mark.parametrize(
+    "url", ["/api/v1/actors?summary=true", "/api/v1/directors?summary=true&sort=movie_count"]
+)
+def test_summaries_cost_one_grouped_query(client, count_queries, url):
+    # The catalogue revision read by the conditional check, then the grouped query
+    assert count_queries(client, url) == 2
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "/api/v1/actors?summary=true",
+        "/api/v1/actors/1?summary=true",
+        "/api/v1/directors/1?summary=true",
+        "/api/v1/actors/1/movies",
+    ],
+)
+def test_summaries_validate_without_fast_serialization(client, monkeypatch, url):
+    fast = client.get(url).json()
+    monkeypatch.setattr(settings, "FAST_SERIALIZATION", False)
+    assert client.get(url).json() == fast
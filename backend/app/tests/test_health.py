@@ -1,4 +1,98 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, delete, func, inspect, select
+from sqlalchemy.orm import Session, sessionmaker
+
+import app.main as main_module
+from app.core.config import settings
+from app.db.bootstrap import bootstrap_database
+from app.db.neighbours import costar_table, neighbour_table
+from app.db.read_model import card_table
+from app.db.session import get_db
+from app.main import app
+from app.models.movie import Movie
+
+
 def test_health(client):
     response = client.get("/api/v1/health")
     assert response.status_code == 200
     assert response.json() == {"status": "ok"}
+
+
+def test_health_ready(client):
+    response = client.get("/api/v1/health/ready")
+    assert response.status_code == 200
+    assert response.json()["status"] == "ready"
+
+
+def test_health_ready_reports_missing_schema(client):
+    empty = sessionmaker(bind=create_engine("sqlite://"))()
+
+    def override_get_db():
+        yield empty
+
+    app.dependency_overrides[get_db] = override_get_db
+    response = client.get("/api/v1/health/ready")
+    assert response.status_code == 503
+    body = response.json()
+    assert body["status"] == "not_ready"
+    assert "movies" in body["missing_tables"]
+
+
+@pytest.mark.parametrize("table", [neighbour_table, costar_table])
+def test_health_ready_reports_missing_neighbours(client, db, table):
+    db.execute(delete(table))
+    db.commit()
+    response = client.get("/api/v1/health/ready")
+    assert response.status_code == 503
+    assert response.json()["reason"].startswith("neighbour tables not built")
+
+
+def test_bootstrap_is_idempotent(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'bootstrap.db'}")
+    bootstrap_database(engine)
+    bootstrap_database(engine)
+
+    with Session(engine) as db:
+        assert db.query(Movie).count() == 20
+
+
+def test_startup_skips_database_work_when_disabled(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'untouched.db'}")
+    monkeypatch.setattr(settings, "DB_BOOTSTRAP_ON_STARTUP", False)
+    monkeypatch.setattr(main_module, "engine", engine)
+
+    with TestClient(app) as test_client:
+        assert test_client.get("/api/v1/health").json() == {"status": "ok"}
+
+    assert inspect(engine).get_table_names() == []
+
+
+def test_startup_leaves_backfills_to_the_bootstrap_command(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'existing.db'}")
+    # Seeding an empty catalogue fills the derived tables without a backfill
+    bootstrap_database(engine, backfill=False)
+    with engine.begin() as connection:
+        assert connection.scalar(select(func.count()).select_from(card_table)) == 20
+        connection.execute(delete(card_table))
+        connection.execute(delete(neighbour_table))
+
+    def override_get_db():
+        with Session(engine) as db:
+            yield db
+
+    monkeypatch.setattr(main_module, "engine", engine)
+    monkeypatch.setattr(settings, "DB_BOOTSTRAP_ON_STARTUP", True)
+    app.dependency_overrides[get_db] = override_get_db
+    try:
+        with TestClient(app) as test_client:
+            response = test_client.get("/api/v1/health/ready")
+            assert response.status_code == 503
+            assert "python -m app.db.bootstrap" in response.json()["reason"]
+
+            bootstrap_database(engine)
+            assert test_client.get("/api/v1/health/ready").status_code == 200
+    finally:
+        app.dependency_overrides.clear()
+    with engine.connect() as connection:
+        assert connection.scalar(select(func.count()).select_from(neighbour_table))
@@ -0,0 +1,56 @@
+import pytest
+from sqlalchemy import create_engine, inspect, select, text
+
+from app.db.base import Base
+from app.db.bootstrap import ensure_indexes
+from app.db.init_db import seed_data
+from app.models.movie import Movie
+from app.models.movie_list_card import MovieListCard
+from app.services.actor_service import build_actors_statement
+from app.services.movie_service import build_movies_statement
+from app.services.pagination import page_statement
+
+
+def query_plan(db, stmt) -> str:
+    bind = db.get_bind()
+    sql = stmt.compile(dialect=bind.dialect, compile_kwargs={"literal_binds": True})
+    return "\n".join(row.detail for row in db.execute(text(f"EXPLAIN QUERY PLAN {sql}")))
+
+
+@pytest.mark.parametrize(
+    ("filters", "index"),
+    [
+        ({"genre_id": 1}, "ix_movie_genres_genre_id_movie_id"),
+        ({"actor_id": 1}, "ix_movie_actors_actor_id_movie_id"),
+        ({"director_id": 1}, "ix_{table}_director_id_release_year"),
+        ({"director_id": 1, "release_year": 2010}, "ix_{table}_director_id_release_year"),
+        ({"release_year": 2010}, "ix_{table}_release_year_rating"),
+    ],
+)
+@pytest.mark.parametrize("source", [Movie, MovieListCard])
+def test_movie_filters_use_indexes(db, filters, index, source):
+    seed_data(db)
+    stmt, sort_key = build_movies_statement(
+        "sqlite", stmt=select(source.id), source=source, **filters
+    )
+    plan = query_plan(db, page_statement(stmt, sort_key, limit=10))
+    assert index.format(table=source.__tablename__) in plan
+
+
+def test_actor_genre_filter_uses_reverse_junction_index(db):
+    seed_data(db)
+    assert "ix_movie_genres_genre_id_movie_id" in query_plan(db, build_actors_statement(genre_id=1))
+
+
+def test_ensure_indexes_adds_indexes_to_existing_tables(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    Base.metadata.create_all(bind=engine)
+    # A database created before the index was added to the model
+    with engine.begin() as connection:
+        connection.exec_driver_sql("DROP INDEX ix_movie_genres_genre_id_movie_id")
+
+    ensure_indexes(engine)
+    ensure_indexes(engine)
+
+    names = {index["name"] for index in inspect(engine).get_indexes("movie_genres")}
+    assert "ix_movie_genres_genre_id_movie_id" in names
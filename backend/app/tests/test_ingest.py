@@ -0,0 +1,125 @@
+import json
+
+import pytest
+from sqlalchemy import create_engine
+
+from app.db.ingest import (
+    CatalogueIngestor,
+    IngestStats,
+    main,
+    normalize_record,
+    read_records,
+)
+from app.models.actor import Actor
+from app.models.director import Director
+from app.models.genre import Genre
+from app.models.movie import Movie
+
+
+def test_csv_ingest_dedupes_names_and_links(client, db, tmp_path):
+    path = tmp_path / "movies.csv"
+    path.write_text(
+        "title,release_year,rating,director,genres,actors\n"
+        "Arrival,2016,7.9,Denis Villeneuve,Sci-Fi|Drama,Amy Adams|Jeremy Renner\n"
+        "Sicario,2015,7.6,Denis Villeneuve,Thriller|Crime,Emily Blunt\n",
+        encoding="utf-8",
+    )
+    genres_before = db.query(Genre).count()
+
+    stats = CatalogueIngestor(db.connection(), batch_size=1).ingest(read_records(path))
+    db.commit()
+
+    assert stats.movies == 2
+    assert stats.movie_genre_links == 4
+    assert stats.movie_actor_links == 3
+    # Only "Crime" and the new director/actors are new names
+    assert db.query(Genre).count() == genres_before + 1
+    assert db.query(Actor).filter(Actor.name == "Amy Adams").count() == 1
+
+    found = client.get("/api/v1/movies?q=arrival").json()["items"]
+    assert [movie["title"] for movie in found] == ["Arrival"]
+    movie = client.get(f"/api/v1/movies/{found[0]['id']}").json()
+    assert movie["director"]["name"] == "Denis Villeneuve"
+    assert sorted(genre["name"] for genre in movie["genres"]) == ["Drama", "Sci-Fi"]
+    assert sorted(actor["name"] for actor in movie["actors"]) == ["Amy Adams", "Jeremy Renner"]
+
+    directors = client.get("/api/v1/directors").json()["items"]
+    assert [d["name"] for d in directors].count("Denis Villeneuve") == 1
+
+
+def test_orm_inserts_after_ingest_get_fresh_ids(db):
+    records = [
+        normalize_record(
+            {
+                "title": "Ingested",
+                "release_year": 2020,
+                "rating": 7.0,
+                "director": "Ingested Director",
+                "genres": "Ingested Genre",
+                "actors": "Ingested Actor",
+            }
+        )
+    ]
+    ingestor = CatalogueIngestor(db.connection())
+    [ingested_id] = ingestor.ingest_batch(records, IngestStats())
+    db.commit()
+
+    director = Director(name="After Ingest")
+    rows = [
+        director,
+        Genre(name="After Ingest"),
+        Actor(name="After Ingest"),
+        Movie(title="After Ingest", release_year=2021, rating=6.0, director=director),
+    ]
+    db.add_all(rows)
+    db.commit()
+
+    assert rows[0].id > ingestor.directors.ids["Ingested Director"]
+    assert rows[1].id > ingestor.genres.ids["Ingested Genre"]
+    assert rows[2].id > ingestor.actors.ids["Ingested Actor"]
+    assert rows[3].id > ingested_id
+
+
+def test_export_output_ingests_as_is(client, db, tmp_path):
+    path = tmp_path / "movies.jsonl"
+    path.write_bytes(client.get("/api/v1/export/movies").content)
+    exported = [json.loads(line) for line in path.read_text().splitlines()]
+
+    records = list(read_records(path))
+    assert [record["title"] for record in records] == [movie["title"] for movie in exported]
+    assert records[0]["director"] == exported[0]["director"]["name"]
+    assert records[0]["genres"] == [genre["name"] for genre in exported[0]["genres"]]
+
+
+def test_normalize_record_rejects_bad_rows():
+    with pytest.raises(ValueError):
+        normalize_record({"title": "No year", "rating": "7", "director": "X"})
+    with pytest.raises(ValueError):
+        normalize_record({"title": "Bad", "release_year": "soon", "rating": "7", "director": "X"})
+
+
+def test_ingest_cli_reports_throughput(tmp_path, monkeypatch, capsys):
+    import app.db.session as session_module
+
+    database = tmp_path / "cli.db"
+    monkeypatch.setattr(session_module, "engine", create_engine(f"sqlite:///{database}"))
+    path = tmp_path / "movies.jsonl"
+    path.write_text(
+        json.dumps(
+            {
+                "title": "Heat",
+                "release_year": 1995,
+                "rating": 8.3,
+                "director": "Michael Mann",
+                "genres": ["Crime"],
+                "actors": ["Al Pacino", "Robert De Niro"],
+            }
+        )
+        + "\n",
+        encoding="utf-8",
+    )
+
+    assert main([str(path)]) == 0
+    output = capsys.readouterr().out
+    assert "Ingested 1 movies, 2 cast links, 1 genre links" in output
+    assert "rows/s" in output
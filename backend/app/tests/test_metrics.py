@@ -0,0 +1,89 @@
+import logging
+
+import pytest
+
+from app.core.config import settings
+from app.core.metrics import Counter, Histogram, db_queries, db_rows, http_requests
+
+DETAIL_ROUTE = "/api/v1/movies/{movie_id}"
+
+
+def test_metrics_record_route_template_and_sql_work(client):
+    labels = ("GET", DETAIL_ROUTE, "200")
+    requests_before = http_requests.value(labels)
+    queries_before = db_queries.value((DETAIL_ROUTE,))
+    rows_before = db_rows.value((DETAIL_ROUTE,))
+
+    movie_id = client.get("/api/v1/movies").json()["items"][0]["id"]
+    assert client.get(f"/api/v1/movies/{movie_id}").status_code == 200
+
+    assert http_requests.value(labels) == requests_before + 1
+    assert db_queries.value((DETAIL_ROUTE,)) > queries_before
+    assert db_rows.value((DETAIL_ROUTE,)) > rows_before
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    text = response.text
+    assert "# TYPE http_request_duration_seconds histogram" in text
+    assert (
+        f'http_request_duration_seconds_bucket{{method="GET",route="{DETAIL_ROUTE}",le="+Inf"}}'
+        in text
+    )
+    assert f'http_response_bytes_total{{method="GET",route="{DETAIL_ROUTE}"}}' in text
+    assert f'db_query_duration_seconds_total{{route="{DETAIL_ROUTE}"}}' in text
+
+
+@pytest.mark.parametrize(
+    "url, route, rows",
+    [
+        ("/api/v1/movies?limit=5&count=none", "/api/v1/movies", 5),
+        ("/api/v1/actors?limit=5&count=none", "/api/v1/actors", 5),
+        ("/api/v1/movies/facets", "/api/v1/movies/facets", 5),
+        ("/api/v1/export/movies", "/api/v1/export/movies", 20),
+    ],
+)
+def test_rows_count_core_and_column_selects(client, url, route, rows):
+    before = db_rows.value((route,))
+    assert client.get(url).status_code == 200
+    assert db_rows.value((route,)) >= before + rows
+
+
+def test_unmatched_paths_share_one_label(client):
+    labels = ("GET", "unmatched", "404")
+    before = http_requests.value(labels)
+    client.get("/no/such/path/1")
+    client.get("/no/such/path/2")
+    assert http_requests.value(labels) == before + 2
+
+
+def test_slow_query_log_is_opt_in(client, caplog, monkeypatch):
+    with caplog.at_level(logging.WARNING, logger="app.db.slow_query"):
+        client.get("/api/v1/movies?releaseYear=2010")
+    assert not caplog.records
+
+    monkeypatch.setattr(settings, "SLOW_QUERY_LOG_MS", 0)
+    with caplog.at_level(logging.WARNING, logger="app.db.slow_query"):
+        client.get("/api/v1/movies?releaseYear=2010&count=none")
+    messages = [record.getMessage() for record in caplog.records]
+    assert any("SELECT" in message and "2010" in message for message in messages)
+    # Statements are normalized to a single line
+    assert all("\n" not in message for message in messages)
+
+
+def test_histogram_and_counter_rendering():
+    histogram = Histogram("latency_seconds", "Latency.", ("route",), buckets=(0.1, 1.0))
+    histogram.observe(0.05, ("/a",))
+    histogram.observe(0.5, ("/a",))
+    histogram.observe(5.0, ("/a",))
+    counter = Counter("hits_total", "Hits.", ("route",))
+    counter.inc(('/"quoted"',), 2)
+
+    assert histogram.samples() == [
+        'latency_seconds_bucket{route="/a",le="0.1"} 1',
+        'latency_seconds_bucket{route="/a",le="1"} 2',
+        'latency_seconds_bucket{route="/a",le="+Inf"} 3',
+        'latency_seconds_sum{route="/a"} 5.55',
+        'latency_seconds_count{route="/a"} 3',
+    ]
+    assert counter.samples() == ['hits_total{route="/\\"quoted\\""} 2']
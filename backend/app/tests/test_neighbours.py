@@ -0,0 +1,287 @@
+import math
+
+import pytest
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.db.ingest import CatalogueIngestor
+from app.db.neighbours import (
+    ACTOR_WEIGHT,
+    DIRECTOR_WEIGHT,
+    GENRE_WEIGHT,
+    _Incidence,
+    costar_table,
+    count_costars,
+    neighbour_table,
+    rebuild_neighbours,
+    score_neighbours,
+)
+from app.models.actor import Actor
+from app.models.actor_costar import ActorCostar
+from app.models.associations import movie_actors
+from app.models.director import Director
+from app.models.genre import Genre
+from app.models.movie import Movie
+from app.models.movie_neighbour import MovieNeighbour
+
+
+def snapshot(db):
+    neighbours = db.execute(
+        select(neighbour_table).order_by(neighbour_table.c.movie_id, neighbour_table.c.rank)
+    ).all()
+    costars = db.execute(
+        select(costar_table).order_by(costar_table.c.actor_id, costar_table.c.rank)
+    ).all()
+    return neighbours, costars
+
+
+def assert_matches_rebuild(db):
+    """The incrementally maintained rows equal a rebuild from scratch."""
+    db.flush()
+    maintained = snapshot(db)
+    rebuild_neighbours(db.connection())
+    assert snapshot(db) == maintained
+    return maintained
+
+
+def test_score_neighbours_weighs_actors_genres_and_director():
+    incidence = _Incidence(
+        director_of={1: 10, 2: 10, 3: 20, 4: 30},
+        actors_of={1: {100, 101}, 2: {100}, 3: {100, 101}},
+        genres_of={1: {7}, 2: {8}, 3: {7}, 4: {7}},
+    )
+    rows = score_neighbours(incidence, [1, 4], top_k=5)
+
+    # Movie 4 shares no actor or director with anyone: no candidates
+    assert [row["movie_id"] for row in rows] == [1, 1]
+    by_neighbour = {row["neighbour_id"]: row for row in rows}
+    assert by_neighbour[3]["rank"] == 1
+    assert by_neighbour[3]["score"] == pytest.approx(ACTOR_WEIGHT + GENRE_WEIGHT)
+    assert by_neighbour[2]["score"] == pytest.approx(ACTOR_WEIGHT / math.sqrt(2) + DIRECTOR_WEIGHT)
+
+
+def test_score_neighbours_keeps_top_k_and_breaks_ties_by_id():
+    incidence = _Incidence(
+        director_of={1: 10, 2: 10, 3: 10, 4: 10},
+        actors_of={},
+        genres_of={},
+    )
+    rows = score_neighbours(incidence, [3], top_k=2)
+    assert [(row["rank"], row["neighbour_id"]) for row in rows] == [(1, 1), (2, 2)]
+
+
+def test_score_neighbours_shortlists_prolific_links():
+    # Actor 100 is in every movie; actor 101 only in movies 1 and 2
+    incidence = _Incidence(
+        director_of={1: 10, 2: 20, 3: 30, 4: 40, 5: 50},
+        actors_of={1: {100, 101}, 2: {100, 101, 200}, 3: {100}, 4: {100}, 5: {100, 201}},
+        genres_of={1: {7}, 2: {8}, 3: {8}, 4: {7}, 5: {7}},
+    )
+    rows = score_neighbours(incidence, [1], top_k=5, max_posting=2)
+
+    # Actor 100 only proposes the two movies of genre 7 with the smallest casts
+    # (movie 1 itself and movie 4), but still counts in the score of movie 2
+    by_neighbour = {row["neighbour_id"]: row["score"] for row in rows}
+    assert by_neighbour == {
+        2: pytest.approx(ACTOR_WEIGHT * 2 / math.sqrt(6)),
+        4: pytest.approx(ACTOR_WEIGHT / math.sqrt(2) + GENRE_WEIGHT),
+    }
+    assert len(score_neighbours(incidence, [1], top_k=5, max_posting=5)) == 4
+
+
+def test_count_costars_ranks_by_shared_movies():
+    actors_of = {1: {100, 101, 102}, 2: {100, 101}, 3: {100, 103}}
+    rows = count_costars(actors_of, [100], top_k=2)
+    assert [(row["costar_id"], row["shared_movies"]) for row in rows] == [(101, 2), (102, 1)]
+
+
+def test_seeded_neighbours_match_rebuild(client, db):
+    neighbours, costars = assert_matches_rebuild(db)
+    assert neighbours and costars
+
+
+def test_related_movies_follow_stored_ranks(client, db):
+    movie_id = db.scalars(select(neighbour_table.c.movie_id)).first()
+    expected = db.scalars(
+        select(neighbour_table.c.neighbour_id)
+        .where(neighbour_table.c.movie_id == movie_id)
+        .order_by(neighbour_table.c.rank)
+    ).all()
+
+    body = client.get(f"/api/v1/movies/{movie_id}/related").json()
+    assert [movie["id"] for movie in body["items"]] == expected
+    assert body["total"] == len(expected) <= settings.NEIGHBOURS_TOP_K
+    assert movie_id not in expected
+
+
+def test_related_movies_match_list_items(client, monkeypatch):
+    from_cards = client.get("/api/v1/movies/1/related").json()
+    listed = {
+        movie["id"]: movie
+        for movie in client.get(f"/api/v1/movies?limit={settings.MAX_PAGE_SIZE}").json()["items"]
+    }
+    assert from_cards["items"] == [listed[movie["id"]] for movie in from_cards["items"]]
+
+    monkeypatch.setattr(settings, "MOVIE_LIST_READ_MODEL", False)
+    assert client.get("/api/v1/movies/1/related").json() == from_cards
+
+
+def test_costars_count_shared_movies(client, db):
+    actor_id = db.scalars(select(costar_table.c.actor_id)).first()
+    costars = client.get(f"/api/v1/actors/{actor_id}/costars").json()["items"]
+    assert costars
+
+    their_movies = set(
+        db.scalars(select(movie_actors.c.movie_id).where(movie_actors.c.actor_id == actor_id))
+    )
+    for costar in costars:
+        shared = their_movies & set(
+            db.scalars(
+                select(movie_actors.c.movie_id).where(movie_actors.c.actor_id == costar["id"])
+            )
+        )
+        assert costar["shared_movies"] == len(shared)
+        assert costar["name"] == db.get(Actor, costar["id"]).name
+    assert [costar["shared_movies"] for costar in costars] == sorted(
+        (costar["shared_movies"] for costar in costars), reverse=True
+    )
+
+
+@pytest.mark.parametrize(
+    ("url", "table", "column"),
+    [
+        ("/api/v1/movies/{}/related", neighbour_table, "movie_id"),
+        ("/api/v1/actors/{}/costars", costar_table, "actor_id"),
+    ],
+)
+def test_neighbour_lookups_cost_one_query(client, db, count_queries, url, table, column):
+    # Someone with neighbours: an empty list costs an existence check (random seed casts)
+    owner = db.scalar(select(table.c[column]).limit(1))
+    # The catalogue revision read by the conditional check, then the lookup
+    assert count_queries(client, url.format(owner)) == 2
+
+
+@pytest.mark.parametrize(
+    ("url", "status"),
+    [
+        ("/api/v1/movies/0/related", 400),
+        ("/api/v1/movies/9999/related", 404),
+        ("/api/v1/actors/0/costars", 400),
+        ("/api/v1/actors/9999/costars", 404),
+    ],
+)
+def test_neighbour_lookups_validate_ids(client, url, status):
+    assert client.get(url).status_code == status
+
+
+def test_neighbours_follow_orm_writes(client, db):
+    movie = db.get(Movie, 1)
+    other = db.get(Movie, 2)
+    # Make movie 2 a copy of movie 1: the highest possible score, and ties go to the lower ID
+    other.actors = list(movie.actors)
+    other.genres = list(movie.genres)
+    other.director = movie.director
+    db.commit()
+    assert_matches_rebuild(db)
+    related = client.get("/api/v1/movies/1/related").json()["items"]
+    assert related[0]["id"] == 2
+
+    removed = movie.actors.pop()
+    db.commit()
+    assert_matches_rebuild(db)
+
+    new_movie = Movie(title="Ensemble", release_year=2024, rating=7.0, director=db.get(Director, 1))
+    new_movie.actors.extend([removed, *movie.actors])
+    db.add(new_movie)
+    db.commit()
+    assert_matches_rebuild(db)
+
+    db.delete(removed)
+    db.commit()
+    assert_matches_rebuild(db)
+
+    new_movie.actors.clear()
+    new_movie.genres.clear()
+    db.delete(new_movie)
+    db.commit()
+    assert_matches_rebuild(db)
+    assert new_movie.id not in {
+        movie["id"] for movie in client.get("/api/v1/movies/1/related").json()["items"]
+    }
+
+
+def test_neighbours_ignore_other_writes(client, db, query_counter):
+    movie = db.get(Movie, 1)
+    with query_counter as counter:
+        movie.rating = 9.9
+        movie.title = "Renamed"
+        db.commit()
+    linked = ("movie_actors", "movie_neighbours", "actor_costars")
+    assert counter.statements
+    assert not [sql for sql in counter.statements if any(table in sql for table in linked)]
+
+    # Neighbour and co-star rows have no id; flushing them leaves the hooks alone
+    neighbour = db.scalars(select(MovieNeighbour).limit(1)).one()
+    neighbour.score += 1
+    db.delete(db.scalars(select(ActorCostar).limit(1)).one())
+    db.commit()
+
+
+def test_neighbours_follow_orm_writes_through_prolific_links(client, db, monkeypatch):
+    monkeypatch.setattr(settings, "NEIGHBOURS_MAX_POSTING", 2)
+    rebuild_neighbours(db.connection())
+    prolific = Actor(name="Prolific")
+    first, second = Genre(name="First Genre"), Genre(name="Second Genre")
+    movies = [
+        Movie(
+            title=f"Prolific {number}",
+            release_year=2024,
+            rating=6.0,
+            director=Director(name=f"Only {number}"),
+        )
+        for number in range(3)
+    ]
+    for movie, genre in zip(movies, (first, first, second), strict=True):
+        movie.actors.append(prolific)
+        movie.genres.append(genre)
+    db.add_all(movies)
+    db.commit()
+    # Three movies: the actor only proposes the shortlist of each genre, and
+    # the movie of the second genre has no candidate
+    assert_matches_rebuild(db)
+
+    # Back to two movies: the last one gets the second as a candidate, while
+    # only sharing the actor with the first before the change
+    movies[0].actors.clear()
+    db.commit()
+    neighbours, _ = assert_matches_rebuild(db)
+    assert (movies[2].id, movies[1].id) in {(row.movie_id, row.neighbour_id) for row in neighbours}
+
+
+@pytest.mark.parametrize("defer_neighbours", [False, True])
+def test_neighbours_follow_ingest(client, db, monkeypatch, defer_neighbours):
+    # Keep every candidate, so the assertions below do not depend on the seeded scores
+    monkeypatch.setattr(settings, "NEIGHBOURS_TOP_K", 100)
+    rebuild_neighbours(db.connection())
+    actors = [actor.name for actor in db.get(Movie, 1).actors]
+    records = [
+        {
+            "title": f"Sequel {number}",
+            "release_year": 2024,
+            "rating": 6.5,
+            "director": "Someone New",
+            "genres": ["Drama"],
+            "actors": actors[: number + 1],
+        }
+        for number in range(3)
+    ]
+    ingestor = CatalogueIngestor(db.connection(), batch_size=2, defer_neighbours=defer_neighbours)
+    ingestor.ingest(records)
+
+    assert_matches_rebuild(db)
+    sequels = db.scalars(select(Movie.id).where(Movie.title.startswith("Sequel"))).all()
+    for sequel_id in sequels:
+        related = client.get(f"/api/v1/movies/{sequel_id}/related").json()["items"]
+        # Sequels share a director, and at least one actor with movie 1
+        assert set(sequels) - {sequel_id} <= {movie["id"] for movie in related}
+        assert 1 in {movie["id"] for movie in related}
@@ -0,0 +1,108 @@
+import base64
+import json
+
+import pytest
+
+from app.core.config import settings
+
+
+def test_limit_bounds_page_size(client):
+    response = client.get("/api/v1/movies?limit=5")
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data["items"]) == 5
+    assert data["total"] == 20
+    assert data["next_cursor"] is not None
+
+
+def test_offset_skips_rows(client):
+    first = client.get("/api/v1/movies?limit=5").json()["items"]
+    second = client.get("/api/v1/movies?limit=5&offset=5").json()["items"]
+    assert not {m["id"] for m in first} & {m["id"] for m in second}
+
+
+def test_cursor_walks_all_movies_once(client):
+    expected = [m["id"] for m in client.get("/api/v1/movies").json()["items"]]
+
+    seen = []
+    cursor = None
+    while True:
+        url = "/api/v1/movies?limit=3&count=none"
+        if cursor:
+            url += f"&cursor={cursor}"
+        data = client.get(url).json()
+        assert data["total"] is None
+        seen.extend(m["id"] for m in data["items"])
+        cursor = data["next_cursor"]
+        if not cursor:
+            break
+
+    assert seen == expected
+
+
+def test_cursor_respects_filters(client):
+    director_id = client.get("/api/v1/movies").json()["items"][0]["director"]["id"]
+    data = client.get(f"/api/v1/movies?directorId={director_id}&limit=1").json()
+    ids = [m["id"] for m in data["items"]]
+    while data["next_cursor"]:
+        data = client.get(
+            f"/api/v1/movies?directorId={director_id}&limit=1&cursor={data['next_cursor']}"
+        ).json()
+        ids.extend(m["id"] for m in data["items"])
+        assert all(m["director"]["id"] == director_id for m in data["items"])
+    assert len(ids) == len(set(ids))
+
+
+def test_estimate_count_is_capped(client, monkeypatch):
+    from app.core.config import settings
+
+    monkeypatch.setattr(settings, "COUNT_ESTIMATE_CAP", 10)
+    data = client.get("/api/v1/movies?limit=2&count=estimate").json()
+    assert data["total"] == 10
+    assert data["total_is_estimate"] is True
+
+
+def test_invalid_paging_parameters_return_400(client):
+    assert client.get("/api/v1/movies?limit=0").status_code == 400
+    assert client.get("/api/v1/movies?limit=100000").status_code == 400
+    assert client.get("/api/v1/movies?offset=-1").status_code == 400
+    assert client.get("/api/v1/movies?cursor=not-a-cursor").status_code == 400
+    assert client.get("/api/v1/movies?cursor=abc&offset=3").status_code == 400
+
+
+@pytest.mark.parametrize("bitmap_index", [False, True])
+@pytest.mark.parametrize("values", [[[1]], [{"a": 1}]])
+def test_cursor_with_non_scalar_values_returns_400(client, monkeypatch, values, bitmap_index):
+    monkeypatch.setattr(settings, "MOVIE_BITMAP_INDEX", bitmap_index)
+    payload = json.dumps({"s": "id", "v": values}).encode()
+    cursor = base64.urlsafe_b64encode(payload).decode().rstrip("=")
+    assert client.get(f"/api/v1/movies?cursor={cursor}").status_code == 400
+    assert client.get(f"/api/v1/actors/1/movies?sort=id&cursor={cursor}").status_code == 400
+
+
+@pytest.mark.parametrize("bitmap_index", [False, True])
+@pytest.mark.parametrize(
+    ("url", "sort", "values"),
+    [
+        ("/api/v1/movies", "id", ["1"]),
+        ("/api/v1/movies", "-rating", ["8.5", 3]),
+        ("/api/v1/movies", "title", [7, 3]),
+        ("/api/v1/movies", "release_year", [True, 3]),
+        ("/api/v1/actors/1/movies", "rating", ["high", 3]),
+        ("/api/v1/directors/1/movies", "id", [2.5]),
+    ],
+)
+def test_cursor_with_values_of_another_type_returns_400(
+    client, monkeypatch, url, sort, values, bitmap_index
+):
+    monkeypatch.setattr(settings, "MOVIE_BITMAP_INDEX", bitmap_index)
+    payload = json.dumps({"s": sort, "v": values}).encode()
+    cursor = base64.urlsafe_b64encode(payload).decode().rstrip("=")
+    params = f"sort={sort.lstrip('-')}&order={'desc' if sort[0] == '-' else 'asc'}"
+    assert client.get(f"{url}?{params}&cursor={cursor}").status_code == 400
+
+
+def test_cursor_accepts_whole_numbers_for_ratings(client):
+    payload = json.dumps({"s": "rating", "v": [8, 1]}).encode()
+    cursor = base64.urlsafe_b64encode(payload).decode().rstrip("=")
+    assert client.get(f"/api/v1/movies?sort=rating&cursor={cursor}").status_code == 200
@@ -0,0 +1,49 @@
+from app.models.actor import Actor
+from app.models.director import Director
+from app.models.genre import Genre
+from app.models.movie import Movie
+
+
+def add_movies(db, count):
+    """Add movies that each bring a new director, genre and actor."""
+    for index in range(count):
+        db.add(
+            Movie(
+                title=f"Extra Movie {index}",
+                release_year=2000,
+                rating=7.0,
+                director=Director(name=f"Extra Director {index}"),
+                genres=[Genre(name=f"Extra Genre {index}")],
+                actors=[Actor(name=f"Extra Actor {index}")],
+            )
+        )
+    db.commit()
+    db.expire_all()
+
+
+def assert_constant_queries(client, db, count_queries, url):
+    before = count_queries(client, url)
+    add_movies(db, 15)
+    after = count_queries(client, url)
+    assert after == before, f"{url} issued {before} then {after} queries"
+    return after
+
+
+# Every catalogue request also reads the catalogue revision for its ETag
+
+
+def test_movie_list_query_count_is_constant(client, db, count_queries):
+    queries = assert_constant_queries(client, db, count_queries, "/api/v1/movies")
+    assert queries <= 4
+
+
+def test_movie_detail_query_count_is_fixed(client, count_queries):
+    assert count_queries(client, "/api/v1/movies/1") <= 4
+
+
+def test_director_list_query_count_is_constant(client, db, count_queries):
+    assert_constant_queries(client, db, count_queries, "/api/v1/directors")
+
+
+def test_actor_detail_query_count_is_fixed(client, count_queries):
+    assert count_queries(client, "/api/v1/actors/1") <= 3
@@ -0,0 +1,120 @@
+import pytest
+from sqlalchemy import delete, update
+
+from app.core.cache import get_cache
+from app.core.config import settings
+from app.db.read_model import card_table, check_movie_cards, refresh_movie_cards
+from app.models.genre import Genre
+from app.models.movie import Movie
+from app.models.movie_list_card import MovieListCard
+
+LIST_URLS = [
+    "/api/v1/movies",
+    "/api/v1/movies?genreId=1&genreId=2",
+    "/api/v1/movies?directorId=1",
+    "/api/v1/movies?q=dark",
+    "/api/v1/movies?limit=5&offset=3",
+]
+
+
+def assert_consistent(db):
+    report = check_movie_cards(db.connection())
+    assert report.ok, report
+    return report
+
+
+def card(db, movie_id):
+    return db.get(MovieListCard, movie_id, populate_existing=True)
+
+
+def test_seeded_cards_are_consistent(client, db):
+    report = assert_consistent(db)
+    assert report.checked == db.query(Movie).count() == 20
+
+
+@pytest.mark.parametrize("url", LIST_URLS)
+def test_cards_match_normalized_listing(client, monkeypatch, url):
+    from_cards = client.get(url).json()
+    monkeypatch.setattr(settings, "MOVIE_LIST_READ_MODEL", False)
+    assert from_cards == client.get(url).json()
+
+
+def test_list_page_reads_one_table(client, query_counter):
+    with query_counter as counter:
+        assert client.get("/api/v1/movies?count=none").status_code == 200
+    page_query = counter.statements[-1]
+    assert "movie_list_cards" in page_query
+    assert "directors" not in page_query and "genres" not in page_query
+
+
+def test_cards_follow_orm_writes(client, db):
+    movie = db.query(Movie).first()
+    movie.title = "Renamed Movie"
+    db.commit()
+    assert card(db, movie.id).payload["title"] == "Renamed Movie"
+    assert card(db, movie.id).title == "Renamed Movie"
+
+    director = movie.director
+    director.name = "Renamed Director"
+    db.commit()
+    for directed in director.movies:
+        assert card(db, directed.id).payload["director"]["name"] == "Renamed Director"
+
+    genre = db.query(Genre).filter(Genre.name == "Drama").one()
+    genre.name = "Melodrama"
+    added = db.query(Genre).filter(Genre.id.not_in([g.id for g in movie.genres])).first()
+    movie.genres.append(added)
+    db.commit()
+    assert added.id in [g["id"] for g in card(db, movie.id).payload["genres"]]
+
+    new_movie = Movie(title="Brand New", release_year=2024, rating=7.0, director=director)
+    new_movie.genres.append(genre)
+    db.add(new_movie)
+    db.commit()
+    assert card(db, new_movie.id).payload["genres"] == [{"id": genre.id, "name": "Melodrama"}]
+
+    new_movie_id = new_movie.id
+    new_movie.genres.clear()
+    db.delete(new_movie)
+    db.commit()
+    assert card(db, new_movie_id) is None
+
+    assert_consistent(db)
+    titles = [m["title"] for m in client.get("/api/v1/movies?q=renamed").json()["items"]]
+    assert titles == ["Renamed Movie"]
+
+
+def test_checker_reports_and_fixes_drift(client, db):
+    connection = db.connection()
+    first, second = db.query(Movie.id).order_by(Movie.id).limit(2).all()
+    connection.execute(
+        update(card_table).where(card_table.c.id == first.id).values(title="Out of date")
+    )
+    connection.execute(delete(card_table).where(card_table.c.id == second.id))
+    connection.execute(
+        card_table.insert().values(
+            id=9999, title="Ghost", release_year=2000, rating=1.0, director_id=1, payload={}
+        )
+    )
+
+    report = check_movie_cards(connection)
+    assert report.stale == [first.id]
+    assert report.missing == [second.id]
+    assert report.orphaned == [9999]
+
+    refresh_movie_cards(connection, report.broken_ids)
+    assert_consistent(db)
+
+
+@pytest.mark.parametrize("bitmap_index", [False, True])
+def test_lists_fall_back_while_cards_are_missing(client, db, monkeypatch, bitmap_index):
+    monkeypatch.setattr(settings, "MOVIE_BITMAP_INDEX", bitmap_index)
+    urls = [*LIST_URLS, "/api/v1/movies/facets", "/api/v1/movies/1/related"]
+    expected = {url: client.get(url).json() for url in urls}
+    assert expected["/api/v1/movies/1/related"]["items"]
+
+    # A catalogue whose read model was never built, as before its first bootstrap
+    db.execute(delete(card_table))
+    db.commit()
+    get_cache().clear()
+    assert {url: client.get(url).json() for url in urls} == expected
@@ -0,0 +1,120 @@
+import sqlite3
+
+import pytest
+
+from app.api.v1.routes import health
+from app.core.cache import get_cache, make_cache_key
+from app.db import session as db_session
+from app.db.replicas import READ_YOUR_WRITES_HEADER, ReplicaSet
+from app.db.session import create_db_engine
+from app.models.genre import Genre
+from app.tests.conftest import engine as primary_engine
+
+
+def make_replica(path, title):
+    """Copy the primary database to ``path`` with movie 1 renamed, and open it read-only."""
+    source = sqlite3.connect(primary_engine.url.database)
+    target = sqlite3.connect(path)
+    source.backup(target)
+    target.execute("UPDATE movies SET title = ? WHERE id = 1", (title,))
+    target.commit()
+    target.close()
+    source.close()
+    return create_db_engine(f"sqlite:///file:{path}?mode=ro&uri=true")
+
+
+def movie_title(client, **headers):
+    get_cache().clear()
+    response = client.get("/api/v1/movies/1", headers=headers)
+    assert response.status_code == 200
+    return response.json()["title"]
+
+
+@pytest.fixture
+def use_replicas(client, monkeypatch):
+    """Install replica engines for the duration of a test."""
+    installed = []
+
+    def install(*engines):
+        replicas = ReplicaSet(engines, retry_after=60)
+        monkeypatch.setattr(db_session, "read_replicas", replicas)
+        monkeypatch.setattr(health, "read_replicas", replicas)
+        installed.extend(engines)
+        return replicas
+
+    yield install
+    for replica in installed:
+        replica.dispose()
+
+
+def test_reads_use_the_primary_without_replicas(client):
+    assert movie_title(client) == "Inception"
+
+
+def test_reads_are_served_by_a_replica(client, use_replicas, tmp_path):
+    use_replicas(make_replica(tmp_path / "replica.db", "From Replica"))
+    assert movie_title(client) == "From Replica"
+    assert client.get("/api/v1/movies?limit=500").json()["items"][0]["id"] == 1
+
+
+def test_replicas_at_different_revisions_keep_the_primary_revision(client, use_replicas, tmp_path):
+    lagging = make_replica(tmp_path / "lagging.db", "Lagging Replica")
+    ahead_path = tmp_path / "ahead.db"
+    make_replica(ahead_path, "Ahead Replica").dispose()
+    with sqlite3.connect(ahead_path) as connection:
+        connection.execute("UPDATE catalogue_revision SET revision = revision + 5")
+    use_replicas(lagging, create_db_engine(f"sqlite:///file:{ahead_path}?mode=ro&uri=true"))
+
+    primary_etag = client.get("/api/v1/genres", headers={READ_YOUR_WRITES_HEADER: "1"}).headers[
+        "etag"
+    ]
+    invalidations = get_cache().stats()["invalidations"]
+    etags = {client.get("/api/v1/genres").headers["etag"] for _ in range(4)}
+    assert etags == {primary_etag}
+    assert get_cache().stats()["invalidations"] == invalidations
+
+
+def test_lagging_replica_bodies_get_no_validators(client, db, use_replicas, tmp_path):
+    use_replicas(make_replica(tmp_path / "replica.db", "From Replica"))
+    db.add(Genre(name="Only On Primary"))
+    db.commit()
+
+    get_cache().clear()
+    stale = client.get("/api/v1/genres")
+    assert "Only On Primary" not in {genre["name"] for genre in stale.json()["items"]}
+    assert "etag" not in stale.headers
+    assert get_cache().get(make_cache_key("genres")) is None
+
+    fresh = client.get("/api/v1/genres", headers={READ_YOUR_WRITES_HEADER: "1"})
+    assert "Only On Primary" in {genre["name"] for genre in fresh.json()["items"]}
+    revalidated = client.get("/api/v1/genres", headers={"If-None-Match": fresh.headers["etag"]})
+    assert revalidated.status_code == 304
+
+
+def test_read_your_writes_pins_to_the_primary(client, use_replicas, tmp_path):
+    use_replicas(make_replica(tmp_path / "replica.db", "From Replica"))
+    assert movie_title(client, **{READ_YOUR_WRITES_HEADER: "1"}) == "Inception"
+    assert movie_title(client, **{READ_YOUR_WRITES_HEADER: "0"}) == "From Replica"
+
+
+def test_replicas_take_turns(client, use_replicas, tmp_path):
+    use_replicas(
+        make_replica(tmp_path / "first.db", "First Replica"),
+        make_replica(tmp_path / "second.db", "Second Replica"),
+    )
+    titles = [movie_title(client) for _ in range(4)]
+    assert sorted(titles[:2]) == ["First Replica", "Second Replica"]
+    assert titles[2:] == titles[:2]
+
+
+def test_failed_replica_is_skipped(client, use_replicas, tmp_path):
+    broken = create_db_engine(f"sqlite:///file:{tmp_path / 'missing.db'}?mode=ro&uri=true")
+    replicas = use_replicas(broken, make_replica(tmp_path / "replica.db", "From Replica"))
+    assert [movie_title(client) for _ in range(3)] == ["From Replica"] * 3
+    assert [replica["healthy"] for replica in replicas.status()] == [False, True]
+    assert client.get("/api/v1/health/replicas").json()["sync"] == replicas.status()
+
+
+def test_primary_serves_reads_when_no_replica_is_healthy(client, use_replicas, tmp_path):
+    use_replicas(create_db_engine(f"sqlite:///file:{tmp_path / 'missing.db'}?mode=ro&uri=true"))
+    assert movie_title(client) == "Inception"
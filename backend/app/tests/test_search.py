@@ -0,0 +1,52 @@
+from sqlalchemy import text
+
+from app.models.movie import Movie
+
+
+def search_titles(client, q, **params):
+    response = client.get("/api/v1/movies", params={"q": q, **params})
+    assert response.status_code == 200
+    return [movie["title"] for movie in response.json()["items"]]
+
+
+def test_search_is_case_insensitive_substring(client):
+    assert search_titles(client, "dark kn") == ["The Dark Knight"]
+    assert search_titles(client, "RESTIG") == ["The Prestige"]
+
+
+def test_search_matches_ilike_semantics(client, db):
+    for q in ["the", "in", "ar", "ion", "Godfather", "zzz"]:
+        expected = {
+            movie.title for movie in db.query(Movie).filter(Movie.title.ilike(f"%{q}%")).all()
+        }
+        assert set(search_titles(client, q)) == expected, q
+
+
+def test_search_index_follows_writes(client, db):
+    movie = db.query(Movie).filter(Movie.title == "Alien").one()
+    movie.title = "Aliens"
+    db.commit()
+    assert search_titles(client, "aliens") == ["Aliens"]
+
+    db.delete(movie)
+    db.commit()
+    assert search_titles(client, "alien") == []
+
+
+def test_search_results_page_with_relevance_cursor(client):
+    expected = search_titles(client, "the")
+    data = client.get("/api/v1/movies", params={"q": "the", "limit": 2}).json()
+    titles = [movie["title"] for movie in data["items"]]
+    while data["next_cursor"]:
+        data = client.get(
+            "/api/v1/movies", params={"q": "the", "limit": 2, "cursor": data["next_cursor"]}
+        ).json()
+        titles.extend(movie["title"] for movie in data["items"])
+    assert titles == expected
+
+
+def test_search_uses_fts_index(db):
+    plan = db.execute(
+        text("EXPLAIN QUERY PLAN SELECT rowid FROM movies_fts WHERE movies_fts MATCH 'dark'")
+    ).all()
+    assert any("VIRTUAL TABLE INDEX" in str(row) for row in plan)
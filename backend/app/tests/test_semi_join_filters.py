@@ -0,0 +1,142 @@
+import random
+
+import pytest
+from sqlalchemy import select
+
+from app.db.ingest import CatalogueIngestor
+from app.models.actor import Actor
+from app.models.associations import movie_actors, movie_genres
+from app.models.genre import Genre
+from app.models.movie import Movie
+from app.services.actor_service import build_actors_statement
+from app.services.movie_service import build_movies_statement
+
+SEED = 20240501
+
+
+@pytest.fixture
+def random_catalogue(db):
+    rng = random.Random(SEED)
+    genres = [f"Genre {n}" for n in range(8)]
+    actors = [f"Actor {n}" for n in range(40)]
+    records = [
+        {
+            "title": f"Movie {n}",
+            "release_year": rng.randint(1990, 1999),
+            "rating": round(rng.uniform(1, 10), 1),
+            "director": f"Director {rng.randrange(10)}",
+            "genres": rng.sample(genres, rng.randint(0, 3)),
+            "actors": rng.sample(actors, rng.randint(0, 5)),
+        }
+        for n in range(300)
+    ]
+    CatalogueIngestor(db.connection(), batch_size=64).ingest(records)
+    db.commit()
+    return rng
+
+
+def legacy_movie_ids(db, genre_id=None, director_id=None, actor_id=None, release_year=None):
+    """The JOIN + DISTINCT query the semi-joins replaced."""
+    stmt = select(Movie.id)
+    if genre_id:
+        stmt = stmt.join(Movie.genres).where(Genre.id == genre_id)
+    if director_id:
+        stmt = stmt.where(Movie.director_id == director_id)
+    if actor_id:
+        stmt = stmt.join(Movie.actors).where(Actor.id == actor_id)
+    if release_year:
+        stmt = stmt.where(Movie.release_year == release_year)
+    return sorted(db.execute(stmt.distinct()).scalars())
+
+
+def movie_ids(db, **filters):
+    stmt, _ = build_movies_statement("sqlite", stmt=select(Movie.id), **filters)
+    ids = list(db.execute(stmt).scalars())
+    # Semi-joins never return a movie twice
+    assert len(ids) == len(set(ids))
+    return sorted(ids)
+
+
+def links(db, table, column):
+    by_movie: dict[int, set[int]] = {}
+    for movie_id, value in db.execute(select(table.c.movie_id, column)):
+        by_movie.setdefault(movie_id, set()).add(value)
+    return by_movie
+
+
+def test_single_value_filters_match_join_distinct(db, random_catalogue):
+    rng = random_catalogue
+    for _ in range(200):
+        filters = {
+            "genre_id": rng.choice([None, rng.randint(1, 8)]),
+            "director_id": rng.choice([None, rng.randint(1, 10)]),
+            "actor_id": rng.choice([None, rng.randint(1, 40)]),
+            "release_year": rng.choice([None, rng.randint(1990, 1999)]),
+        }
+        assert movie_ids(db, **filters) == legacy_movie_ids(db, **filters), filters
+
+
+@pytest.mark.parametrize("match", ["any", "all"])
+def test_multi_value_filters(db, random_catalogue, match):
+    rng = random_catalogue
+    genres_by_movie = links(db, movie_genres, movie_genres.c.genre_id)
+    actors_by_movie = links(db, movie_actors, movie_actors.c.actor_id)
+    all_ids = db.execute(select(Movie.id)).scalars().all()
+
+    def matches(linked: set[int], wanted: list[int]) -> bool:
+        return linked.issuperset(wanted) if match == "all" else bool(linked & set(wanted))
+
+    for _ in range(100):
+        genre_ids = rng.sample(range(1, 9), rng.randint(1, 3))
+        actor_ids = rng.sample(range(1, 41), rng.randint(1, 3))
+        expected = sorted(
+            movie_id
+            for movie_id in all_ids
+            if matches(genres_by_movie.get(movie_id, set()), genre_ids)
+            and matches(actors_by_movie.get(movie_id, set()), actor_ids)
+        )
+        actual = movie_ids(
+            db,
+            genre_id=genre_ids,
+            actor_id=actor_ids,
+            genre_match=match,
+            actor_match=match,
+        )
+        assert actual == expected, (genre_ids, actor_ids)
+
+
+def test_actor_filters_match_join_distinct(db, random_catalogue):
+    for genre_id in range(1, 9):
+        legacy = (
+            select(Actor.id)
+            .join(Actor.movies)
+            .join(Movie.genres)
+            .where(Genre.id == genre_id)
+            .distinct()
+        )
+        stmt = build_actors_statement(genre_id=genre_id, stmt=select(Actor.id))
+        assert sorted(db.execute(stmt).scalars()) == sorted(db.execute(legacy).scalars())
+
+    for movie_id in (1, 50, 300):
+        legacy = select(Actor.id).join(Actor.movies).where(Movie.id == movie_id)
+        stmt = build_actors_statement(movie_id=movie_id, stmt=select(Actor.id))
+        assert sorted(db.execute(stmt).scalars()) == sorted(db.execute(legacy).scalars())
+
+
+def test_filtered_list_needs_no_distinct(client, query_counter):
+    with query_counter as counter:
+        response = client.get("/api/v1/movies?genreId=1&actorId=1")
+    assert response.status_code == 200
+    assert not any("DISTINCT" in statement.upper() for statement in counter.statements)
+
+
+def test_multi_value_genre_filter_api(client):
+    any_ids = {m["id"] for m in client.get("/api/v1/movies?genreId=1&genreId=2").json()["items"]}
+    all_items = client.get("/api/v1/movies?genreId=1&genreId=2&genreMatch=all").json()["items"]
+
+    assert {m["id"] for m in all_items} <= any_ids
+    for movie in all_items:
+        assert {1, 2} <= {genre["id"] for genre in movie["genres"]}
+
+    assert client.get("/api/v1/movies?genreId=1&genreId=0").status_code == 400
+    assert client.get("/api/v1/movies?genreId=1&genreMatch=some").status_code == 422
@@ -0,0 +1,62 @@
+import json
+
+import pytest
+
+from app.api.v1.serialization import encode_page
+from app.core import json as fast_json
+from app.core.config import settings
+from app.core.json import RawJSON
+from app.schemas.actor import ActorListItem
+from app.schemas.common import PaginatedResponse
+from app.schemas.movie import MovieListItem
+
+LIST_URLS = {
+    "/api/v1/movies": MovieListItem,
+    "/api/v1/movies?genreId=1&genreId=2&limit=5": MovieListItem,
+    "/api/v1/movies?q=dark&count=estimate": MovieListItem,
+    "/api/v1/actors": ActorListItem,
+    "/api/v1/actors?genreId=1": ActorListItem,
+}
+
+
+@pytest.mark.parametrize("read_model", [True, False])
+@pytest.mark.parametrize("url", LIST_URLS)
+def test_fast_path_matches_schema_path(client, monkeypatch, url, read_model):
+    monkeypatch.setattr(settings, "MOVIE_LIST_READ_MODEL", read_model)
+    fast = client.get(url)
+    monkeypatch.setattr(settings, "FAST_SERIALIZATION", False)
+    validated = client.get(url)
+
+    assert fast.status_code == validated.status_code == 200
+    assert fast.headers["content-type"] == "application/json"
+    assert fast.json() == validated.json()
+    # The fast body satisfies the documented response schema
+    PaginatedResponse[LIST_URLS[url]].model_validate_json(fast.content)
+
+
+def test_fast_path_keeps_etag(client):
+    response = client.get("/api/v1/movies")
+    assert (
+        client.get(
+            "/api/v1/movies", headers={"If-None-Match": response.headers["etag"]}
+        ).status_code
+        == 304
+    )
+
+
+def test_encode_page_splices_raw_json():
+    items = [RawJSON('{"id": 1, "title": "Caf\\u00e9"}'), {"id": 2, "title": "Ünïcode"}]
+    body = encode_page(items, MovieListItem, total=2, next_cursor="abc")
+    assert json.loads(body) == {
+        "items": [{"id": 1, "title": "Café"}, {"id": 2, "title": "Ünïcode"}],
+        "total": 2,
+        "total_is_estimate": False,
+        "next_cursor": "abc",
+    }
+
+
+def test_dumps_without_orjson(monkeypatch):
+    value = {"title": "Amélie", "rating": 8.3, "genres": [], "cursor": None}
+    expected = fast_json.dumps(value)
+    monkeypatch.setattr(fast_json, "orjson", None)
+    assert fast_json.dumps(value) == expected
@@ -0,0 +1,81 @@
+import pytest
+
+from app.core.config import settings
+from app.services.movie_service import build_movies_statement
+from app.services.pagination import page_statement
+from app.tests.test_indexes import query_plan
+
+MOVIE_SORTS = ["id", "title", "release_year", "rating"]
+
+
+def all_movies(client, query=""):
+    return client.get(f"/api/v1/movies?limit=500{query}").json()["items"]
+
+
+def walk(client, url):
+    """Follow next_cursor from ``url`` and return every movie ID in order."""
+    data = client.get(url).json()
+    ids = [m["id"] for m in data["items"]]
+    while data["next_cursor"]:
+        data = client.get(f"{url}&cursor={data['next_cursor']}").json()
+        ids.extend(m["id"] for m in data["items"])
+    return ids
+
+
+@pytest.mark.parametrize("read_model", [True, False])
+@pytest.mark.parametrize("order", ["asc", "desc"])
+@pytest.mark.parametrize("sort", MOVIE_SORTS)
+def test_movies_are_sorted_with_id_tie_break(client, monkeypatch, sort, order, read_model):
+    monkeypatch.setattr(settings, "MOVIE_LIST_READ_MODEL", read_model)
+    movies = all_movies(client)
+    expected = sorted(movies, key=lambda m: (m[sort], m["id"]), reverse=order == "desc")
+
+    url = f"/api/v1/movies?sort={sort}&order={order}&limit=3&count=none"
+    assert walk(client, url) == [m["id"] for m in expected]
+
+
+@pytest.mark.parametrize("sort", MOVIE_SORTS)
+def test_top_n_path_matches_counted_path(client, sort):
+    for query in ("genreId=1", "genreId=1&genreId=2", "genreId=1&genreId=2&genreMatch=all"):
+        url = f"/api/v1/movies?{query}&sort={sort}&order=desc&limit=4"
+        counted = client.get(url).json()["items"]
+        top = client.get(f"{url}&count=none").json()["items"]
+        assert top == counted
+        assert walk(client, f"{url}&count=none") == walk(client, url)
+
+
+def test_sort_overrides_search_relevance(client):
+    items = client.get("/api/v1/movies?q=the&sort=rating&order=desc").json()["items"]
+    assert len(items) > 1
+    assert [m["rating"] for m in items] == sorted((m["rating"] for m in items), reverse=True)
+
+
+def test_cursor_from_another_sort_is_rejected(client):
+    cursor = client.get("/api/v1/movies?sort=rating&limit=2").json()["next_cursor"]
+    response = client.get(f"/api/v1/movies?sort=rating&order=desc&cursor={cursor}")
+    assert response.status_code == 400
+
+
+def test_invalid_sort_is_rejected(client):
+    assert client.get("/api/v1/movies?sort=director").status_code == 422
+    assert client.get("/api/v1/movies?order=up").status_code == 422
+    assert client.get("/api/v1/actors?sort=rating").status_code == 422
+
+
+@pytest.mark.parametrize("order", ["asc", "desc"])
+def test_actors_are_sorted(client, order):
+    actors = client.get(f"/api/v1/actors?sort=name&order={order}").json()["items"]
+    expected = sorted(actors, key=lambda a: (a["name"], a["id"]), reverse=order == "desc")
+    assert actors == expected
+    by_id = client.get(f"/api/v1/actors?order={order}").json()["items"]
+    assert [a["id"] for a in by_id] == sorted((a["id"] for a in by_id), reverse=order == "desc")
+
+
+@pytest.mark.parametrize("sort", ["title", "rating"])
+def test_top_n_page_is_read_in_index_order(db, sort):
+    stmt, sort_key = build_movies_statement(
+        "sqlite", genre_id=1, sort=sort, order="desc", top_n=True
+    )
+    plan = query_plan(db, page_statement(stmt, sort_key, limit=20))
+    assert f"ix_movie_list_cards_{sort}" in plan
+    assert "TEMP B-TREE" not in plan
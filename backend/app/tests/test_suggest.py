@@ -0,0 +1,111 @@
+import pytest
+
+from app.models.actor import Actor
+from app.models.movie import Movie
+from app.services.suggest_service import (
+    Entry,
+    PrefixIndex,
+    fold,
+    wait_for_suggest_rebuild,
+)
+
+
+def suggest(client, query):
+    response = client.get(f"/api/v1/suggest?{query}")
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def test_fold_ignores_case_and_diacritics():
+    assert fold("  Amélie  Poulain ") == "amelie poulain"
+    assert fold("ÉCOLE") == fold("école") == "ecole"
+
+
+def test_suggests_by_prefix_of_any_word(client):
+    titles = [m["title"] for m in suggest(client, "q=the&limit=20")["movies"]]
+    assert titles == [
+        "The Shawshank Redemption",
+        "The Godfather",
+        "The Dark Knight",
+        "The Matrix",
+        "The Departed",
+        "The Prestige",
+        "The Revenant",
+    ]
+    assert [m["title"] for m in suggest(client, "q=dark")["movies"]] == ["The Dark Knight"]
+    assert [a["name"] for a in suggest(client, "q=STONE")["actors"]] == ["Emma Stone"]
+    assert [d["name"] for d in suggest(client, "q=christopher n")["directors"]] == [
+        "Christopher Nolan"
+    ]
+
+
+def test_suggestions_are_ranked_by_rating(client):
+    movies = suggest(client, "q=i&limit=20")["movies"]
+    assert [m["title"] for m in movies] == ["Inception", "Interstellar", "Inglourious Basterds"]
+    assert movies[0] == {
+        "id": movies[0]["id"],
+        "title": "Inception",
+        "release_year": 2010,
+        "rating": 8.8,
+    }
+    ratings = [m["rating"] for m in suggest(client, "q=t&limit=20")["movies"]]
+    assert ratings == sorted(ratings, reverse=True)
+
+
+def test_limit_applies_per_kind(client):
+    body = suggest(client, "q=s&limit=2")
+    assert len(body["movies"]) == 2
+    assert len(body["actors"]) == 2
+
+
+@pytest.mark.parametrize("query", ["q=", "q=%20%20", "q=zzzz"])
+def test_no_suggestions(client, query):
+    assert suggest(client, query) == {"movies": [], "actors": [], "directors": []}
+
+
+@pytest.mark.parametrize("query", ["q=the&limit=0", "q=the&limit=21"])
+def test_invalid_limit(client, query):
+    assert client.get(f"/api/v1/suggest?{query}").status_code == 400
+
+
+def test_q_is_required(client):
+    assert client.get("/api/v1/suggest").status_code == 422
+
+
+def test_index_follows_catalogue_changes(client, db, count_queries):
+    suggest(client, "q=zo")
+    # Only the revision lookups (ETag and index freshness) once the index exists
+    assert count_queries(client, "/api/v1/suggest?q=zo") == 2
+
+    db.add(Actor(name="Zoë Kravitz"))
+    db.add(Movie(title="Zodiac", release_year=2007, rating=7.7, director_id=1))
+    db.commit()
+    # The previous index answers while the new one is built, without an ETag
+    stale = client.get("/api/v1/suggest?q=ZOE")
+    assert stale.status_code == 200
+    assert "etag" not in stale.headers
+    assert stale.json()["actors"] == []
+    wait_for_suggest_rebuild()
+
+    response = client.get("/api/v1/suggest?q=ZOE")
+    assert "etag" in response.headers
+    assert [a["name"] for a in response.json()["actors"]] == ["Zoë Kravitz"]
+    assert [m["title"] for m in suggest(client, "q=zod")["movies"]] == ["Zodiac"]
+
+
+def test_long_prefixes_rank_their_range():
+    entries = [
+        (1, "Star Trek", 6.0),
+        (2, "Star Wars", 9.0),
+        (3, "Lone Star", 7.0),
+        (4, "Stargate", 8.0),
+    ]
+    index = PrefixIndex([Entry(*entry) for entry in entries], top_k=10)
+    assert [e.name for e in index.search("star", 10)] == [
+        "Star Wars",
+        "Stargate",
+        "Lone Star",
+        "Star Trek",
+    ]
+    assert [e.name for e in index.search("star w", 1)] == ["Star Wars"]
+    assert [e.name for e in index.search("sta", 2)] == ["Star Wars", "Stargate"]
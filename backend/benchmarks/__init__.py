@@ -0,0 +1 @@
+"""Benchmarks run against synthetic catalogues (not part of the test suite)."""
@@ -0,0 +1,281 @@
+"""Endpoint benchmark: latency percentiles, CPU time, queries per request and peak memory.
+
+Drives every catalogue endpoint and filter combination through the full ASGI
+stack (routing, validation, serialization) against a synthetic catalogue and
+writes the results as JSON so runs can be compared.
+
+Usage:
+    python -m benchmarks.endpoints --scale 100k --output results/100k.json
+    python -m benchmarks.endpoints --database bench.db --reuse --case "movies.*"
+    python -m benchmarks.endpoints --reuse --compare results/100k.json
+
+The response cache is disabled unless ``--cache`` is given, so every request
+reaches the database.
+"""
+
+import argparse
+import json
+import platform
+import random
+import re
+import sqlite3
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+from sqlalchemy import Engine, func, select
+from sqlalchemy.orm import sessionmaker
+
+from app.core.cache import NullCache, get_cache, set_cache_backend
+from app.core.config import settings
+from app.db.query_counter import QueryCounter
+from app.db.session import get_db
+from app.main import app
+from app.models.actor import Actor
+from app.models.director import Director
+from app.models.movie import Movie
+from benchmarks.synthetic import add_catalogue_arguments, open_catalogue
+
+
+@dataclass
+class Case:
+    name: str
+    urls: list[str]
+
+
+@dataclass
+class CaseResult:
+    name: str
+    requests: int
+    errors: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    mean_ms: float
+    # Process CPU time (server and client share the process)
+    cpu_ms_per_request: float
+    queries_per_request: float
+    peak_memory_kib: float
+    response_bytes: int
+
+
+def build_cases(engine: Engine, seed: int, sample: int = 50) -> list[Case]:
+    """Endpoints and filter combinations to drive, with IDs sampled from the catalogue."""
+    rng = random.Random(seed)
+    with engine.connect() as connection:
+        movies = connection.execute(select(func.max(Movie.id))).scalar()
+        actors = connection.execute(select(func.max(Actor.id))).scalar()
+        directors = connection.execute(select(func.max(Director.id))).scalar()
+
+    def ids(upper: int) -> list[int]:
+        return [rng.randint(1, upper) for _ in range(sample)]
+
+    movie_ids, actor_ids, director_ids = ids(movies), ids(actors), ids(directors)
+    movies_url = "/api/v1/movies"
+    return [
+        Case("movies", [movies_url]),
+        Case("movies count=none", [f"{movies_url}?count=none"]),
+        Case("movies deep offset", [f"{movies_url}?offset={max(0, movies - 200)}"]),
+        Case("movies genreId", [f"{movies_url}?genreId={g}" for g in range(1, 6)]),
+        Case("movies genreId any", [f"{movies_url}?genreId=1&genreId=2&genreId=3"]),
+        Case("movies genreId all", [f"{movies_url}?genreId=1&genreId=2&genreMatch=all"]),
+        Case("movies directorId", [f"{movies_url}?directorId={d}" for d in director_ids]),
+        Case("movies actorId", [f"{movies_url}?actorId={a}" for a in actor_ids]),
+        Case("movies releaseYear", [f"{movies_url}?releaseYear={y}" for y in (1950, 1990, 2020)]),
+        Case(
+            "movies genreId+releaseYear",
+            [f"{movies_url}?genreId=1&releaseYear={y}" for y in (1990, 2020)],
+        ),
+        Case(
+            "movies directorId+releaseYear",
+            [f"{movies_url}?directorId={d}&releaseYear=2020" for d in director_ids],
+        ),
+        Case("movies sort=title", [f"{movies_url}?sort=title&count=none"]),
+        Case(
+            "movies top 20 rating genreId",
+            [
+                f"{movies_url}?genreId={g}&sort=rating&order=desc&limit=20&count=none"
+                for g in range(1, 6)
+            ],
+        ),
+        Case(
+            "movies releaseYear sort=rating",
+            [f"{movies_url}?releaseYear={y}&sort=rating&order=desc" for y in (1990, 2020)],
+        ),
+        Case("movies q", [f"{movies_url}?q={q}" for q in ("Movie 00012", "00042", "vie 1")]),
+        Case("movies q+genreId", [f"{movies_url}?q=Movie 0001&genreId=1"]),
+        Case("movies facets", [f"{movies_url}/facets"]),
+        Case("movies facets genreId", [f"{movies_url}/facets?genreId={g}" for g in range(1, 6)]),
+        Case("movies facets actorId", [f"{movies_url}/facets?actorId={a}" for a in actor_ids]),
+        Case("movie detail", [f"{movies_url}/{m}" for m in movie_ids]),
+        Case("actors movieId", [f"/api/v1/actors?movieId={m}" for m in movie_ids]),
+        Case("actors genreId", ["/api/v1/actors?genreId=1"]),
+        Case("actors genreId sort=name", ["/api/v1/actors?genreId=1&sort=name"]),
+        Case("actor detail", [f"/api/v1/actors/{a}" for a in actor_ids]),
+        Case("directors", ["/api/v1/directors"]),
+        Case("director detail", [f"/api/v1/directors/{d}" for d in director_ids]),
+        Case("genres", ["/api/v1/genres"]),
+        Case(
+            "export movies genreId+releaseYear",
+            ["/api/v1/export/movies?genreId=1&releaseYear=2020"],
+        ),
+    ]
+
+
+def percentile(samples: list[float], pct: int) -> float:
+    if len(samples) == 1:
+        return samples[0]
+    return statistics.quantiles(samples, n=100, method="inclusive")[pct - 1]
+
+
+def run_case(
+    client: TestClient, engine: Engine, case: Case, requests: int, warmup: int
+) -> CaseResult:
+    urls = [case.urls[i % len(case.urls)] for i in range(requests)]
+    for url in urls[:warmup]:
+        client.get(url)
+
+    latencies, errors, body_bytes = [], 0, 0
+    with QueryCounter(engine) as counter:
+        cpu_started = time.process_time()
+        for url in urls:
+            started = time.perf_counter()
+            response = client.get(url)
+            latencies.append((time.perf_counter() - started) * 1000)
+            errors += response.status_code != 200
+            body_bytes += len(response.content)
+        cpu_seconds = time.process_time() - cpu_started
+
+    # Memory is measured in a separate pass: tracing slows every allocation down
+    peak = 0
+    tracemalloc.start()
+    try:
+        for url in case.urls[: min(len(case.urls), 5)]:
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+            client.get(url)
+            peak = max(peak, tracemalloc.get_traced_memory()[1] - baseline)
+    finally:
+        tracemalloc.stop()
+
+    return CaseResult(
+        name=case.name,
+        requests=requests,
+        errors=errors,
+        p50_ms=round(percentile(latencies, 50), 3),
+        p95_ms=round(percentile(latencies, 95), 3),
+        p99_ms=round(percentile(latencies, 99), 3),
+        mean_ms=round(statistics.fmean(latencies), 3),
+        cpu_ms_per_request=round(cpu_seconds * 1000 / requests, 3),
+        queries_per_request=round(counter.count / requests, 2),
+        peak_memory_kib=round(peak / 1024, 1),
+        response_bytes=body_bytes // requests,
+    )
+
+
+def run_cases(
+    engine: Engine, cases: list[Case], requests: int, warmup: int, cache: bool
+) -> list[CaseResult]:
+    """Serve the app from ``engine`` and run every case, restoring global state afterwards."""
+    session_factory = sessionmaker(bind=engine, autoflush=False)
+
+    def override_get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    previous_backend = get_cache()
+    previous_bootstrap = settings.DB_BOOTSTRAP_ON_STARTUP
+    app.dependency_overrides[get_db] = override_get_db
+    settings.DB_BOOTSTRAP_ON_STARTUP = False
+    if not cache:
+        set_cache_backend(NullCache())
+    try:
+        with TestClient(app) as client:
+            return [run_case(client, engine, case, requests, warmup) for case in cases]
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+        settings.DB_BOOTSTRAP_ON_STARTUP = previous_bootstrap
+        set_cache_backend(previous_backend)
+
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_results(results: list[CaseResult], baseline: dict | None = None) -> None:
+    previous = {row["name"]: row for row in (baseline or {}).get("results", [])}
+    header = f"{'case':32} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'queries':>8} {'peak KiB':>9}"
+    print(header + ("  p95 vs baseline" if previous else ""))
+    for result in results:
+        line = (
+            f"{result.name:32} {result.p50_ms:9.2f} {result.p95_ms:9.2f} {result.p99_ms:9.2f} "
+            f"{result.queries_per_request:8.2f} {result.peak_memory_kib:9.1f}"
+        )
+        if result.errors:
+            line += f"  [{result.errors} errors]"
+        if result.name in previous and previous[result.name]["p95_ms"]:
+            line += f"  {result.p95_ms / previous[result.name]['p95_ms']:.2f}x"
+        print(line)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the catalogue endpoints.")
+    add_catalogue_arguments(parser, default_scale="10k")
+    parser.add_argument("--requests", type=int, default=100, help="Measured requests per case")
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument("--case", type=re.compile, help="Only run cases matching this regex")
+    parser.add_argument("--cache", action="store_true", help="Keep the response cache enabled")
+    parser.add_argument("--output", type=Path, help="Write results to this JSON file")
+    parser.add_argument("--compare", type=Path, help="Baseline JSON to compare p95 against")
+    args = parser.parse_args(argv)
+
+    engine = open_catalogue(args.database, args.scale, args.seed, args.reuse)
+    cases = [
+        case
+        for case in build_cases(engine, args.seed)
+        if not args.case or args.case.search(case.name)
+    ]
+    results = run_cases(engine, cases, args.requests, args.warmup, args.cache)
+
+    baseline = json.loads(args.compare.read_text()) if args.compare else None
+    print_results(results, baseline)
+
+    if args.output:
+        with engine.connect() as connection:
+            movies = connection.execute(select(func.count()).select_from(Movie)).scalar()
+        report = {
+            "meta": {
+                "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+                "git_revision": git_revision(),
+                "movies": movies,
+                "seed": args.seed,
+                "requests_per_case": args.requests,
+                "cache": args.cache,
+                "python": platform.python_version(),
+                "sqlite": sqlite3.sqlite_version,
+                "platform": platform.platform(),
+            },
+            "results": [asdict(result) for result in results],
+        }
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"\nResults written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
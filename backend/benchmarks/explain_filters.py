@@ -0,0 +1,96 @@
+"""Show the query plan and latency of every movie/actor filter combination.
+
+Builds a synthetic catalogue (or reuses one), then for each combination of
+the ``/movies`` filters runs EXPLAIN on the first-page statement the API would
+issue and times it. Plans that fall back to a full table scan are flagged.
+
+Usage:
+    python -m benchmarks.explain_filters --scale 100k
+    python -m benchmarks.explain_filters --database bench.db --reuse
+"""
+
+import argparse
+import itertools
+import statistics
+import sys
+import time
+
+from sqlalchemy import Engine, Select, text
+
+from app.db import bootstrap  # noqa: F401  (imports every model)
+from app.services.actor_service import build_actors_statement
+from app.services.movie_service import build_movies_statement
+from app.services.pagination import page_statement
+from benchmarks.synthetic import add_catalogue_arguments, open_catalogue
+
+# Filter values present in every synthetic catalogue
+MOVIE_FILTERS = {
+    "genre_id": 1,
+    "director_id": 1,
+    "actor_id": 1,
+    "release_year": 2000,
+}
+FULL_SCAN_MARKERS = ("SCAN movies", "SCAN movie_actors", "SCAN movie_genres", "Seq Scan")
+
+
+def explain(engine: Engine, stmt: Select) -> list[str]:
+    """Return the query plan of ``stmt`` as one string per plan node."""
+    sql = str(stmt.compile(dialect=engine.dialect, compile_kwargs={"literal_binds": True}))
+    with engine.connect() as connection:
+        if engine.dialect.name == "sqlite":
+            rows = connection.execute(text(f"EXPLAIN QUERY PLAN {sql}"))
+            return [row.detail for row in rows]
+        return [row[0] for row in connection.execute(text(f"EXPLAIN {sql}"))]
+
+
+def time_statement(engine: Engine, stmt: Select, repeat: int) -> float:
+    """Median wall time of ``stmt`` in milliseconds."""
+    samples = []
+    with engine.connect() as connection:
+        for _ in range(repeat):
+            started = time.perf_counter()
+            connection.execute(stmt).all()
+            samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def movie_statements(engine: Engine):
+    names = list(MOVIE_FILTERS)
+    for size in range(len(names) + 1):
+        for combination in itertools.combinations(names, size):
+            filters = {name: MOVIE_FILTERS[name] for name in combination}
+            stmt, sort_key = build_movies_statement(engine.dialect.name, **filters)
+            label = "movies " + (", ".join(combination) or "(no filter)")
+            yield label, page_statement(stmt, sort_key, limit=100)
+
+
+def actor_statements():
+    yield "actors movie_id", build_actors_statement(movie_id=1)
+    yield "actors genre_id", build_actors_statement(genre_id=1)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    add_catalogue_arguments(parser)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    engine = open_catalogue(args.database, args.scale, args.seed, args.reuse)
+
+    full_scans = 0
+    statements = itertools.chain(movie_statements(engine), actor_statements())
+    for label, stmt in statements:
+        plan = explain(engine, stmt)
+        elapsed = time_statement(engine, stmt, args.repeat)
+        scans = [line for line in plan if line.startswith(FULL_SCAN_MARKERS)]
+        full_scans += bool(scans) and label != "movies (no filter)"
+        print(f"\n{label}: {elapsed:.2f} ms{'  [FULL SCAN]' if scans else ''}")
+        for line in plan:
+            print(f"    {line}")
+
+    print(f"\n{full_scans} filtered statement(s) with a full table scan")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,126 @@
+"""Neighbour scoring benchmark: rebuild cost per movie as the catalogue grows.
+
+Scores every movie of synthetic catalogues of increasing size, the way
+``python -m app.db.neighbours rebuild`` does, from links kept in memory:
+reading links and writing rows grow linearly, the scoring grows with the
+candidates each movie gets from the inverted lists. With the skewed cast of
+the synthetic catalogues, scanning the full lists of prolific actors makes
+the cost per movie grow with the catalogue (quadratic rebuilds); it should
+stay nearly flat.
+
+Reports the CPU time per movie at each scale and how much it grows per
+doubling of the catalogue (1.0 is linear, 2.0 quadratic), and fails when that
+exceeds ``--max-growth``.
+
+Usage:
+    python -m benchmarks.neighbours --scales 1k 10k 20000
+    python -m benchmarks.neighbours --scales 1000 8000 --max-posting 25 --repeat 2
+"""
+
+import argparse
+import gc
+import math
+import sys
+import time
+from dataclasses import dataclass
+
+from app.core.config import settings
+from app.db.neighbours import _Incidence, score_neighbours
+from benchmarks.synthetic import generate_records, parse_scale
+
+
+@dataclass
+class ScaleResult:
+    movies: int
+    cpu_seconds: float
+    neighbours: int
+
+    @property
+    def us_per_movie(self) -> float:
+        return self.cpu_seconds / self.movies * 1e6
+
+
+def build_incidence(movies: int, seed: int = 0) -> _Incidence:
+    """Number the directors, actors and genres of a synthetic catalogue."""
+    ids: dict[tuple[str, str], int] = {}
+
+    def id_of(kind: str, name: str) -> int:
+        return ids.setdefault((kind, name), len(ids) + 1)
+
+    director_of, actors_of, genres_of = {}, {}, {}
+    for movie_id, record in enumerate(generate_records(movies, seed), start=1):
+        director_of[movie_id] = id_of("director", record["director"])
+        actors_of[movie_id] = {id_of("actor", name) for name in record["actors"]}
+        genres_of[movie_id] = {id_of("genre", name) for name in record["genres"]}
+    return _Incidence(director_of, actors_of, genres_of)
+
+
+def measure(
+    movies: int, seed: int = 0, max_posting: int | None = None, repeat: int = 1
+) -> ScaleResult:
+    """Score every movie of a catalogue of ``movies``; keeps the fastest of ``repeat`` runs."""
+    incidence = build_incidence(movies, seed)
+    movie_ids = sorted(incidence.director_of)
+    timings = []
+    # Collections triggered by earlier allocations would land on random runs
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            started = time.process_time()
+            rows = score_neighbours(
+                _Incidence(incidence.director_of, incidence.actors_of, incidence.genres_of),
+                movie_ids,
+                settings.NEIGHBOURS_TOP_K,
+                max_posting,
+            )
+            timings.append(time.process_time() - started)
+    finally:
+        gc.enable()
+    return ScaleResult(movies, min(timings), len(rows))
+
+
+def growth_per_doubling(results: list[ScaleResult]) -> float:
+    """Factor by which the cost per movie grows when the catalogue doubles."""
+    first, last = min(results, key=lambda r: r.movies), max(results, key=lambda r: r.movies)
+    doublings = math.log2(last.movies / first.movies)
+    return (last.us_per_movie / first.us_per_movie) ** (1 / doublings)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Measure how neighbour scoring scales.")
+    parser.add_argument(
+        "--scales",
+        type=parse_scale,
+        nargs="+",
+        default=[5_000, 10_000, 20_000],
+        help="Movie counts to score, at least two",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per scale; keeps the fastest")
+    parser.add_argument(
+        "--max-posting",
+        type=int,
+        default=None,
+        help="Inverted lists scanned in full (default NEIGHBOURS_MAX_POSTING)",
+    )
+    parser.add_argument("--max-growth", type=float, default=1.4, help="Allowed growth per doubling")
+    args = parser.parse_args(argv)
+    if len(set(args.scales)) < 2:
+        parser.error("give at least two different scales")
+
+    results = [
+        measure(movies, args.seed, args.max_posting, args.repeat) for movies in sorted(args.scales)
+    ]
+    print(f"{'movies':>10} {'cpu s':>8} {'us/movie':>9} {'neighbours':>11}")
+    for result in results:
+        print(
+            f"{result.movies:10,} {result.cpu_seconds:8.2f} {result.us_per_movie:9.1f} "
+            f"{result.neighbours:11,}"
+        )
+    growth = growth_per_doubling(results)
+    print(f"Cost per movie grows {growth:.2f}x per doubling (limit {args.max_growth:.2f}x)")
+    return 0 if growth <= args.max_growth else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,75 @@
+"""Serialization benchmark: CPU per request of the list endpoints.
+
+Runs the list endpoint cases twice, once validating every item against its
+response schema (``FAST_SERIALIZATION`` off) and once encoding pages straight
+to JSON bytes, and reports CPU time and latency per request side by side.
+
+Usage:
+    python -m benchmarks.serialization --scale 10k
+    python -m benchmarks.serialization --database bench.db --reuse --requests 200
+"""
+
+import argparse
+import sys
+
+from sqlalchemy import Engine
+
+from app.core.config import settings
+from benchmarks.endpoints import Case, CaseResult, run_cases
+from benchmarks.synthetic import add_catalogue_arguments, open_catalogue
+
+
+def build_cases(limit: int) -> list[Case]:
+    movies_url = f"/api/v1/movies?limit={limit}&count=none"
+    return [
+        Case("movies", [movies_url]),
+        Case("movies genreId", [f"{movies_url}&genreId={g}" for g in range(1, 6)]),
+        Case("movies releaseYear", [f"{movies_url}&releaseYear={y}" for y in (1990, 2020)]),
+        Case("actors genreId", [f"/api/v1/actors?genreId={g}" for g in range(1, 4)]),
+    ]
+
+
+def compare(
+    engine: Engine, cases: list[Case], requests: int, warmup: int
+) -> list[tuple[CaseResult, CaseResult]]:
+    """Run ``cases`` with schema validation and with fast serialization."""
+    previous = settings.FAST_SERIALIZATION
+    try:
+        settings.FAST_SERIALIZATION = False
+        validated = run_cases(engine, cases, requests, warmup, cache=False)
+        settings.FAST_SERIALIZATION = True
+        fast = run_cases(engine, cases, requests, warmup, cache=False)
+    finally:
+        settings.FAST_SERIALIZATION = previous
+    return list(zip(validated, fast, strict=True))
+
+
+def print_comparison(pairs: list[tuple[CaseResult, CaseResult]]) -> None:
+    print(
+        f"{'case':24} {'cpu ms (schema)':>16} {'cpu ms (fast)':>14} {'ratio':>6} "
+        f"{'p50 ms (schema)':>16} {'p50 ms (fast)':>14}"
+    )
+    for validated, fast in pairs:
+        ratio = fast.cpu_ms_per_request / validated.cpu_ms_per_request
+        print(
+            f"{validated.name:24} {validated.cpu_ms_per_request:16.2f} "
+            f"{fast.cpu_ms_per_request:14.2f} {ratio:6.2f} "
+            f"{validated.p50_ms:16.2f} {fast.p50_ms:14.2f}"
+        )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare list serialization paths.")
+    add_catalogue_arguments(parser, default_scale="10k")
+    parser.add_argument("--requests", type=int, default=100, help="Measured requests per case")
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument("--limit", type=int, default=settings.MAX_PAGE_SIZE, help="Page size")
+    args = parser.parse_args(argv)
+
+    engine = open_catalogue(args.database, args.scale, args.seed, args.reuse)
+    print_comparison(compare(engine, build_cases(args.limit), args.requests, args.warmup))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
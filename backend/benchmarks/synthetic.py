@@ -0,0 +1,166 @@
+"""Synthetic catalogue generator for benchmarks.
+
+Records are generated from a seeded RNG, so the same scale and seed always
+produce the same catalogue, and are loaded with the bulk ingestion pipeline.
+Popularity is skewed the way real catalogues are: a few actors, directors and
+genres account for a large share of the links, recent years have more
+releases than early ones, and ratings cluster around the middle of the scale.
+
+Usage:
+    python -m benchmarks.synthetic --scale 100k --database bench-100k.db
+"""
+
+import argparse
+import itertools
+import random
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+
+from sqlalchemy import Engine, create_engine
+
+from app.db.bootstrap import bootstrap_database
+from app.db.ingest import CatalogueIngestor, IngestStats, relaxed_durability
+from app.db.session import configure_engine
+
+# Named scale factors (number of movies)
+SCALES = {"1k": 1_000, "10k": 10_000, "100k": 100_000, "1m": 1_000_000}
+
+# Genre names with their relative frequency
+GENRES = {
+    "Drama": 30,
+    "Comedy": 20,
+    "Thriller": 12,
+    "Action": 12,
+    "Romance": 10,
+    "Crime": 9,
+    "Horror": 8,
+    "Documentary": 7,
+    "Adventure": 6,
+    "Sci-Fi": 5,
+    "Mystery": 5,
+    "Fantasy": 4,
+    "Family": 4,
+    "Animation": 3,
+    "Biography": 3,
+    "History": 2,
+    "Music": 2,
+    "War": 2,
+    "Sport": 1,
+    "Western": 1,
+}
+FIRST_YEAR = 1920
+LAST_YEAR = 2024
+
+# Zipf exponent for actor and director popularity
+POPULARITY_SKEW = 0.8
+
+
+def parse_scale(value: str) -> int:
+    """Accept a named scale ("100k") or a plain movie count ("250000")."""
+    try:
+        return SCALES.get(value.lower()) or int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"unknown scale {value!r}; use one of {', '.join(SCALES)} or a number"
+        ) from None
+
+
+def _cumulative_zipf(size: int) -> list[float]:
+    return list(itertools.accumulate(1 / rank**POPULARITY_SKEW for rank in range(1, size + 1)))
+
+
+def generate_records(movies: int, seed: int = 0) -> Iterator[dict]:
+    """
+    Yield ``movies`` ingestion records.
+
+    The cast and crew pools grow with the movie count: one director per 20
+    movies and one actor per 2 movies. Each movie has 1-3 genres and a cast
+    of 2-12 actors, mostly 3-6.
+    """
+    rng = random.Random(seed)
+    directors = [f"Director {number:07d}" for number in range(max(1, movies // 20))]
+    actors = [f"Actor {number:07d}" for number in range(max(12, movies // 2))]
+    director_weights = _cumulative_zipf(len(directors))
+    actor_weights = _cumulative_zipf(len(actors))
+    genre_names = list(GENRES)
+    genre_weights = list(itertools.accumulate(GENRES.values()))
+    years = list(range(FIRST_YEAR, LAST_YEAR + 1))
+    year_weights = list(itertools.accumulate(range(1, len(years) + 1)))
+
+    for number in range(1, movies + 1):
+        cast_size = min(12, max(2, round(rng.gauss(4.5, 2))))
+        genre_count = rng.choices((1, 2, 3), weights=(3, 4, 2))[0]
+        yield {
+            "title": f"Movie {number:07d}",
+            "release_year": rng.choices(years, cum_weights=year_weights)[0],
+            "rating": round(min(10.0, max(1.0, rng.gauss(6.4, 1.3))), 1),
+            "director": rng.choices(directors, cum_weights=director_weights)[0],
+            # Duplicates are dropped by the ingestor
+            "genres": rng.choices(genre_names, cum_weights=genre_weights, k=genre_count),
+            "actors": rng.choices(actors, cum_weights=actor_weights, k=cast_size),
+        }
+
+
+def load_catalogue(engine: Engine, movies: int, seed: int = 0) -> IngestStats:
+    """Create the schema on ``engine``, load a synthetic catalogue and ANALYZE it."""
+    bootstrap_database(engine, seed=False)
+    with engine.connect() as connection, relaxed_durability(connection):
+        # The neighbour tables are built in one pass once every batch is in
+        ingestor = CatalogueIngestor(connection, defer_neighbours=True)
+        stats = ingestor.ingest(generate_records(movies, seed), commit_batches=True)
+        connection.commit()
+    with engine.begin() as connection:
+        # Give the planner real statistics, as a long-running database would have
+        connection.exec_driver_sql("ANALYZE")
+    return stats
+
+
+def open_catalogue(database: Path, movies: int, seed: int = 0, reuse: bool = False) -> Engine:
+    """
+    Return an engine on a synthetic SQLite catalogue, building it unless reused.
+
+    Args:
+        database: SQLite file to use
+        movies: Number of movies to generate
+        seed: RNG seed
+        reuse: Keep an existing file instead of rebuilding it
+    """
+    if database.exists() and not reuse:
+        database.unlink()
+    engine = create_engine(f"sqlite:///{database}")
+    configure_engine(engine)
+    if reuse:
+        # Bring files built by older revisions up to the current schema
+        bootstrap_database(engine, seed=False)
+    else:
+        stats = load_catalogue(engine, movies, seed)
+        print(
+            f"Loaded {stats.movies} movies, {stats.movie_actor_links} cast links and "
+            f"{stats.movie_genre_links} genre links ({stats.rows_per_second:,.0f} rows/s)"
+        )
+    return engine
+
+
+def add_catalogue_arguments(parser: argparse.ArgumentParser, default_scale: str = "100k") -> None:
+    parser.add_argument(
+        "--scale",
+        type=parse_scale,
+        default=SCALES[default_scale],
+        help=f"Movies to generate: {', '.join(SCALES)} or a number (default {default_scale})",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--database", type=Path, default=Path("benchmark.db"))
+    parser.add_argument("--reuse", action="store_true", help="Keep an existing database")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Generate a synthetic catalogue.")
+    add_catalogue_arguments(parser)
+    args = parser.parse_args(argv)
+    open_catalogue(args.database, args.scale, args.seed, args.reuse)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())